@@ -6,9 +6,11 @@ API REST pour l'interface Electron
 from fastapi import FastAPI, HTTPException, BackgroundTasks, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, validator
 from typing import Dict, Any, List, Optional
 from functools import lru_cache
+import json
 import logging
 import sys
 import os
@@ -18,6 +20,11 @@ from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 
+try:
+    import orjson  # Sérialisation directe des tableaux numpy des sandboxes
+except ImportError:
+    orjson = None
+
 # Ajouter le répertoire parent au path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -106,6 +113,26 @@ def _cached_intent_detect(query: str) -> str:
         return {}
 
 
+def sandbox_response(result: Dict[str, Any]):
+    """
+    Sérialise un résultat de sandbox
+
+    Les sandboxes peuvent renvoyer des tableaux numpy lorsque orjson est
+    disponible: on renvoie alors directement une ORJSONResponse, ce qui
+    évite jsonable_encoder et la conversion élément par élément.
+    """
+    if orjson is not None:
+        return ORJSONResponse(content=result)
+    return result
+
+
+def ndjson_line(item: Dict[str, Any]) -> bytes:
+    """Encode un élément de flux en une ligne NDJSON"""
+    if orjson is not None:
+        return orjson.dumps(item, option=orjson.OPT_SERIALIZE_NUMPY) + b"\n"
+    return (json.dumps(item) + "\n").encode()
+
+
 # Helpers pour validation
 def sanitize_math_expression(expr: str) -> str:
     """Sanitize mathematical expressions to prevent code injection."""
@@ -197,7 +224,7 @@ class PhysicsSimRequest(BaseModel):
 
 
 class CircuitSimRequest(BaseModel):
-    circuit_type: str  # "rc", "rl", "rlc", "divider"
+    circuit_type: str  # "rc", "rl", "rlc", "rc_batch", "rlc_batch", "divider"
     parameters: Dict[str, Any]
 
 
@@ -443,7 +470,7 @@ async def math_plot(request: PlotRequest):
         else:
             raise HTTPException(status_code=400, detail=f"Unknown plot type: {plot_type}")
 
-        return result
+        return sandbox_response(result)
 
     except HTTPException:
         raise
@@ -468,7 +495,7 @@ async def math_animate(request: Dict[str, Any]):
             **request.get('parameters', {})
         )
 
-        return result
+        return sandbox_response(result)
 
     except HTTPException:
         raise
@@ -477,6 +504,41 @@ async def math_animate(request: Dict[str, Any]):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/api/sandbox/math/animate/stream")
+async def math_animate_stream(request: Dict[str, Any]):
+    """
+    Génère une animation en flux NDJSON
+
+    Première ligne: en-tête (axe x partagé, metadata), puis une ligne par
+    frame, envoyée dès qu'elle est calculée.
+    """
+    try:
+        if not math_sandbox:
+            raise HTTPException(status_code=503, detail="Math sandbox not initialized")
+
+        function_template = request.get('function')
+        if not function_template:
+            raise HTTPException(status_code=400, detail="Function template required")
+
+        frames = math_sandbox.stream_animation(
+            function_template,
+            **request.get('parameters', {})
+        )
+
+        # Générateur synchrone: Starlette l'itère dans son threadpool,
+        # le calcul des frames ne bloque donc pas la boucle asyncio
+        return StreamingResponse(
+            (ndjson_line(frame) for frame in frames),
+            media_type="application/x-ndjson",
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error in math animation stream: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 # ============================================================================
 # Physics Sandbox
 # ============================================================================
@@ -505,7 +567,7 @@ async def physics_simulate(request: PhysicsSimRequest):
         else:
             raise HTTPException(status_code=400, detail=f"Unknown simulation type: {sim_type}")
 
-        return result
+        return sandbox_response(result)
 
     except HTTPException:
         raise
@@ -523,7 +585,7 @@ async def electronics_simulate(request: CircuitSimRequest):
     """
     Simule un circuit électronique
 
-    Types: "rc", "rl", "rlc", "divider", "frequency_response"
+    Types: "rc", "rl", "rlc", "rc_batch", "rlc_batch", "divider", "frequency_response"
     """
     try:
         if not electronics_sandbox:
@@ -533,10 +595,14 @@ async def electronics_simulate(request: CircuitSimRequest):
 
         if circuit_type == "rc":
             result = electronics_sandbox.simulate_rc_circuit(**request.parameters)
+        elif circuit_type == "rc_batch":
+            result = electronics_sandbox.simulate_rc_circuit_batch(**request.parameters)
         elif circuit_type == "rl":
             result = electronics_sandbox.simulate_rl_circuit(**request.parameters)
         elif circuit_type == "rlc":
             result = electronics_sandbox.simulate_rlc_circuit(**request.parameters)
+        elif circuit_type == "rlc_batch":
+            result = electronics_sandbox.simulate_rlc_circuit_batch(**request.parameters)
         elif circuit_type == "divider":
             result = electronics_sandbox.analyze_voltage_divider(**request.parameters)
         elif circuit_type == "frequency_response":
@@ -588,7 +654,7 @@ async def sandbox_execute(request: SandboxRequest):
         else:
             raise HTTPException(status_code=400, detail=f"Unknown sandbox type: {sandbox_type}")
 
-        return result
+        return sandbox_response(result)
 
     except HTTPException:
         raise
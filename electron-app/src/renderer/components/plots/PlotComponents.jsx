@@ -14,6 +14,15 @@ import {
   PLOT_COLORS,
 } from '../../utils/plotConfig';
 
+/**
+ * Decode a base64 float32 grid (z_buf, u_buf, v_buf) into rows for Plotly
+ */
+const decodeFloat32Grid = (b64, [rows, cols]) => {
+  const bytes = Uint8Array.from(atob(b64), (c) => c.charCodeAt(0));
+  const values = new Float32Array(bytes.buffer);
+  return Array.from({ length: rows }, (_, i) => values.subarray(i * cols, (i + 1) * cols));
+};
+
 /**
  * 2D Function Plot Component
  */
@@ -94,7 +103,7 @@ export const Plot3D = memo(({ data, plotRef }) => {
     {
       x: data.data.x,
       y: data.data.y,
-      z: data.data.z,
+      z: decodeFloat32Grid(data.data.z_buf, data.data.shape),
       type: 'surface',
       colorscale: 'Viridis',
       name: data.data.function,
@@ -202,14 +211,15 @@ export const PlotAnimation = memo(({ data, plotRef }) => {
 
   const plotData = useMemo(() => [
     {
-      x: currentFrame.x,
+      // x is shared at the top level when every frame is finite
+      x: currentFrame.x ?? data.data.x,
       y: currentFrame.y,
       type: 'scatter',
       mode: 'lines',
       line: { color: PLOT_COLORS.primary, width: 2 },
       name: `${data.data.parameter_name} = ${currentFrame.parameter_value.toFixed(2)}`,
     },
-  ], [currentFrame, data.data.parameter_name]);
+  ], [currentFrame, data.data.x, data.data.parameter_name]);
 
   return (
     <div>
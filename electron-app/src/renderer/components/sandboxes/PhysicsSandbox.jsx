@@ -216,7 +216,7 @@ function ProjectileSimulation({ data }) {
             data={[
               {
                 x: data.data.time,
-                y: data.data.energy.map(e => e.kinetic),
+                y: data.data.energy.kinetic,
                 type: 'scatter',
                 mode: 'lines',
                 name: 'Cinétique',
@@ -224,7 +224,7 @@ function ProjectileSimulation({ data }) {
               },
               {
                 x: data.data.time,
-                y: data.data.energy.map(e => e.potential),
+                y: data.data.energy.potential,
                 type: 'scatter',
                 mode: 'lines',
                 name: 'Potentielle',
@@ -232,7 +232,7 @@ function ProjectileSimulation({ data }) {
               },
               {
                 x: data.data.time,
-                y: data.data.energy.map(e => e.total),
+                y: data.data.energy.total,
                 type: 'scatter',
                 mode: 'lines',
                 name: 'Totale',
@@ -402,7 +402,7 @@ function CollisionSimulation({ data }) {
   const [isPlaying, setIsPlaying] = useState(false);
 
   useEffect(() => {
-    if (!canvasRef.current || !data.data?.frames) return;
+    if (!canvasRef.current || !data.data?.x) return;
 
     const Engine = Matter.Engine;
     const Render = Matter.Render;
@@ -430,10 +430,9 @@ function CollisionSimulation({ data }) {
     const leftWall = Bodies.rectangle(5, 200, 10, 400, { isStatic: true });
     const rightWall = Bodies.rectangle(795, 200, 10, 400, { isStatic: true });
 
-    // Create balls from first frame
-    const firstFrame = data.data.frames[0];
-    const balls = firstFrame.objects.map(obj =>
-      Bodies.circle(obj.x * 80, 200 - obj.y * 40, obj.radius * 80, {
+    // Create balls from first frame (columnar data: x[frame][object])
+    const balls = data.data.x[0].map((x, i) =>
+      Bodies.circle(x * 80, 200 - data.data.y[0][i] * 40, data.data.radius[i] * 80, {
         restitution: 0.9,
         render: { fillStyle: '#3b82f6' },
       })
@@ -479,18 +478,19 @@ function WaveSimulation({ data }) {
   const [isPlaying, setIsPlaying] = useState(false);
 
   useEffect(() => {
-    if (!isPlaying || !data.data?.frames) return;
+    if (!isPlaying || !data.data?.time) return;
 
     const interval = setInterval(() => {
-      setFrameIndex(prev => (prev + 1) % data.data.frames.length);
+      setFrameIndex(prev => (prev + 1) % data.data.time.length);
     }, 50);
 
     return () => clearInterval(interval);
-  }, [isPlaying, data.data?.frames]);
+  }, [isPlaying, data.data?.time]);
 
-  if (!data.data?.frames) return null;
+  if (!data.data?.time) return null;
 
-  const currentFrame = data.data.frames[frameIndex];
+  // Columnar data: y[frame] shares the x axis
+  const frameTime = data.data.time[frameIndex];
 
   return (
     <div className="space-y-4">
@@ -506,8 +506,8 @@ function WaveSimulation({ data }) {
         </div>
         <Plot
           data={[{
-            x: currentFrame.x,
-            y: currentFrame.y,
+            x: data.data.x,
+            y: data.data.y[frameIndex],
             type: 'scatter',
             mode: 'lines',
             line: { color: '#3b82f6', width: 3 },
@@ -527,13 +527,13 @@ function WaveSimulation({ data }) {
           <input
             type="range"
             min="0"
-            max={data.data.frames.length - 1}
+            max={data.data.time.length - 1}
             value={frameIndex}
             onChange={(e) => setFrameIndex(parseInt(e.target.value))}
             className="flex-1"
           />
           <span className="text-sm text-gray-400">
-            t = {currentFrame.time.toFixed(2)} s
+            t = {frameTime.toFixed(2)} s
           </span>
         </div>
       </div>
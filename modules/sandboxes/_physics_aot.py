@@ -0,0 +1,28 @@
+"""
+Compilation AOT (numba.pycc) des noyaux du sandbox physique
+
+Usage (à l'installation, numba et un compilateur C requis):
+    python -m modules.sandboxes._physics_aot
+
+Produit l'extension `physics_aot` à côté de ce fichier; physics_sandbox
+l'utilise si elle est présente, sinon repli sur le JIT numba.
+"""
+
+import os
+
+from numba.pycc import CC
+
+from .physics_sandbox import _PENDULUM_INTO_SIGNATURE, _pendulum_rk4_into
+
+cc = CC("physics_aot")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+# Le noyau RK4 lui-même (fonction Python d'origine, pas le dispatcher JIT):
+# il écrit dans les tableaux fournis, sans allocation ni copie
+cc.export("pendulum_rk4_into", _PENDULUM_INTO_SIGNATURE)(
+    getattr(_pendulum_rk4_into, "py_func", _pendulum_rk4_into)
+)
+
+
+if __name__ == "__main__":
+    cc.compile()
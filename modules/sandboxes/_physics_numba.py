@@ -0,0 +1,102 @@
+"""
+Noyaux numba du sandbox physique
+Boucle de simulation des collisions compilée (importé seulement si numba est installé)
+"""
+
+import math
+
+from numba import njit
+
+
+@njit(cache=True, fastmath=True)
+def _resolve_pair(x, y, vx, vy, mass, radius, restitution, is_static, i, j):
+    """Résout la collision entre i et j (mêmes règles que PhysicsSandbox._resolve_collision)"""
+    inv_m1 = 0.0 if is_static[i] else 1.0 / mass[i]
+    inv_m2 = 0.0 if is_static[j] else 1.0 / mass[j]
+    inv_sum = inv_m1 + inv_m2
+    if inv_sum == 0.0:
+        return
+
+    dx = x[j] - x[i]
+    dy = y[j] - y[i]
+    distance = math.sqrt(dx * dx + dy * dy)
+    if distance == 0:
+        return
+
+    nx = dx / distance
+    ny = dy / distance
+    dvn = (vx[j] - vx[i]) * nx + (vy[j] - vy[i]) * ny
+    if dvn >= 0:
+        return
+
+    e = (restitution[i] + restitution[j]) / 2
+
+    impulse = -(1 + e) * dvn / inv_sum
+    vx[i] -= impulse * nx * inv_m1
+    vy[i] -= impulse * ny * inv_m1
+    vx[j] += impulse * nx * inv_m2
+    vy[j] += impulse * ny * inv_m2
+
+    overlap = (radius[i] + radius[j]) - distance
+    if overlap > 0:
+        share1 = overlap * inv_m1 / inv_sum
+        share2 = overlap * inv_m2 / inv_sum
+        x[i] -= nx * share1
+        y[i] -= ny * share1
+        x[j] += nx * share2
+        y[j] += ny * share2
+
+
+# Une signature par précision de stockage (SimulationConfig.precision)
+_COLLISION_SIGNATURES = [
+    "void({t}[:], {t}[:], {t}[:], {t}[:], {t}[:], {t}[:], {t}[:], b1[:], b1[:], "
+    "f8, f8, i8, f8, {t}[:, :], {t}[:, :], {t}[:, :], {t}[:, :])".format(t=t)
+    for t in ("f4", "f8")
+]
+
+
+@njit(_COLLISION_SIGNATURES, cache=True, fastmath=True)
+def simulate_collisions(x, y, vx, vy, mass, radius, restitution, is_static, is_circle,
+                        g, dt, n_steps, world_w, frames_x, frames_y, frames_vx, frames_vy):
+    """
+    Simule n_steps pas de collisions, en place
+
+    Les tableaux d'état (x, y, vx, vy) sont modifiés en place; l'état de
+    chaque pas (après intégration et rebonds, avant résolution des contacts)
+    est écrit dans les lignes de frames_* de forme (n_steps, n_obj).
+    """
+    n_obj = x.shape[0]
+    for step in range(n_steps):
+        for i in range(n_obj):
+            if not is_static[i]:
+                # Gravité et intégration
+                vy[i] -= g * dt
+                x[i] += vx[i] * dt
+                y[i] += vy[i] * dt
+
+                # Collision avec le sol
+                if y[i] - radius[i] <= 0:
+                    y[i] = radius[i]
+                    vy[i] = -vy[i] * restitution[i]
+
+                # Collision avec les murs
+                if x[i] - radius[i] <= 0 or x[i] + radius[i] >= world_w:
+                    vx[i] = -vx[i] * restitution[i]
+
+            frames_x[step, i] = x[i]
+            frames_y[step, i] = y[i]
+            frames_vx[step, i] = vx[i]
+            frames_vy[step, i] = vy[i]
+
+        # Contacts entre cercles (test sur le carré des distances)
+        for i in range(n_obj):
+            if not is_circle[i]:
+                continue
+            for j in range(i + 1, n_obj):
+                if not is_circle[j]:
+                    continue
+                dx = x[j] - x[i]
+                dy = y[j] - y[i]
+                r = radius[i] + radius[j]
+                if dx * dx + dy * dy < r * r:
+                    _resolve_pair(x, y, vx, vy, mass, radius, restitution, is_static, i, j)
@@ -66,62 +66,139 @@ class ElectronicsSandbox:
             duration: Durée de simulation (s), par défaut 5*RC
             circuit_type: "charging" ou "discharging"
         """
-        try:
-            # Constante de temps
-            tau = resistance * capacitance
-
-            if duration is None:
-                duration = 5 * tau
-
-            # Générer les points temporels
-            num_points = 500
-            times = np.linspace(0, duration, num_points)
-
-            if circuit_type == "charging":
-                # Charge: V_C(t) = V_0 * (1 - e^(-t/RC))
-                v_capacitor = voltage * (1 - np.exp(-times / tau))
-                i_circuit = (voltage / resistance) * np.exp(-times / tau)
-            else:  # discharging
-                # Décharge: V_C(t) = V_0 * e^(-t/RC)
-                v_capacitor = voltage * np.exp(-times / tau)
-                i_circuit = -(voltage / resistance) * np.exp(-times / tau)
-
-            # Énergie stockée dans le condensateur
-            energy = 0.5 * capacitance * v_capacitor**2
-
-            # Puissance dissipée dans la résistance
-            power = i_circuit**2 * resistance
-
-            return {
-                "success": True,
-                "type": "rc_circuit",
-                "data": {
-                    "time": times.tolist(),
-                    "voltage_capacitor": v_capacitor.tolist(),
-                    "current": i_circuit.tolist(),
-                    "energy": energy.tolist(),
-                    "power": power.tolist(),
-                },
-                "parameters": {
-                    "resistance": resistance,
-                    "capacitance": capacitance,
-                    "voltage": voltage,
-                    "tau": tau,
-                    "circuit_type": circuit_type,
-                },
-                "analysis": {
-                    "time_constant": tau,
-                    "time_to_63_percent": tau,
-                    "time_to_95_percent": 3 * tau,
-                    "time_to_99_percent": 5 * tau,
-                    "max_current": abs(voltage / resistance),
-                    "final_voltage": voltage if circuit_type == "charging" else 0,
-                },
-            }
+        if resistance <= 0 or capacitance <= 0:
+            return {"success": False, "error": "Resistance and capacitance must be positive"}
+
+        # Constante de temps
+        tau = resistance * capacitance
+
+        if duration is None:
+            duration = 5 * tau
+
+        # Générer les points temporels
+        num_points = 500
+        times = np.linspace(0, duration, num_points)
+
+        if circuit_type == "charging":
+            # Charge: V_C(t) = V_0 * (1 - e^(-t/RC))
+            v_capacitor = voltage * (1 - np.exp(-times / tau))
+            i_circuit = (voltage / resistance) * np.exp(-times / tau)
+        else:  # discharging
+            # Décharge: V_C(t) = V_0 * e^(-t/RC)
+            v_capacitor = voltage * np.exp(-times / tau)
+            i_circuit = -(voltage / resistance) * np.exp(-times / tau)
+
+        # Énergie stockée dans le condensateur
+        energy = 0.5 * capacitance * v_capacitor**2
+
+        # Puissance dissipée dans la résistance
+        power = i_circuit**2 * resistance
+
+        return {
+            "success": True,
+            "type": "rc_circuit",
+            "data": {
+                "time": times.tolist(),
+                "voltage_capacitor": v_capacitor.tolist(),
+                "current": i_circuit.tolist(),
+                "energy": energy.tolist(),
+                "power": power.tolist(),
+            },
+            "parameters": {
+                "resistance": resistance,
+                "capacitance": capacitance,
+                "voltage": voltage,
+                "tau": tau,
+                "circuit_type": circuit_type,
+            },
+            "analysis": {
+                "time_constant": tau,
+                "time_to_63_percent": tau,
+                "time_to_95_percent": 3 * tau,
+                "time_to_99_percent": 5 * tau,
+                "max_current": abs(voltage / resistance),
+                "final_voltage": voltage if circuit_type == "charging" else 0,
+            },
+        }
+
+    def simulate_rc_circuit_batch(self,
+                                  resistance,
+                                  capacitance,
+                                  voltage: float = 5.0,
+                                  duration: float = None,
+                                  circuit_type: str = "charging",
+                                  num_points: int = 500,
+                                  **kwargs) -> Dict[str, Any]:
+        """
+        Simule un lot de circuits RC en une seule passe vectorisée
 
-        except Exception as e:
-            logger.error(f"Error in RC circuit simulation: {e}")
-            return {"success": False, "error": str(e)}
+        Chaque ligne des tableaux retournés correspond à un couple (R, C).
+        Les paramètres sont diffusés (broadcast) l'un contre l'autre.
+
+        Args:
+            resistance: Résistances en Ohms (scalaire ou tableau [B])
+            capacitance: Capacités en Farads (scalaire ou tableau [B])
+            voltage: Tension d'alimentation (V)
+            duration: Durée commune (s), par défaut 5*RC pour chaque circuit
+            circuit_type: "charging" ou "discharging"
+            num_points: Nombre de points temporels par circuit
+        """
+        resistance, capacitance = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(resistance, dtype=np.float64)),
+            np.atleast_1d(np.asarray(capacitance, dtype=np.float64)),
+        )
+        if np.any(resistance <= 0) or np.any(capacitance <= 0):
+            return {"success": False, "error": "Resistance and capacitance must be positive"}
+
+        # Constantes de temps, shape [B]
+        tau = resistance * capacitance
+
+        if duration is None:
+            duration = 5 * tau
+
+        # Axe temporel [B, N] (vue diffusée si la durée est commune)
+        times = np.linspace(0, np.reshape(duration, (-1, 1)), num_points, axis=1)
+        times = np.broadcast_to(times.reshape(-1, num_points), (tau.shape[0], num_points))
+
+        decay = np.exp(-times / tau[:, None])
+        i_max = (voltage / resistance)[:, None]
+
+        if circuit_type == "charging":
+            v_capacitor = voltage * (1 - decay)
+            i_circuit = i_max * decay
+        else:  # discharging
+            v_capacitor = voltage * decay
+            i_circuit = -i_max * decay
+
+        energy = 0.5 * capacitance[:, None] * v_capacitor**2
+        power = i_circuit**2 * resistance[:, None]
+
+        return {
+            "success": True,
+            "type": "rc_circuit_batch",
+            "data": {
+                "time": times.tolist(),
+                "voltage_capacitor": v_capacitor.tolist(),
+                "current": i_circuit.tolist(),
+                "energy": energy.tolist(),
+                "power": power.tolist(),
+            },
+            "parameters": {
+                "resistance": resistance.tolist(),
+                "capacitance": capacitance.tolist(),
+                "voltage": voltage,
+                "tau": tau.tolist(),
+                "circuit_type": circuit_type,
+            },
+            "analysis": {
+                "time_constant": tau.tolist(),
+                "time_to_63_percent": tau.tolist(),
+                "time_to_95_percent": (3 * tau).tolist(),
+                "time_to_99_percent": (5 * tau).tolist(),
+                "max_current": np.abs(voltage / resistance).tolist(),
+                "final_voltage": voltage if circuit_type == "charging" else 0,
+            },
+        }
 
     def simulate_rl_circuit(self,
                            resistance: float,
@@ -138,58 +215,56 @@ class ElectronicsSandbox:
             voltage: Tension d'alimentation (V)
             duration: Durée de simulation (s)
         """
-        try:
-            # Constante de temps
-            tau = inductance / resistance
-
-            if duration is None:
-                duration = 5 * tau
-
-            num_points = 500
-            times = np.linspace(0, duration, num_points)
-
-            # Courant: I(t) = (V/R) * (1 - e^(-Rt/L))
-            i_circuit = (voltage / resistance) * (1 - np.exp(-times / tau))
-
-            # Tension aux bornes de l'inductance: V_L = L * dI/dt
-            v_inductor = voltage * np.exp(-times / tau)
-
-            # Tension aux bornes de la résistance
-            v_resistor = i_circuit * resistance
-
-            # Énergie stockée dans l'inductance
-            energy = 0.5 * inductance * i_circuit**2
-
-            # Puissance dissipée
-            power = i_circuit**2 * resistance
-
-            return {
-                "success": True,
-                "type": "rl_circuit",
-                "data": {
-                    "time": times.tolist(),
-                    "current": i_circuit.tolist(),
-                    "voltage_inductor": v_inductor.tolist(),
-                    "voltage_resistor": v_resistor.tolist(),
-                    "energy": energy.tolist(),
-                    "power": power.tolist(),
-                },
-                "parameters": {
-                    "resistance": resistance,
-                    "inductance": inductance,
-                    "voltage": voltage,
-                    "tau": tau,
-                },
-                "analysis": {
-                    "time_constant": tau,
-                    "final_current": voltage / resistance,
-                    "initial_di_dt": voltage / inductance,
-                },
-            }
-
-        except Exception as e:
-            logger.error(f"Error in RL circuit simulation: {e}")
-            return {"success": False, "error": str(e)}
+        if resistance <= 0 or inductance <= 0:
+            return {"success": False, "error": "Resistance and inductance must be positive"}
+
+        # Constante de temps
+        tau = inductance / resistance
+
+        if duration is None:
+            duration = 5 * tau
+
+        num_points = 500
+        times = np.linspace(0, duration, num_points)
+
+        # Courant: I(t) = (V/R) * (1 - e^(-Rt/L))
+        i_circuit = (voltage / resistance) * (1 - np.exp(-times / tau))
+
+        # Tension aux bornes de l'inductance: V_L = L * dI/dt
+        v_inductor = voltage * np.exp(-times / tau)
+
+        # Tension aux bornes de la résistance
+        v_resistor = i_circuit * resistance
+
+        # Énergie stockée dans l'inductance
+        energy = 0.5 * inductance * i_circuit**2
+
+        # Puissance dissipée
+        power = i_circuit**2 * resistance
+
+        return {
+            "success": True,
+            "type": "rl_circuit",
+            "data": {
+                "time": times.tolist(),
+                "current": i_circuit.tolist(),
+                "voltage_inductor": v_inductor.tolist(),
+                "voltage_resistor": v_resistor.tolist(),
+                "energy": energy.tolist(),
+                "power": power.tolist(),
+            },
+            "parameters": {
+                "resistance": resistance,
+                "inductance": inductance,
+                "voltage": voltage,
+                "tau": tau,
+            },
+            "analysis": {
+                "time_constant": tau,
+                "final_current": voltage / resistance,
+                "initial_di_dt": voltage / inductance,
+            },
+        }
 
     def simulate_rlc_circuit(self,
                             resistance: float,
@@ -208,98 +283,216 @@ class ElectronicsSandbox:
             voltage: Tension d'alimentation (V)
             duration: Durée de simulation (s)
         """
-        try:
-            # Paramètres du circuit
-            omega_0 = 1 / np.sqrt(inductance * capacitance)  # Fréquence naturelle
-            zeta = (resistance / 2) * np.sqrt(capacitance / inductance)  # Coefficient d'amortissement
-
-            # Déterminer le régime
-            if zeta < 1:
-                regime = "sous-amorti"
-                omega_d = omega_0 * np.sqrt(1 - zeta**2)
-            elif zeta == 1:
-                regime = "critique"
-                omega_d = 0
-            else:
-                regime = "sur-amorti"
-                omega_d = 0
-
-            if duration is None:
-                duration = 10 / omega_0 if omega_0 > 0 else 1.0
-
-            num_points = 1000
-            times = np.linspace(0, duration, num_points)
-
-            # Résolution de l'équation différentielle
-            # d²q/dt² + (R/L)dq/dt + (1/LC)q = V/L
-            # Avec conditions initiales: q(0) = 0, i(0) = 0
-
-            if regime == "sous-amorti":
-                # Oscillations amorties
-                charge = (capacitance * voltage) * (1 - np.exp(-zeta * omega_0 * times) *
-                        (np.cos(omega_d * times) + (zeta * omega_0 / omega_d) * np.sin(omega_d * times)))
-                current = np.gradient(charge, times)
-
-            elif regime == "critique":
-                # Amortissement critique
-                charge = (capacitance * voltage) * (1 - np.exp(-omega_0 * times) * (1 + omega_0 * times))
-                current = (voltage / resistance) * omega_0 * times * np.exp(-omega_0 * times)
-
-            else:  # sur-amorti
-                alpha = zeta * omega_0
-                beta = omega_0 * np.sqrt(zeta**2 - 1)
-                s1 = -alpha + beta
-                s2 = -alpha - beta
-
-                A = voltage / (inductance * (s1 - s2))
-                charge = (capacitance * voltage) * (1 + A * (s2 * np.exp(s1 * times) - s1 * np.exp(s2 * times)))
-                current = A * (np.exp(s1 * times) - np.exp(s2 * times))
-
-            # Tensions
-            v_capacitor = charge / capacitance
-            v_resistor = current * resistance
-            v_inductor = voltage - v_capacitor - v_resistor
-
-            # Énergie
-            energy_capacitor = 0.5 * capacitance * v_capacitor**2
-            energy_inductor = 0.5 * inductance * current**2
-            energy_total = energy_capacitor + energy_inductor
-
-            return {
-                "success": True,
-                "type": "rlc_circuit",
-                "data": {
-                    "time": times.tolist(),
-                    "current": current.tolist(),
-                    "charge": charge.tolist(),
-                    "voltage_capacitor": v_capacitor.tolist(),
-                    "voltage_resistor": v_resistor.tolist(),
-                    "voltage_inductor": v_inductor.tolist(),
-                    "energy_capacitor": energy_capacitor.tolist(),
-                    "energy_inductor": energy_inductor.tolist(),
-                    "energy_total": energy_total.tolist(),
-                },
-                "parameters": {
-                    "resistance": resistance,
-                    "inductance": inductance,
-                    "capacitance": capacitance,
-                    "voltage": voltage,
-                    "omega_0": omega_0,
-                    "zeta": zeta,
-                    "regime": regime,
-                },
-                "analysis": {
-                    "natural_frequency": omega_0,
-                    "damping_ratio": zeta,
-                    "regime": regime,
-                    "resonant_frequency": omega_0 / (2 * np.pi),
-                    "quality_factor": 1 / (2 * zeta) if zeta > 0 else float('inf'),
-                },
-            }
+        if inductance <= 0 or capacitance <= 0 or resistance < 0:
+            return {"success": False, "error": "Inductance and capacitance must be positive, resistance non-negative"}
+
+        # Paramètres du circuit
+        omega_0 = 1 / np.sqrt(inductance * capacitance)  # Fréquence naturelle
+        zeta = (resistance / 2) * np.sqrt(capacitance / inductance)  # Coefficient d'amortissement
+
+        # Déterminer le régime
+        if zeta < 1:
+            regime = "sous-amorti"
+            omega_d = omega_0 * np.sqrt(1 - zeta**2)
+        elif zeta == 1:
+            regime = "critique"
+            omega_d = 0
+        else:
+            regime = "sur-amorti"
+            omega_d = 0
+
+        if duration is None:
+            duration = 10 / omega_0 if omega_0 > 0 else 1.0
+
+        num_points = 1000
+        times = np.linspace(0, duration, num_points)
+
+        # Résolution de l'équation différentielle
+        # d²q/dt² + (R/L)dq/dt + (1/LC)q = V/L
+        # Avec conditions initiales: q(0) = 0, i(0) = 0
+
+        if regime == "sous-amorti":
+            # Oscillations amorties
+            charge = (capacitance * voltage) * (1 - np.exp(-zeta * omega_0 * times) *
+                    (np.cos(omega_d * times) + (zeta * omega_0 / omega_d) * np.sin(omega_d * times)))
+            current = np.gradient(charge, times)
+
+        elif regime == "critique":
+            # Amortissement critique
+            charge = (capacitance * voltage) * (1 - np.exp(-omega_0 * times) * (1 + omega_0 * times))
+            current = (voltage / resistance) * omega_0 * times * np.exp(-omega_0 * times)
+
+        else:  # sur-amorti
+            alpha = zeta * omega_0
+            beta = omega_0 * np.sqrt(zeta**2 - 1)
+            s1 = -alpha + beta
+            s2 = -alpha - beta
+
+            A = voltage / (inductance * (s1 - s2))
+            charge = (capacitance * voltage) * (1 + A * (s2 * np.exp(s1 * times) - s1 * np.exp(s2 * times)))
+            current = A * (np.exp(s1 * times) - np.exp(s2 * times))
+
+        # Tensions
+        v_capacitor = charge / capacitance
+        v_resistor = current * resistance
+        v_inductor = voltage - v_capacitor - v_resistor
+
+        # Énergie
+        energy_capacitor = 0.5 * capacitance * v_capacitor**2
+        energy_inductor = 0.5 * inductance * current**2
+        energy_total = energy_capacitor + energy_inductor
+
+        return {
+            "success": True,
+            "type": "rlc_circuit",
+            "data": {
+                "time": times.tolist(),
+                "current": current.tolist(),
+                "charge": charge.tolist(),
+                "voltage_capacitor": v_capacitor.tolist(),
+                "voltage_resistor": v_resistor.tolist(),
+                "voltage_inductor": v_inductor.tolist(),
+                "energy_capacitor": energy_capacitor.tolist(),
+                "energy_inductor": energy_inductor.tolist(),
+                "energy_total": energy_total.tolist(),
+            },
+            "parameters": {
+                "resistance": resistance,
+                "inductance": inductance,
+                "capacitance": capacitance,
+                "voltage": voltage,
+                "omega_0": omega_0,
+                "zeta": zeta,
+                "regime": regime,
+            },
+            "analysis": {
+                "natural_frequency": omega_0,
+                "damping_ratio": zeta,
+                "regime": regime,
+                "resonant_frequency": omega_0 / (2 * np.pi),
+                "quality_factor": 1 / (2 * zeta) if zeta > 0 else float('inf'),
+            },
+        }
+
+    def simulate_rlc_circuit_batch(self,
+                                   resistance,
+                                   inductance,
+                                   capacitance,
+                                   voltage: float = 10.0,
+                                   duration: float = None,
+                                   num_points: int = 1000,
+                                   **kwargs) -> Dict[str, Any]:
+        """
+        Simule un lot de circuits RLC série en une seule passe vectorisée
 
-        except Exception as e:
-            logger.error(f"Error in RLC circuit simulation: {e}")
-            return {"success": False, "error": str(e)}
+        Les circuits sont regroupés par régime d'amortissement; chaque
+        groupe est calculé en un seul appel NumPy sur un tableau [B, N].
+
+        Args:
+            resistance: Résistances (Ω), scalaire ou tableau [B]
+            inductance: Inductances (H), scalaire ou tableau [B]
+            capacitance: Capacités (F), scalaire ou tableau [B]
+            voltage: Tension d'alimentation (V)
+            duration: Durée commune (s), par défaut 10/ω₀ pour chaque circuit
+            num_points: Nombre de points temporels par circuit
+        """
+        resistance, inductance, capacitance = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(resistance, dtype=np.float64)),
+            np.atleast_1d(np.asarray(inductance, dtype=np.float64)),
+            np.atleast_1d(np.asarray(capacitance, dtype=np.float64)),
+        )
+        if np.any(inductance <= 0) or np.any(capacitance <= 0) or np.any(resistance < 0):
+            return {"success": False, "error": "Inductance and capacitance must be positive, resistance non-negative"}
+        batch = resistance.shape[0]
+
+        omega_0 = 1 / np.sqrt(inductance * capacitance)
+        zeta = (resistance / 2) * np.sqrt(capacitance / inductance)
+
+        if duration is None:
+            duration = np.where(omega_0 > 0, 10 / omega_0, 1.0)
+
+        times = np.linspace(0, np.reshape(duration, (-1, 1)), num_points, axis=1)
+        times = np.broadcast_to(times.reshape(-1, num_points), (batch, num_points))
+
+        charge = np.empty((batch, num_points))
+        current = np.empty((batch, num_points))
+        q_final = (capacitance * voltage)[:, None]
+
+        under = zeta < 1
+        critical = zeta == 1
+        over = zeta > 1
+
+        if under.any():
+            t = times[under]
+            w0 = omega_0[under][:, None]
+            z = zeta[under][:, None]
+            wd = w0 * np.sqrt(1 - z**2)
+            charge[under] = q_final[under] * (1 - np.exp(-z * w0 * t) *
+                            (np.cos(wd * t) + (z * w0 / wd) * np.sin(wd * t)))
+            dt = t[:, 1:2] - t[:, 0:1]
+            current[under] = np.gradient(charge[under], axis=1) / dt
+
+        if critical.any():
+            t = times[critical]
+            w0 = omega_0[critical][:, None]
+            charge[critical] = q_final[critical] * (1 - np.exp(-w0 * t) * (1 + w0 * t))
+            current[critical] = (voltage / resistance[critical])[:, None] * w0 * t * np.exp(-w0 * t)
+
+        if over.any():
+            t = times[over]
+            w0 = omega_0[over][:, None]
+            z = zeta[over][:, None]
+            alpha = z * w0
+            beta = w0 * np.sqrt(z**2 - 1)
+            s1 = -alpha + beta
+            s2 = -alpha - beta
+            A = voltage / (inductance[over][:, None] * (s1 - s2))
+            charge[over] = q_final[over] * (1 + A * (s2 * np.exp(s1 * t) - s1 * np.exp(s2 * t)))
+            current[over] = A * (np.exp(s1 * t) - np.exp(s2 * t))
+
+        v_capacitor = charge / capacitance[:, None]
+        v_resistor = current * resistance[:, None]
+        v_inductor = voltage - v_capacitor - v_resistor
+
+        energy_capacitor = 0.5 * capacitance[:, None] * v_capacitor**2
+        energy_inductor = 0.5 * inductance[:, None] * current**2
+        energy_total = energy_capacitor + energy_inductor
+
+        regime = np.where(under, "sous-amorti", np.where(critical, "critique", "sur-amorti"))
+        with np.errstate(divide='ignore'):
+            quality_factor = np.where(zeta > 0, 1 / (2 * zeta), np.inf)
+
+        return {
+            "success": True,
+            "type": "rlc_circuit_batch",
+            "data": {
+                "time": times.tolist(),
+                "current": current.tolist(),
+                "charge": charge.tolist(),
+                "voltage_capacitor": v_capacitor.tolist(),
+                "voltage_resistor": v_resistor.tolist(),
+                "voltage_inductor": v_inductor.tolist(),
+                "energy_capacitor": energy_capacitor.tolist(),
+                "energy_inductor": energy_inductor.tolist(),
+                "energy_total": energy_total.tolist(),
+            },
+            "parameters": {
+                "resistance": resistance.tolist(),
+                "inductance": inductance.tolist(),
+                "capacitance": capacitance.tolist(),
+                "voltage": voltage,
+                "omega_0": omega_0.tolist(),
+                "zeta": zeta.tolist(),
+                "regime": regime.tolist(),
+            },
+            "analysis": {
+                "natural_frequency": omega_0.tolist(),
+                "damping_ratio": zeta.tolist(),
+                "regime": regime.tolist(),
+                "resonant_frequency": (omega_0 / (2 * np.pi)).tolist(),
+                "quality_factor": quality_factor.tolist(),
+            },
+        }
 
     def frequency_response(self,
                           resistance: float,
@@ -319,49 +512,47 @@ class ElectronicsSandbox:
             freq_min, freq_max: Plage de fréquences (Hz)
             num_points: Nombre de points
         """
-        try:
-            frequencies = np.logspace(np.log10(freq_min), np.log10(freq_max), num_points)
-            omega = 2 * np.pi * frequencies
-
-            if inductance and capacitance:
-                # Circuit RLC
-                Z = resistance + 1j * (omega * inductance - 1 / (omega * capacitance))
-            elif inductance:
-                # Circuit RL
-                Z = resistance + 1j * omega * inductance
-            elif capacitance:
-                # Circuit RC
-                Z = resistance + 1 / (1j * omega * capacitance)
-            else:
-                # Résistance pure
-                Z = resistance * np.ones_like(omega)
-
-            # Impédance
-            magnitude = np.abs(Z)
-            phase = np.angle(Z, deg=True)
-
-            # Gain (normalisé)
-            gain_db = 20 * np.log10(magnitude / magnitude[0])
-
-            return {
-                "success": True,
-                "type": "frequency_response",
-                "data": {
-                    "frequency": frequencies.tolist(),
-                    "magnitude": magnitude.tolist(),
-                    "phase": phase.tolist(),
-                    "gain_db": gain_db.tolist(),
-                },
-                "parameters": {
-                    "resistance": resistance,
-                    "inductance": inductance,
-                    "capacitance": capacitance,
-                },
-            }
-
-        except Exception as e:
-            logger.error(f"Error in frequency response: {e}")
-            return {"success": False, "error": str(e)}
+        if freq_min <= 0 or freq_max < freq_min or num_points < 1:
+            return {"success": False, "error": "Invalid frequency range"}
+
+        frequencies = np.logspace(np.log10(freq_min), np.log10(freq_max), num_points)
+        omega = 2 * np.pi * frequencies
+
+        if inductance and capacitance:
+            # Circuit RLC
+            Z = resistance + 1j * (omega * inductance - 1 / (omega * capacitance))
+        elif inductance:
+            # Circuit RL
+            Z = resistance + 1j * omega * inductance
+        elif capacitance:
+            # Circuit RC
+            Z = resistance + 1 / (1j * omega * capacitance)
+        else:
+            # Résistance pure
+            Z = resistance * np.ones_like(omega)
+
+        # Impédance
+        magnitude = np.abs(Z)
+        phase = np.angle(Z, deg=True)
+
+        # Gain (normalisé)
+        gain_db = 20 * np.log10(magnitude / magnitude[0])
+
+        return {
+            "success": True,
+            "type": "frequency_response",
+            "data": {
+                "frequency": frequencies.tolist(),
+                "magnitude": magnitude.tolist(),
+                "phase": phase.tolist(),
+                "gain_db": gain_db.tolist(),
+            },
+            "parameters": {
+                "resistance": resistance,
+                "inductance": inductance,
+                "capacitance": capacitance,
+            },
+        }
 
     def analyze_voltage_divider(self,
                                 r1: float,
@@ -376,38 +567,36 @@ class ElectronicsSandbox:
             r2: Résistance 2 (Ω)
             v_in: Tension d'entrée (V)
         """
-        try:
-            v_out = v_in * (r2 / (r1 + r2))
-            current = v_in / (r1 + r2)
-            power_r1 = current**2 * r1
-            power_r2 = current**2 * r2
-            power_total = power_r1 + power_r2
-
-            return {
-                "success": True,
-                "type": "voltage_divider",
-                "data": {
-                    "v_out": v_out,
-                    "current": current,
-                    "power_r1": power_r1,
-                    "power_r2": power_r2,
-                    "power_total": power_total,
-                },
-                "parameters": {
-                    "r1": r1,
-                    "r2": r2,
-                    "v_in": v_in,
-                },
-                "analysis": {
-                    "voltage_ratio": v_out / v_in,
-                    "attenuation_db": 20 * np.log10(v_out / v_in),
-                    "efficiency": power_r2 / power_total,
-                },
-            }
-
-        except Exception as e:
-            logger.error(f"Error in voltage divider analysis: {e}")
-            return {"success": False, "error": str(e)}
+        if r1 + r2 <= 0 or v_in == 0:
+            return {"success": False, "error": "Total resistance must be positive and v_in non-zero"}
+
+        v_out = v_in * (r2 / (r1 + r2))
+        current = v_in / (r1 + r2)
+        power_r1 = current**2 * r1
+        power_r2 = current**2 * r2
+        power_total = power_r1 + power_r2
+
+        return {
+            "success": True,
+            "type": "voltage_divider",
+            "data": {
+                "v_out": v_out,
+                "current": current,
+                "power_r1": power_r1,
+                "power_r2": power_r2,
+                "power_total": power_total,
+            },
+            "parameters": {
+                "r1": r1,
+                "r2": r2,
+                "v_in": v_in,
+            },
+            "analysis": {
+                "voltage_ratio": v_out / v_in,
+                "attenuation_db": 20 * np.log10(v_out / v_in),
+                "efficiency": power_r2 / power_total,
+            },
+        }
 
     def create_circuit_visualization(self,
                                     components: List[Dict[str, Any]],
@@ -418,34 +607,32 @@ class ElectronicsSandbox:
         Args:
             components: Liste de composants avec type, valeur, connexions
         """
-        try:
-            # Créer une représentation JSON du circuit pour le frontend
-            circuit_elements = []
-
-            for i, comp in enumerate(components):
-                element = {
-                    "id": comp.get('id', f"comp_{i}"),
-                    "type": comp.get('type'),
-                    "value": comp.get('value'),
-                    "unit": comp.get('unit', ''),
-                    "from": comp.get('node1', comp.get('from')),
-                    "to": comp.get('node2', comp.get('to')),
-                    "position": comp.get('position', {"x": 0, "y": 0}),
-                }
-                circuit_elements.append(element)
-
-            return {
-                "success": True,
-                "type": "circuit_diagram",
-                "data": {
-                    "elements": circuit_elements,
-                    "nodes": self._extract_nodes(components),
-                },
+        if not all(isinstance(comp, dict) for comp in components):
+            return {"success": False, "error": "Components must be dictionaries"}
+
+        # Créer une représentation JSON du circuit pour le frontend
+        circuit_elements = []
+
+        for i, comp in enumerate(components):
+            element = {
+                "id": comp.get('id', f"comp_{i}"),
+                "type": comp.get('type'),
+                "value": comp.get('value'),
+                "unit": comp.get('unit', ''),
+                "from": comp.get('node1', comp.get('from')),
+                "to": comp.get('node2', comp.get('to')),
+                "position": comp.get('position', {"x": 0, "y": 0}),
             }
+            circuit_elements.append(element)
 
-        except Exception as e:
-            logger.error(f"Error creating circuit visualization: {e}")
-            return {"success": False, "error": str(e)}
+        return {
+            "success": True,
+            "type": "circuit_diagram",
+            "data": {
+                "elements": circuit_elements,
+                "nodes": self._extract_nodes(components),
+            },
+        }
 
     def _extract_nodes(self, components: List[Dict]) -> List[str]:
         """Extrait les nœuds uniques d'une liste de composants"""
@@ -469,32 +656,37 @@ class ElectronicsSandbox:
             query: Requête utilisateur
             parameters: Paramètres extraits
         """
-        parameters = parameters or {}
-        query_lower = query.lower()
+        try:
+            parameters = parameters or {}
+            query_lower = query.lower()
 
-        # Extraire les valeurs des composants
-        resistance = parameters.get('resistance', 1000)
-        capacitance = parameters.get('capacitance', 1e-6)
-        inductance = parameters.get('inductance', 0.1)
-        voltage = parameters.get('voltage', 5.0)
+            # Extraire les valeurs des composants
+            resistance = parameters.get('resistance', 1000)
+            capacitance = parameters.get('capacitance', 1e-6)
+            inductance = parameters.get('inductance', 0.1)
+            voltage = parameters.get('voltage', 5.0)
 
-        if 'rc' in query_lower and 'rlc' not in query_lower:
-            return self.simulate_rc_circuit(resistance, capacitance, voltage, **parameters)
+            if 'rc' in query_lower and 'rlc' not in query_lower:
+                return self.simulate_rc_circuit(resistance, capacitance, voltage, **parameters)
 
-        elif 'rl' in query_lower and 'rlc' not in query_lower:
-            return self.simulate_rl_circuit(resistance, inductance, voltage, **parameters)
+            elif 'rl' in query_lower and 'rlc' not in query_lower:
+                return self.simulate_rl_circuit(resistance, inductance, voltage, **parameters)
 
-        elif 'rlc' in query_lower:
-            return self.simulate_rlc_circuit(resistance, inductance, capacitance, voltage, **parameters)
+            elif 'rlc' in query_lower:
+                return self.simulate_rlc_circuit(resistance, inductance, capacitance, voltage, **parameters)
 
-        elif 'fréquence' in query_lower or 'frequency' in query_lower or 'bode' in query_lower:
-            return self.frequency_response(resistance, inductance, capacitance, **parameters)
+            elif 'fréquence' in query_lower or 'frequency' in query_lower or 'bode' in query_lower:
+                return self.frequency_response(resistance, inductance, capacitance, **parameters)
 
-        elif 'diviseur' in query_lower or 'divider' in query_lower:
-            r1 = parameters.get('r1', 1000)
-            r2 = parameters.get('r2', 1000)
-            return self.analyze_voltage_divider(r1, r2, voltage, **parameters)
+            elif 'diviseur' in query_lower or 'divider' in query_lower:
+                r1 = parameters.get('r1', 1000)
+                r2 = parameters.get('r2', 1000)
+                return self.analyze_voltage_divider(r1, r2, voltage, **parameters)
 
-        else:
-            # Circuit RC par défaut
-            return self.simulate_rc_circuit(resistance, capacitance, voltage, **parameters)
+            else:
+                # Circuit RC par défaut
+                return self.simulate_rc_circuit(resistance, capacitance, voltage, **parameters)
+
+        except Exception as e:
+            logger.error(f"Error in electronics sandbox: {e}")
+            return {"success": False, "error": str(e)}
@@ -6,20 +6,249 @@ Traçage de courbes 2D/3D, graphiques paramétriques, animations
 import numpy as np
 import sympy as sp
 from sympy import symbols, lambdify, sympify
-from typing import Dict, Any, List, Optional, Tuple, Union
+from sympy.polys.polyerrors import CoercionFailed
+from scipy.optimize import brentq
+from typing import Dict, Any, Iterator, List, Optional, Tuple, Union
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+import base64
 import json
 import logging
+import os
+import re
+
+try:
+    import numba
+except ImportError:  # Accélération JIT optionnelle
+    numba = None
+
+try:
+    import numexpr
+except ImportError:  # Évaluation fusionnée optionnelle
+    numexpr = None
+
+try:
+    import orjson
+except ImportError:  # Sérialisation numpy native optionnelle
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Élimination des sous-expressions communes (lambdify(cse=...) depuis sympy 1.9)
+_SYMPY_VERSION = tuple(int(v) for v in re.findall(r'\d+', sp.__version__)[:2])
+_LAMBDIFY_OPTS = {'cse': True} if _SYMPY_VERSION >= (1, 9) else {}
+
+
+def _array_to_json(arr: np.ndarray):
+    """
+    Prépare un tableau pour la réponse JSON
+
+    Avec orjson (OPT_SERIALIZE_NUMPY), le tableau est sérialisé directement
+    depuis son buffer, sans créer un float Python par élément, et réduit en
+    float32 (précision utilisée par Plotly/WebGL) pour diviser la charge
+    utile par deux. Sans orjson on retombe sur des listes Python en float64:
+    un float32 converti en float Python aurait une représentation plus longue.
+    """
+    if orjson is not None:
+        return np.ascontiguousarray(arr, dtype=np.float32)
+    return arr.tolist()
+
+
+def _array_to_b64(arr: np.ndarray) -> str:
+    """
+    Encode une grille en base64 (float32 little-endian, ordre C)
+
+    Décodable côté frontend par `new Float32Array(...)`; NaN marque les
+    points manquants. ~2.5x plus compact que des listes JSON imbriquées.
+    """
+    return base64.b64encode(np.ascontiguousarray(arr, dtype='<f4').tobytes()).decode('ascii')
+
+
+def _finite_pairs(x: np.ndarray, y: np.ndarray):
+    """
+    Filtre les couples (x, y) où y est fini et les prépare pour le JSON
+
+    np.compress filtre en une passe C, sans tableau d'indices intermédiaire.
+    """
+    y = np.broadcast_to(y, x.shape)
+    mask = np.isfinite(y)
+    return _array_to_json(np.compress(mask, x)), _array_to_json(np.compress(mask, y))
+
+
+@lru_cache(maxsize=32)
+def _grid_1d(a: float, b: float, n: int) -> np.ndarray:
+    """
+    Grille linspace partagée entre les tracés de même intervalle
+
+    Le tableau renvoyé est en lecture seule: les appelants doivent utiliser
+    des opérations hors place (jamais `grid *= ...`).
+    """
+    arr = np.linspace(a, b, n)
+    arr.setflags(write=False)
+    return arr
+
+
+def _jit_vectorize(expr, syms, target: str = 'parallel'):
+    """
+    Compile une expression en noyau numba (ufunc fusionnée)
+
+    target='parallel' répartit un appel sur tous les cœurs; target='cpu'
+    donne un noyau mono-thread, à utiliser depuis plusieurs threads.
+
+    Returns:
+        La ufunc compilée, ou None si numba ne sait pas compiler l'expression
+    """
+    try:
+        scalar = numba.njit(lambdify(syms, expr, modules=['math'], **_LAMBDIFY_OPTS))
+        if len(syms) == 1:
+            kernel = lambda a: scalar(a)
+        elif len(syms) == 2:
+            kernel = lambda a, b: scalar(a, b)
+        else:
+            return None
+
+        signatures = [
+            f"float64({', '.join(['float64'] * len(syms))})",
+            f"float32({', '.join(['float32'] * len(syms))})",
+        ]
+        return numba.vectorize(signatures, target=target)(kernel)
+
+    except Exception as e:
+        logger.debug(f"JIT compilation failed for {expr}: {e}")
+        return None
+
+
+def _is_arithmetic(expr, syms) -> bool:
+    """Vrai si l'expression n'utilise que l'arithmétique (pas de sin, exp, ...)"""
+    return (not expr.atoms(sp.Function)
+            and not expr.has(sp.I)
+            and expr.free_symbols <= set(syms))
+
+
+def _polyval_func(expr, syms):
+    """
+    Évaluateur de Horner (polyval) pour un polynôme réel à une variable
+
+    Returns:
+        La fonction numérique, ou None si l'expression n'est pas un polynôme
+    """
+    if len(syms) != 1 or expr.has(sp.I) or not expr.free_symbols <= set(syms):
+        return None
+    if not expr.is_polynomial(syms[0]):
+        return None
+    try:
+        coeffs = sp.Poly(expr, syms[0], domain='RR').all_coeffs()
+    except (sp.PolynomialError, CoercionFailed):
+        return None
+
+    # polyval attend les coefficients par degré croissant
+    ascending = np.array([float(c) for c in reversed(coeffs)], dtype=np.float64)
+    return lambda values: np.polynomial.polynomial.polyval(values, ascending)
+
+
+@lru_cache(maxsize=256)
+def _compile(expr_str: str, symbol_names: Tuple[str, ...], module: str = 'numpy'):
+    """
+    Parse et compile une expression, avec mise en cache
+
+    Les tracés 2D, 3D, paramétriques et polaires partagent ce cache:
+    re-tracer la même fonction évite sympify() et lambdify().
+    Avec module='numba', le noyau JIT est mis en cache lui aussi, ce qui
+    amortit le coût de compilation; repli sur numpy en cas d'échec.
+    Les polynômes à une variable sont évalués par polyval (schéma de Horner
+    en C, sans temporaire par terme). Les autres expressions purement
+    arithmétiques passent par numexpr quand il est disponible: une seule
+    passe multi-thread, sans tableaux temporaires ni coût de compilation JIT.
+
+    Returns:
+        Tuple (expression sympy, fonction numérique)
+    """
+    syms = symbols(symbol_names)
+
+    if module == 'numba':
+        expr, numpy_func = _compile(expr_str, symbol_names)
+        if _polyval_func(expr, syms) is not None:
+            return expr, numpy_func
+        if numexpr is not None and _is_arithmetic(expr, syms):
+            return expr, numpy_func
+        func = _jit_vectorize(expr, syms)
+        return expr, func if func is not None else numpy_func
+
+    expr = sympify(expr_str)
+    if module == 'numpy':
+        func = _polyval_func(expr, syms)
+        if func is not None:
+            return expr, func
+    if module == 'numpy' and numexpr is not None and _is_arithmetic(expr, syms):
+        return expr, lambdify(syms, expr, modules='numexpr')
+
+    func = lambdify(syms, expr, modules=[module], **_LAMBDIFY_OPTS)
+    return expr, func
+
+
+@lru_cache(maxsize=256)
+def _derivs(expr_str: str):
+    """
+    Dérivées première et seconde en x d'une expression, avec mise en cache
+
+    Returns:
+        Tuple (expression, f', f'')
+    """
+    x = symbols('x')
+    expr, _ = _compile(expr_str, ('x',))
+    d1 = sp.diff(expr, x)
+    d2 = sp.diff(d1, x)
+    return expr, d1, d2
+
+
+@lru_cache(maxsize=256)
+def _normalize_polar(r_expr: str) -> str:
+    """Normalise une expression polaire (θ -> theta), avec mise en cache"""
+    return r_expr.replace('θ', 'theta')
+
+
+@lru_cache(maxsize=64)
+def _compile_animation_kernel(template_str: str, parameter_name: str):
+    """Compile le noyau numba f(x, paramètre) partagé par toutes les frames"""
+    expr, _ = _compile(template_str, ('x', parameter_name))
+    return _jit_vectorize(expr, symbols(('x', parameter_name)), target='cpu')
+
+
+@lru_cache(maxsize=1024)
+def _compile_frame(template_str: str, parameter_name: str, param_val: float):
+    """Compile une frame d'animation (template avec paramètre fixé)"""
+    expr, _ = _compile(template_str, ('x', parameter_name))
+    # xreplace: substitution purement structurelle, bien plus rapide que subs()
+    frame_expr = expr.xreplace({symbols(parameter_name): sp.Float(param_val)})
+    return lambdify(symbols('x'), frame_expr, modules=['numpy'], **_LAMBDIFY_OPTS)
+
+
+# Expressions par défaut de execute(), avec les variables de compilation
+_DEFAULTS = {
+    'surface': ('x**2 + y**2', ('x', 'y')),
+    'parametric_x': ('cos(t)', ('t',)),
+    'parametric_y': ('sin(t)', ('t',)),
+    'polar': ('1 + cos(theta)', ('theta',)),
+    'vector_u': ('-y', ('x', 'y')),
+    'vector_v': ('x', ('x', 'y')),
+    'animation': ('a*sin(x)', ('x', 'a')),
+}
+
 
 class MathSandbox:
     """Sandbox pour visualisations mathématiques interactives"""
 
-    def __init__(self):
-        self.x, self.y, self.z, self.t = symbols('x y z t')
+    def __init__(self, use_jit: bool = True):
+        self.x, self.y, self.z, self.t, self.theta = symbols('x y z t theta')
         self.default_range = (-10, 10)
         self.default_points = 500
+        # Backend d'évaluation: noyaux numba si disponible, sinon numpy
+        self.backend = 'numba' if use_jit and numba is not None else 'numpy'
+
+        # Pré-parser les expressions par défaut: le premier appel de execute()
+        # trouve déjà sympify/lambdify dans le cache de _compile
+        for expr_str, symbol_names in _DEFAULTS.values():
+            _compile(expr_str, symbol_names)
 
     def plot_function_2d(self, function_str: str,
                         x_min: float = None, x_max: float = None,
@@ -39,8 +268,7 @@ class MathSandbox:
         """
         try:
             # Parser la fonction
-            func_expr = sympify(function_str)
-            func = lambdify(self.x, func_expr, modules=['numpy'])
+            func_expr, func = _compile(function_str, ('x',), self.backend)
 
             # Paramètres par défaut
             x_min = x_min if x_min is not None else self.default_range[0]
@@ -48,17 +276,15 @@ class MathSandbox:
             num_points = num_points or self.default_points
 
             # Générer les points
-            x_values = np.linspace(x_min, x_max, num_points)
+            x_values = _grid_1d(x_min, x_max, num_points)
             y_values = func(x_values)
 
             # Gérer les infinis et NaN
-            mask = np.isfinite(y_values)
-            x_clean = x_values[mask].tolist()
-            y_clean = y_values[mask].tolist()
+            x_clean, y_clean = _finite_pairs(x_values, y_values)
 
             # Trouver les points remarquables
-            critical_points = self._find_critical_points(func_expr, x_min, x_max)
-            zeros = self._find_zeros(func_expr, x_min, x_max)
+            critical_points = self._find_critical_points(function_str, x_min, x_max, func)
+            zeros = self._find_zeros(func_expr, x_min, x_max, x_values, y_values, func)
 
             return {
                 "success": True,
@@ -100,14 +326,11 @@ class MathSandbox:
             num_points: Nombre de points
         """
         try:
-            x_func_expr = sympify(x_expr)
-            y_func_expr = sympify(y_expr)
-
-            x_func = lambdify(self.t, x_func_expr, modules=['numpy'])
-            y_func = lambdify(self.t, y_func_expr, modules=['numpy'])
+            x_func_expr, x_func = _compile(x_expr, ('t',), self.backend)
+            y_func_expr, y_func = _compile(y_expr, ('t',), self.backend)
 
             num_points = num_points or self.default_points
-            t_values = np.linspace(t_min, t_max, num_points)
+            t_values = _grid_1d(t_min, t_max, num_points)
 
             x_values = x_func(t_values)
             y_values = y_func(t_values)
@@ -116,9 +339,9 @@ class MathSandbox:
                 "success": True,
                 "type": "parametric_2d",
                 "data": {
-                    "x": x_values.tolist(),
-                    "y": y_values.tolist(),
-                    "t": t_values.tolist(),
+                    "x": _array_to_json(x_values),
+                    "y": _array_to_json(y_values),
+                    "t": _array_to_json(t_values),
                     "x_expr": str(x_func_expr),
                     "y_expr": str(y_func_expr),
                 },
@@ -149,23 +372,29 @@ class MathSandbox:
             function_str: Expression de la fonction (ex: "x**2 + y**2")
             x_min, x_max, y_min, y_max: Intervalles
             num_points: Nombre de points par dimension
+
+        Returns:
+            Dict où data.x et data.y sont les axes 1D de la grille et data.z_buf
+            la surface de forme data.shape = (len(y), len(x)), encodée par
+            _array_to_b64
         """
         try:
-            func_expr = sympify(function_str)
-            func = lambdify((self.x, self.y), func_expr, modules=['numpy'])
+            func_expr, func = _compile(function_str, ('x', 'y'), self.backend)
 
             x_min = x_min if x_min is not None else self.default_range[0]
             x_max = x_max if x_max is not None else self.default_range[1]
             y_min = y_min if y_min is not None else self.default_range[0]
             y_max = y_max if y_max is not None else self.default_range[1]
 
-            # Créer la grille
-            x_grid = np.linspace(x_min, x_max, num_points)
-            y_grid = np.linspace(y_min, y_max, num_points)
-            X, Y = np.meshgrid(x_grid, y_grid)
+            # Grille séparable: le broadcasting produit Z (ny, nx) sans
+            # matérialiser X et Y
+            x_grid = _grid_1d(x_min, x_max, num_points)
+            y_grid = _grid_1d(y_min, y_max, num_points)
+            X = x_grid[np.newaxis, :]
+            Y = y_grid[:, np.newaxis]
 
-            # Calculer Z
-            Z = func(X, Y)
+            # Calculer Z (diffusé si l'expression ne dépend pas de x et y)
+            Z = np.broadcast_to(func(X, Y), (num_points, num_points))
 
             # Gérer les infinis
             Z = np.where(np.isfinite(Z), Z, np.nan)
@@ -174,9 +403,10 @@ class MathSandbox:
                 "success": True,
                 "type": "function_3d",
                 "data": {
-                    "x": X.tolist(),
-                    "y": Y.tolist(),
-                    "z": Z.tolist(),
+                    "x": _array_to_json(x_grid),
+                    "y": _array_to_json(y_grid),
+                    "z_buf": _array_to_b64(Z),
+                    "shape": list(Z.shape),
                     "function": str(func_expr),
                 },
                 "metadata": {
@@ -209,12 +439,11 @@ class MathSandbox:
             num_points: Nombre de points
         """
         try:
-            theta = symbols('theta')
-            r_func_expr = sympify(r_expr.replace('θ', 'theta'))
-            r_func = lambdify(theta, r_func_expr, modules=['numpy'])
+            r_func_expr, r_func = _compile(_normalize_polar(r_expr), (self.theta.name,),
+                                           self.backend)
 
             num_points = num_points or self.default_points
-            theta_values = np.linspace(theta_min, theta_max, num_points)
+            theta_values = _grid_1d(theta_min, theta_max, num_points)
             r_values = r_func(theta_values)
 
             # Convertir en coordonnées cartésiennes pour le traçage
@@ -225,10 +454,10 @@ class MathSandbox:
                 "success": True,
                 "type": "polar",
                 "data": {
-                    "x": x_values.tolist(),
-                    "y": y_values.tolist(),
-                    "r": r_values.tolist(),
-                    "theta": theta_values.tolist(),
+                    "x": _array_to_json(x_values),
+                    "y": _array_to_json(y_values),
+                    "r": _array_to_json(r_values),
+                    "theta": _array_to_json(theta_values),
                     "r_expr": str(r_func_expr),
                 },
                 "metadata": {
@@ -259,34 +488,39 @@ class MathSandbox:
             v_expr: Composante y du vecteur
             x_min, x_max, y_min, y_max: Intervalles
             num_points: Nombre de vecteurs par dimension
+
+        Returns:
+            Dict où data.x et data.y sont les axes 1D de la grille et
+            data.u_buf, data.v_buf les composantes de forme
+            data.shape = (len(y), len(x)), encodées par _array_to_b64
         """
         try:
-            u_func_expr = sympify(u_expr)
-            v_func_expr = sympify(v_expr)
-
-            u_func = lambdify((self.x, self.y), u_func_expr, modules=['numpy'])
-            v_func = lambdify((self.x, self.y), v_func_expr, modules=['numpy'])
+            u_func_expr, u_func = _compile(u_expr, ('x', 'y'), self.backend)
+            v_func_expr, v_func = _compile(v_expr, ('x', 'y'), self.backend)
 
             x_min = x_min if x_min is not None else self.default_range[0]
             x_max = x_max if x_max is not None else self.default_range[1]
             y_min = y_min if y_min is not None else self.default_range[0]
             y_max = y_max if y_max is not None else self.default_range[1]
 
-            x_grid = np.linspace(x_min, x_max, num_points)
-            y_grid = np.linspace(y_min, y_max, num_points)
-            X, Y = np.meshgrid(x_grid, y_grid)
+            x_grid = _grid_1d(x_min, x_max, num_points)
+            y_grid = _grid_1d(y_min, y_max, num_points)
+            X = x_grid[np.newaxis, :]
+            Y = y_grid[:, np.newaxis]
 
-            U = u_func(X, Y)
-            V = v_func(X, Y)
+            shape = (num_points, num_points)
+            U = np.broadcast_to(u_func(X, Y), shape)
+            V = np.broadcast_to(v_func(X, Y), shape)
 
             return {
                 "success": True,
                 "type": "vector_field",
                 "data": {
-                    "x": X.tolist(),
-                    "y": Y.tolist(),
-                    "u": U.tolist(),
-                    "v": V.tolist(),
+                    "x": _array_to_json(x_grid),
+                    "y": _array_to_json(y_grid),
+                    "u_buf": _array_to_b64(U),
+                    "v_buf": _array_to_b64(V),
+                    "shape": list(U.shape),
                     "u_expr": str(u_func_expr),
                     "v_expr": str(v_func_expr),
                 },
@@ -307,61 +541,122 @@ class MathSandbox:
                 "error": str(e),
             }
 
-    def _find_critical_points(self, func_expr, x_min: float, x_max: float) -> List[Dict[str, float]]:
-        """Trouve les points critiques (dérivée = 0)"""
+    def _find_critical_points(self, function_str: str, x_min: float, x_max: float,
+                              func=None) -> List[Dict[str, float]]:
+        """
+        Trouve les points critiques (dérivée = 0)
+
+        Les dérivées et f'' compilée viennent des caches (_derivs, _compile);
+        les racines sont évaluées et classées en une seule passe vectorisée.
+        `func` est la version numérique de la fonction déjà compilée par l'appelant.
+        """
         try:
-            derivative = sp.diff(func_expr, self.x)
+            func_expr, derivative, second_derivative = _derivs(function_str)
             critical_x = sp.solve(derivative, self.x)
 
-            points = []
-            func = lambdify(self.x, func_expr, modules=['numpy'])
-
-            for x_val in critical_x:
-                if x_val.is_real:
-                    x_float = float(x_val.evalf())
-                    if x_min <= x_float <= x_max:
-                        y_float = float(func(x_float))
-                        if np.isfinite(y_float):
-                            # Déterminer le type (min, max, inflexion)
-                            second_deriv = sp.diff(derivative, self.x)
-                            second_deriv_val = float(second_deriv.subs(self.x, x_val).evalf())
-
-                            point_type = "inflection"
-                            if second_deriv_val > 0:
-                                point_type = "minimum"
-                            elif second_deriv_val < 0:
-                                point_type = "maximum"
-
-                            points.append({
-                                "x": x_float,
-                                "y": y_float,
-                                "type": point_type
-                            })
-
-            return points[:10]  # Limiter à 10 points
+            if func is None:
+                _, func = _compile(function_str, ('x',))
+            _, second_deriv_fn = _compile(str(second_derivative), ('x',))
+
+            xs = np.array([float(x_val.evalf()) for x_val in critical_x if x_val.is_real],
+                          dtype=np.float64)
+            xs = xs[(xs >= x_min) & (xs <= x_max)]
+
+            ys = np.broadcast_to(np.asarray(func(xs), dtype=np.float64), xs.shape)
+            finite = np.isfinite(ys)
+            xs, ys = xs[finite][:10], ys[finite][:10]  # Limiter à 10 points
+
+            # Déterminer le type (min, max, inflexion) via le signe de f''
+            d2 = np.broadcast_to(np.asarray(second_deriv_fn(xs), dtype=np.float64), xs.shape)
+            types = np.where(d2 > 0, "minimum", np.where(d2 < 0, "maximum", "inflection"))
+
+            return [
+                {"x": float(x), "y": float(y), "type": str(t)}
+                for x, y, t in zip(xs, ys, types)
+            ]
 
         except Exception as e:
             logger.debug(f"Could not find critical points: {e}")
             return []
 
-    def _find_zeros(self, func_expr, x_min: float, x_max: float) -> List[float]:
-        """Trouve les zéros de la fonction"""
-        try:
-            zeros = sp.solve(func_expr, self.x)
-            result = []
+    def _find_zeros(self, func_expr, x_min: float, x_max: float,
+                    x_values: np.ndarray, y_values: np.ndarray, func) -> List[float]:
+        """
+        Trouve les zéros de la fonction
 
-            for zero in zeros:
-                if zero.is_real:
-                    zero_float = float(zero.evalf())
-                    if x_min <= zero_float <= x_max:
-                        result.append(zero_float)
+        Les polynômes sont résolus symboliquement (exact, racines doubles
+        comprises). Sinon, les changements de signe de y_values déjà calculé
+        encadrent chaque zéro, affiné ensuite par brentq.
+        """
+        try:
+            if func_expr.is_polynomial(self.x):
+                result = []
+                for zero in sp.solve(func_expr, self.x):
+                    if zero.is_real:
+                        zero_float = float(zero.evalf())
+                        if x_min <= zero_float <= x_max:
+                            result.append(zero_float)
+                return result[:10]  # Limiter à 10 zéros
+
+            y_values = np.broadcast_to(y_values, x_values.shape)
+            finite = np.isfinite(y_values)
+            sign = np.sign(y_values)
+            brackets = np.where((sign[:-1] != sign[1:]) & finite[:-1] & finite[1:])[0]
+
+            # Un saut de signe sur un pôle (ex: 1/x) n'est pas un zéro
+            tolerance = 1e-6 * max(1.0, float(np.max(np.abs(y_values[finite]), initial=0.0)))
 
-            return result[:10]  # Limiter à 10 zéros
+            result = []
+            for i in brackets:
+                root = brentq(func, x_values[i], x_values[i + 1])
+                if abs(float(func(root))) > tolerance:
+                    continue
+                if result and abs(root - result[-1]) < 1e-9:
+                    continue  # zéro exact sur un point de la grille
+                result.append(float(root))
+                if len(result) == 10:  # Limiter à 10 zéros
+                    break
+
+            return result
 
         except Exception as e:
             logger.debug(f"Could not find zeros: {e}")
             return []
 
+    def _animation_setup(self, function_template: str, parameter_name: str,
+                         param_values: Optional[List[float]],
+                         x_min: Optional[float], x_max: Optional[float]):
+        """
+        Prépare une animation: expression, grille x, valeurs du paramètre
+
+        Returns:
+            Tuple (expression, x_values, param_values, x_min, x_max, frame_y, parallel)
+            où frame_y(v) calcule y pour une valeur du paramètre et parallel
+            indique si frame_y libère le GIL (noyau numba)
+        """
+        func_expr, _ = _compile(function_template, ('x', parameter_name))
+
+        x_min = x_min if x_min is not None else self.default_range[0]
+        x_max = x_max if x_max is not None else self.default_range[1]
+
+        if param_values is None:
+            param_values = np.linspace(-5, 5, 30).tolist()
+
+        x_values = _grid_1d(x_min, x_max, self.default_points)
+
+        kernel = None
+        if self.backend == 'numba':
+            kernel = _compile_animation_kernel(function_template, parameter_name)
+
+        if kernel is not None:
+            frame_y = lambda v: kernel(x_values, float(v))
+        else:
+            frame_y = lambda v: np.broadcast_to(
+                _compile_frame(function_template, parameter_name, float(v))(x_values),
+                x_values.shape)
+
+        return func_expr, x_values, param_values, x_min, x_max, frame_y, kernel is not None
+
     def animate_function(self, function_template: str,
                         parameter_name: str = 'a',
                         param_values: List[float] = None,
@@ -375,43 +670,56 @@ class MathSandbox:
             parameter_name: Nom du paramètre à varier
             param_values: Valeurs du paramètre pour l'animation
             x_min, x_max: Intervalle de traçage
+
+        Returns:
+            Dict avec data.frames; si toutes les frames sont finies, l'axe x
+            est émis une seule fois dans data.x et les frames ne portent que y
         """
         try:
-            param_symbol = symbols(parameter_name)
-            func_expr = sympify(function_template)
+            func_expr, x_values, param_values, x_min, x_max, frame_y, parallel = \
+                self._animation_setup(function_template, parameter_name,
+                                      param_values, x_min, x_max)
 
-            x_min = x_min if x_min is not None else self.default_range[0]
-            x_max = x_max if x_max is not None else self.default_range[1]
-
-            if param_values is None:
-                param_values = np.linspace(-5, 5, 30).tolist()
+            # Générer les frames
+            if parallel:
+                # Le noyau numba libère le GIL: les frames sont calculées en parallèle
+                with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+                    frames_y = list(pool.map(frame_y, param_values))
+            else:
+                frames_y = [frame_y(v) for v in param_values]
 
-            x_values = np.linspace(x_min, x_max, self.default_points)
+            # Cas courant: toutes les frames sont finies, x est partagé
+            shared_x = all(np.isfinite(y_values).all() for y_values in frames_y)
 
-            # Générer les frames
             frames = []
-            for param_val in param_values:
-                func_with_param = func_expr.subs(param_symbol, param_val)
-                func = lambdify(self.x, func_with_param, modules=['numpy'])
-                y_values = func(x_values)
+            for param_val, y_values in zip(param_values, frames_y):
+                if shared_x:
+                    frames.append({
+                        "y": _array_to_json(y_values),
+                        "parameter_value": param_val,
+                    })
+                    continue
 
                 # Nettoyer les infinis
-                mask = np.isfinite(y_values)
-
+                x_clean, y_clean = _finite_pairs(x_values, y_values)
                 frames.append({
-                    "x": x_values[mask].tolist(),
-                    "y": y_values[mask].tolist(),
+                    "x": x_clean,
+                    "y": y_clean,
                     "parameter_value": param_val,
                 })
 
+            data = {
+                "frames": frames,
+                "function_template": str(func_expr),
+                "parameter_name": parameter_name,
+            }
+            if shared_x:
+                data["x"] = _array_to_json(x_values)
+
             return {
                 "success": True,
                 "type": "animation",
-                "data": {
-                    "frames": frames,
-                    "function_template": str(func_expr),
-                    "parameter_name": parameter_name,
-                },
+                "data": data,
                 "metadata": {
                     "num_frames": len(frames),
                     "x_min": x_min,
@@ -427,6 +735,52 @@ class MathSandbox:
                 "error": str(e),
             }
 
+    def stream_animation(self, function_template: str,
+                         parameter_name: str = 'a',
+                         param_values: List[float] = None,
+                         x_min: float = None, x_max: float = None,
+                         **kwargs) -> Iterator[Dict[str, Any]]:
+        """
+        Version paresseuse de animate_function, frame par frame
+
+        L'expression est compilée dès l'appel (les erreurs de parsing sont
+        levées avant le premier élément). Le générateur renvoyé produit
+        d'abord un en-tête (type "animation", data.x partagé, metadata),
+        puis une frame par valeur du paramètre: {"y", "parameter_value"},
+        avec "x" filtré seulement si la frame contient des valeurs non finies.
+        La mémoire reste en O(num_points) au lieu de O(frames x num_points).
+        """
+        func_expr, x_values, param_values, x_min, x_max, frame_y, _ = \
+            self._animation_setup(function_template, parameter_name,
+                                  param_values, x_min, x_max)
+
+        def frames():
+            yield {
+                "success": True,
+                "type": "animation",
+                "data": {
+                    "x": _array_to_json(x_values),
+                    "function_template": str(func_expr),
+                    "parameter_name": parameter_name,
+                },
+                "metadata": {
+                    "num_frames": len(param_values),
+                    "x_min": x_min,
+                    "x_max": x_max,
+                },
+                "options": kwargs,
+            }
+
+            for param_val in param_values:
+                y_values = frame_y(param_val)
+                if np.isfinite(y_values).all():
+                    yield {"y": _array_to_json(y_values), "parameter_value": param_val}
+                else:
+                    x_clean, y_clean = _finite_pairs(x_values, y_values)
+                    yield {"x": x_clean, "y": y_clean, "parameter_value": param_val}
+
+        return frames()
+
     def execute(self, query: str, parameters: Dict[str, Any] = None) -> Dict[str, Any]:
         """
         Point d'entrée général pour le sandbox math
@@ -441,25 +795,25 @@ class MathSandbox:
         query_lower = query.lower()
 
         if '3d' in query_lower or 'surface' in query_lower:
-            function = parameters.get('function', 'x**2 + y**2')
+            function = parameters.get('function', _DEFAULTS['surface'][0])
             return self.plot_function_3d(function, **parameters)
 
         elif 'paramétrique' in query_lower or 'parametric' in query_lower:
-            x_expr = parameters.get('x_expr', 'cos(t)')
-            y_expr = parameters.get('y_expr', 'sin(t)')
+            x_expr = parameters.get('x_expr', _DEFAULTS['parametric_x'][0])
+            y_expr = parameters.get('y_expr', _DEFAULTS['parametric_y'][0])
             return self.plot_parametric_2d(x_expr, y_expr, **parameters)
 
         elif 'polaire' in query_lower or 'polar' in query_lower:
-            r_expr = parameters.get('r_expr', parameters.get('function', '1 + cos(theta)'))
+            r_expr = parameters.get('r_expr', parameters.get('function', _DEFAULTS['polar'][0]))
             return self.plot_polar(r_expr, **parameters)
 
         elif 'champ' in query_lower or 'vector' in query_lower:
-            u_expr = parameters.get('u_expr', '-y')
-            v_expr = parameters.get('v_expr', 'x')
+            u_expr = parameters.get('u_expr', _DEFAULTS['vector_u'][0])
+            v_expr = parameters.get('v_expr', _DEFAULTS['vector_v'][0])
             return self.plot_vector_field(u_expr, v_expr, **parameters)
 
         elif 'animer' in query_lower or 'animate' in query_lower:
-            function = parameters.get('function', 'a*sin(x)')
+            function = parameters.get('function', _DEFAULTS['animation'][0])
             return self.animate_function(function, **parameters)
 
         else:
@@ -4,12 +4,173 @@ Mécanique, collisions, oscillations, projectiles, ondes
 """
 
 import numpy as np
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Literal, Optional, Tuple
 from dataclasses import dataclass, asdict
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 import logging
+import math
+import multiprocessing
+
+try:
+    import numba
+    from numba import prange
+except ImportError:  # Accélération JIT optionnelle
+    numba = None
+    prange = range
+
+try:
+    import orjson
+except ImportError:  # Sérialisation numpy native optionnelle
+    orjson = None
+
+try:
+    from ._physics_numba import simulate_collisions
+except ImportError:  # Boucle de collisions compilée optionnelle (numba)
+    simulate_collisions = None
 
 logger = logging.getLogger(__name__)
 
+# Précision de stockage des trajectoires (SimulationConfig.precision)
+_PRECISIONS = {"fp32": np.float32, "fp64": np.float64}
+
+
+def _array_to_json(arr: np.ndarray):
+    """
+    Prépare un tableau pour la réponse JSON
+
+    Avec orjson le tableau est sérialisé depuis son buffer, dans sa précision
+    de stockage (float32 court en JSON); sinon conversion en liste Python.
+    """
+    if orjson is not None:
+        return np.ascontiguousarray(arr)
+    return arr.tolist()
+
+
+def _pendulum_step(theta0: float, omega0: float, g: float, length: float,
+                   damping: float, dt: float, n: int):
+    """
+    Intègre le pendule sur n pas (Euler semi-implicite)
+
+    Returns:
+        Tuple (theta, omega) de tableaux préalloués de taille n
+    """
+    theta = np.empty(n)
+    omega = np.empty(n)
+    th, om = theta0, omega0
+    for i in range(n):
+        theta[i] = th
+        omega[i] = om
+        alpha = -(g / length) * math.sin(th) - damping * om
+        om += alpha * dt
+        th += om * dt
+    return theta, omega
+
+
+def _pendulum_rk4_into(theta0: float, omega0: float, g: float, length: float,
+                       damping: float, dt: float, theta: np.ndarray, omega: np.ndarray):
+    """
+    Intègre le pendule (Runge-Kutta d'ordre 4) dans des tableaux fournis
+
+    Plus précis qu'Euler à pas égal: autorise un pas ~5x plus grand. Écrit
+    len(theta) pas dans theta et omega, sans allocation: noyau commun du JIT,
+    des lots et de l'export AOT.
+    """
+    k = g / length
+    th, om = theta0, omega0
+    for i in range(theta.shape[0]):
+        theta[i] = th
+        omega[i] = om
+        # f(theta, omega) = (omega, -(g/L) sin(theta) - damping * omega)
+        k1_th = om
+        k1_om = -k * math.sin(th) - damping * om
+        k2_th = om + 0.5 * dt * k1_om
+        k2_om = -k * math.sin(th + 0.5 * dt * k1_th) - damping * k2_th
+        k3_th = om + 0.5 * dt * k2_om
+        k3_om = -k * math.sin(th + 0.5 * dt * k2_th) - damping * k3_th
+        k4_th = om + dt * k3_om
+        k4_om = -k * math.sin(th + dt * k3_th) - damping * k4_th
+        th += dt * (k1_th + 2 * k2_th + 2 * k3_th + k4_th) / 6
+        om += dt * (k1_om + 2 * k2_om + 2 * k3_om + k4_om) / 6
+
+
+def _pendulum_rk4(theta0: float, omega0: float, g: float, length: float,
+                  damping: float, dt: float, n: int):
+    """
+    Intègre le pendule sur n pas (Runge-Kutta d'ordre 4)
+
+    Returns:
+        Tuple (theta, omega) de tableaux préalloués de taille n
+    """
+    theta = np.empty(n)
+    omega = np.empty(n)
+    _pendulum_rk4_into(theta0, omega0, g, length, damping, dt, theta, omega)
+    return theta, omega
+
+
+# Signatures explicites: compilation (ou chargement du cache) dès l'import,
+# pas de latence JIT au premier appel
+_PENDULUM_SIGNATURE = "Tuple((f8[:], f8[:]))(f8, f8, f8, f8, f8, f8, i8)"
+_PENDULUM_INTO_SIGNATURE = "void(f8, f8, f8, f8, f8, f8, f8[:], f8[:])"
+
+if numba is not None:
+    _pendulum_step = numba.njit(_PENDULUM_SIGNATURE, cache=True)(_pendulum_step)
+    _pendulum_rk4_into = numba.njit(_PENDULUM_INTO_SIGNATURE, cache=True)(_pendulum_rk4_into)
+    _pendulum_rk4 = numba.njit(_PENDULUM_SIGNATURE, cache=True)(_pendulum_rk4)
+
+
+def _pendulum_batch(theta0: np.ndarray, length: np.ndarray, damping: np.ndarray,
+                    g: float, dt: float, n: int):
+    """
+    Intègre un lot de pendules (RK4), une trajectoire par ligne
+
+    Avec numba, les trajectoires sont réparties sur les cœurs (prange).
+
+    Returns:
+        Tuple (theta, omega) de forme (B, n)
+    """
+    batch = theta0.shape[0]
+    theta = np.empty((batch, n))
+    omega = np.empty((batch, n))
+    for b in prange(batch):
+        # Écriture directe dans la ligne b, sans tableau intermédiaire
+        _pendulum_rk4_into(theta0[b], 0.0, g, length[b], damping[b], dt, theta[b], omega[b])
+    return theta, omega
+
+
+if numba is not None:
+    _pendulum_batch = numba.njit("Tuple((f8[:, :], f8[:, :]))(f8[:], f8[:], f8[:], f8, f8, i8)",
+                                 parallel=True, cache=True)(_pendulum_batch)
+
+try:
+    # Module AOT optionnel, construit par `python -m modules.sandboxes._physics_aot`
+    from .physics_aot import pendulum_rk4_into as _aot_pendulum_rk4
+except ImportError:
+    _aot_pendulum_rk4 = None
+
+if _aot_pendulum_rk4 is not None:
+    def _pendulum_rk4_aot(theta0: float, omega0: float, g: float, length: float,
+                          damping: float, dt: float, n: int):
+        """RK4 précompilé (AOT): même interface que _pendulum_rk4"""
+        theta = np.empty(n)
+        omega = np.empty(n)
+        _aot_pendulum_rk4(float(theta0), float(omega0), float(g), float(length),
+                          float(damping), float(dt), theta, omega)
+        return theta, omega
+
+# Profils d'onde normalisés (amplitude 1) en fonction de la phase
+_WAVE_FUNCTIONS = {
+    "sine": np.sin,
+    "square": lambda phase: np.sign(np.sin(phase)),
+    "sawtooth": lambda phase: 2 * (phase / (2 * np.pi) - np.floor(phase / (2 * np.pi) + 0.5)),
+}
+
+# Intégrateurs du pendule: (stepper, pas de temps par défaut)
+_PENDULUM_INTEGRATORS = {
+    "rk4": (_pendulum_rk4_aot if _aot_pendulum_rk4 is not None else _pendulum_rk4, 0.05),
+    "euler": (_pendulum_step, 0.01),
+}
+
 
 @dataclass
 class PhysicsObject:
@@ -41,15 +202,77 @@ class SimulationConfig:
     height: float = 600
     air_resistance: float = 0.0
     enable_collisions: bool = True
+    # Précision des trajectoires: "fp32" (visualisation) ou "fp64" (calcul scientifique)
+    precision: Literal["fp32", "fp64"] = "fp32"
+
+
+@dataclass
+class BodyArrays:
+    """État des objets en colonnes (structure of arrays), un indice par objet"""
+    x: np.ndarray
+    y: np.ndarray
+    vx: np.ndarray
+    vy: np.ndarray
+    mass: np.ndarray
+    radius: np.ndarray
+    restitution: np.ndarray
+    is_static: np.ndarray
+    is_circle: np.ndarray
+
+    @classmethod
+    def from_objects(cls, objects: List[PhysicsObject],
+                     dtype=np.float64) -> "BodyArrays":
+        """Empaquette une liste de PhysicsObject en tableaux contigus"""
+        n = len(objects)
+        column = lambda name: np.fromiter((getattr(o, name) for o in objects),
+                                          dtype=dtype, count=n)
+        return cls(
+            x=column('x'),
+            y=column('y'),
+            vx=column('vx'),
+            vy=column('vy'),
+            mass=column('mass'),
+            radius=column('radius'),
+            restitution=column('restitution'),
+            is_static=np.array([o.is_static for o in objects], dtype=bool),
+            is_circle=np.array([o.type == "circle" for o in objects], dtype=bool),
+        )
+
+
+# En dessous de ce nombre de cercles, la matrice des distances (O(N²) mais
+# entièrement vectorisée) est plus rapide que le hachage spatial
+_DENSE_BROAD_PHASE_MAX = 256
+
+# Simulations accessibles par nom (execute, run_batch)
+_SIMULATIONS = {
+    "projectile": "create_projectile_simulation",
+    "pendulum": "create_pendulum_simulation",
+    "collision": "create_collision_simulation",
+    "wave": "create_wave_simulation",
+}
+
+
+def _run_simulation(sim_type: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Lance une simulation dans un sandbox neuf (point d'entrée des workers)"""
+    return getattr(PhysicsSandbox(), _SIMULATIONS[sim_type])(**params)
 
 
 class PhysicsSandbox:
     """Sandbox pour simulations physiques 2D"""
 
-    def __init__(self):
+    def __init__(self, use_jit: bool = True):
         self.objects: List[PhysicsObject] = []
         self.config = SimulationConfig()
         self.time = 0.0
+        # Boucle de collisions compilée si numba est disponible
+        self.use_jit = use_jit and simulate_collisions is not None
+
+    def _dtype(self, kwargs: Dict[str, Any]):
+        """Type numpy des trajectoires (kwarg `precision` ou configuration)"""
+        precision = kwargs.get('precision', self.config.precision)
+        if precision not in _PRECISIONS:
+            raise ValueError(f"Unknown precision: {precision}")
+        return _PRECISIONS[precision]
 
     def create_projectile_simulation(self,
                                     initial_velocity: float,
@@ -57,6 +280,7 @@ class PhysicsSandbox:
                                     height: float = 0.0,
                                     mass: float = 1.0,
                                     duration: float = 10.0,
+                                    emit_trajectory: bool = True,
                                     **kwargs) -> Dict[str, Any]:
         """
         Simule le mouvement d'un projectile
@@ -67,75 +291,91 @@ class PhysicsSandbox:
             height: Hauteur initiale (m)
             mass: Masse du projectile (kg)
             duration: Durée de simulation (s)
+            emit_trajectory: Si False, seule l'analysis est calculée (forme close)
         """
         try:
-            angle_rad = np.radians(angle_degrees)
+            angle_rad = math.radians(angle_degrees)
             g = kwargs.get('gravity', 9.81)
             dt = 0.01  # Time step pour la simulation
 
-            # Composantes de vitesse initiale
-            vx0 = initial_velocity * np.cos(angle_rad)
-            vy0 = initial_velocity * np.sin(angle_rad)
-
-            # Calculer la trajectoire
-            times = []
-            x_positions = []
-            y_positions = []
-            velocities = []
-            energies = []
-
-            t = 0
-            x, y = 0, height
-            vx, vy = vx0, vy0
-
-            while t <= duration and y >= 0:
-                times.append(t)
-                x_positions.append(x)
-                y_positions.append(y)
-
-                # Vitesse et énergie
-                v = np.sqrt(vx**2 + vy**2)
-                velocities.append(v)
-
-                kinetic = 0.5 * mass * v**2
-                potential = mass * g * y
-                total = kinetic + potential
-                energies.append({
-                    "kinetic": kinetic,
-                    "potential": potential,
-                    "total": total,
-                })
-
-                # Mise à jour (Euler)
-                x += vx * dt
-                y += vy * dt
-                vy -= g * dt  # Accélération gravitationnelle
-
-                t += dt
+            # Composantes de vitesse initiale (floats Python: ne promeuvent
+            # pas les tableaux float32 en float64)
+            vx0 = initial_velocity * math.cos(angle_rad)
+            vy0 = initial_velocity * math.sin(angle_rad)
+
+            parameters = {
+                "initial_velocity": initial_velocity,
+                "angle": angle_degrees,
+                "height": height,
+                "mass": mass,
+                "gravity": g,
+            }
+
+            if not emit_trajectory:
+                # Valeurs remarquables exactes, sans échantillonner la trajectoire
+                apex_time = min(max(vy0, 0.0) / g, duration)
+                flight_time = (vy0 + math.sqrt(vy0 * vy0 + 2 * g * height)) / g
+                landed = flight_time <= duration
+                return {
+                    "success": True,
+                    "type": "projectile",
+                    "data": {},
+                    "parameters": parameters,
+                    "analysis": {
+                        "max_height": height + vy0 * apex_time - 0.5 * g * apex_time ** 2,
+                        "max_height_time": apex_time,
+                        "range": vx0 * flight_time if landed else None,
+                        "flight_time": flight_time if landed else None,
+                    },
+                }
+
+            # Trajectoire en forme close, calculée d'un bloc sur la grille temporelle
+            dtype = self._dtype(kwargs)
+            n = int(duration / dt) + 1
+            t = np.arange(n, dtype=dtype) * dtype(dt)
+            y = height + vy0 * t - 0.5 * g * t * t
+
+            # Tronquer au premier échantillon sous le sol: argmax s'arrête au
+            # premier True, sans passe any() préalable
+            below = y < 0
+            first_below = int(np.argmax(below))
+            landed = bool(below[first_below])
+            if landed:
+                n = max(first_below, 1)
+                t, y = t[:n], y[:n]
+
+            x = vx0 * t
+            vy = vy0 - g * t
+            v = np.hypot(vx0, vy)
+
+            kinetic = 0.5 * mass * v * v
+            potential = mass * g * y
+            total = kinetic + potential
+            # Colonnes parallèles, comme le reste du bloc data
+            energies = {
+                "kinetic": _array_to_json(kinetic),
+                "potential": _array_to_json(potential),
+                "total": _array_to_json(total),
+            }
 
             # Calculer les valeurs remarquables
-            max_height = max(y_positions)
-            max_height_time = times[y_positions.index(max_height)]
-            range_distance = x_positions[-1] if y_positions[-1] <= 0 else None
-            flight_time = times[-1] if y_positions[-1] <= 0 else None
+            apex = int(np.argmax(y))
+            max_height = float(y[apex])
+            max_height_time = float(t[apex])
+            range_distance = float(x[-1]) if landed else None
+            flight_time = float(t[-1]) if landed else None
 
             return {
                 "success": True,
                 "type": "projectile",
                 "data": {
-                    "time": times,
-                    "x": x_positions,
-                    "y": y_positions,
-                    "velocity": velocities,
+                    "time": _array_to_json(t),
+                    "x": _array_to_json(x),
+                    "y": _array_to_json(y),
+                    "velocity": _array_to_json(v),
                     "energy": energies,
                 },
-                "parameters": {
-                    "initial_velocity": initial_velocity,
-                    "angle": angle_degrees,
-                    "height": height,
-                    "mass": mass,
-                    "gravity": g,
-                },
+                "parameters": parameters,
                 "analysis": {
                     "max_height": max_height,
                     "max_height_time": max_height_time,
@@ -154,6 +394,7 @@ class PhysicsSandbox:
                                   mass: float = 1.0,
                                   damping: float = 0.0,
                                   duration: float = 10.0,
+                                  emit_trajectory: bool = True,
                                   **kwargs) -> Dict[str, Any]:
         """
         Simule un pendule simple
@@ -164,86 +405,209 @@ class PhysicsSandbox:
             mass: Masse (kg)
             damping: Coefficient d'amortissement
             duration: Durée de simulation (s)
+            emit_trajectory: Si False, pas d'intégration: seule l'analysis est renvoyée
+            **kwargs: gravity, integrator ("rk4" par défaut, ou "euler")
         """
         try:
             g = kwargs.get('gravity', 9.81)
-            dt = 0.01
-
-            # Angle initial en radians
-            theta = np.radians(angle0_degrees)
-            omega = 0.0  # Vitesse angulaire initiale
-
-            times = []
-            angles = []
-            angular_velocities = []
-            x_positions = []
-            y_positions = []
-            energies = []
-
-            t = 0
-            while t <= duration:
-                times.append(t)
-                angles.append(np.degrees(theta))
-                angular_velocities.append(omega)
-
-                # Position cartésienne
-                x = length * np.sin(theta)
-                y = -length * np.cos(theta)
-                x_positions.append(x)
-                y_positions.append(y)
-
-                # Énergie
-                v = length * abs(omega)
-                kinetic = 0.5 * mass * v**2
-                potential = mass * g * length * (1 - np.cos(theta))
-                total = kinetic + potential
-                energies.append({
-                    "kinetic": kinetic,
-                    "potential": potential,
-                    "total": total,
-                })
-
-                # Mise à jour (méthode d'Euler)
-                alpha = -(g / length) * np.sin(theta) - damping * omega
-                omega += alpha * dt
-                theta += omega * dt
-
-                t += dt
+            integrator = kwargs.get('integrator', 'rk4')
+            if integrator not in _PENDULUM_INTEGRATORS:
+                return {"success": False, "error": f"Unknown integrator: {integrator}"}
+            stepper, dt = _PENDULUM_INTEGRATORS[integrator]
 
             # Période approximative
             if damping == 0:
                 # Approximation petits angles
-                theoretical_period = 2 * np.pi * np.sqrt(length / g)
+                theoretical_period = 2 * math.pi * math.sqrt(length / g)
             else:
                 theoretical_period = None
 
+            parameters = {
+                "length": length,
+                "initial_angle": angle0_degrees,
+                "mass": mass,
+                "damping": damping,
+                "gravity": g,
+                "integrator": integrator,
+                "dt": dt,
+            }
+
+            if not emit_trajectory:
+                # Départ au repos: l'amplitude ne dépasse jamais l'angle initial.
+                # Sans amortissement l'oscillation est symétrique; sinon seul
+                # l'extremum du côté de départ est connu sans intégrer.
+                if damping == 0:
+                    max_angle, min_angle = abs(angle0_degrees), -abs(angle0_degrees)
+                else:
+                    max_angle = angle0_degrees if angle0_degrees >= 0 else None
+                    min_angle = angle0_degrees if angle0_degrees <= 0 else None
+                return {
+                    "success": True,
+                    "type": "pendulum",
+                    "data": {},
+                    "parameters": parameters,
+                    "analysis": {
+                        "theoretical_period": theoretical_period,
+                        "max_angle": max_angle,
+                        "min_angle": min_angle,
+                    },
+                }
+
+            # Intégration séquentielle (noyau JIT), post-traitement vectorisé
+            n = int(duration / dt) + 1
+            theta, omega = stepper(math.radians(angle0_degrees), 0.0,
+                                   g, length, damping, dt, n)
+
+            # Intégration en float64, stockage dans la précision demandée
+            dtype = self._dtype(kwargs)
+            theta, omega = theta.astype(dtype), omega.astype(dtype)
+            t = np.arange(n, dtype=dtype) * dtype(dt)
+            angles = np.degrees(theta)
+
+            # Position cartésienne
+            x = length * np.sin(theta)
+            y = -length * np.cos(theta)
+
+            # Énergie
+            kinetic = 0.5 * mass * (length * omega) ** 2
+            potential = mass * g * length * (1 - np.cos(theta))
+            total = kinetic + potential
+            # Colonnes parallèles, comme le reste du bloc data
+            energies = {
+                "kinetic": _array_to_json(kinetic),
+                "potential": _array_to_json(potential),
+                "total": _array_to_json(total),
+            }
+
             return {
                 "success": True,
                 "type": "pendulum",
                 "data": {
-                    "time": times,
-                    "angle": angles,
-                    "angular_velocity": angular_velocities,
-                    "x": x_positions,
-                    "y": y_positions,
+                    "time": _array_to_json(t),
+                    "angle": _array_to_json(angles),
+                    "angular_velocity": _array_to_json(omega),
+                    "x": _array_to_json(x),
+                    "y": _array_to_json(y),
                     "energy": energies,
                 },
+                "parameters": parameters,
+                "analysis": {
+                    "theoretical_period": theoretical_period,
+                    "max_angle": float(np.max(angles)),
+                    "min_angle": float(np.min(angles)),
+                },
+            }
+
+        except Exception as e:
+            logger.error(f"Error in pendulum simulation: {e}")
+            return {"success": False, "error": str(e)}
+
+    def create_pendulum_simulation_batch(self,
+                                         length=1.0,
+                                         angle0_degrees=45.0,
+                                         mass: float = 1.0,
+                                         damping=0.0,
+                                         duration: float = 10.0,
+                                         **kwargs) -> Dict[str, Any]:
+        """
+        Simule un lot de pendules en une passe (RK4, parallélisé avec numba)
+
+        Chaque ligne des tableaux retournés correspond à un pendule.
+        Les paramètres sont diffusés (broadcast) l'un contre l'autre.
+
+        Args:
+            length: Longueurs (m), scalaire ou tableau [B]
+            angle0_degrees: Angles initiaux (degrés), scalaire ou tableau [B]
+            mass: Masse commune (kg)
+            damping: Coefficients d'amortissement, scalaire ou tableau [B]
+            duration: Durée commune (s)
+        """
+        length, angle0_degrees, damping = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(length, dtype=np.float64)),
+            np.atleast_1d(np.asarray(angle0_degrees, dtype=np.float64)),
+            np.atleast_1d(np.asarray(damping, dtype=np.float64)),
+        )
+        if np.any(length <= 0):
+            return {"success": False, "error": "Pendulum length must be positive"}
+
+        try:
+            g = kwargs.get('gravity', 9.81)
+            dt = _PENDULUM_INTEGRATORS["rk4"][1]
+            n = int(duration / dt) + 1
+
+            theta, omega = _pendulum_batch(np.radians(angle0_degrees), np.ascontiguousarray(length),
+                                           np.ascontiguousarray(damping), g, dt, n)
+
+            dtype = self._dtype(kwargs)
+            theta, omega = theta.astype(dtype), omega.astype(dtype)
+            angles = np.degrees(theta)
+            L = length[:, None].astype(dtype)
+
+            return {
+                "success": True,
+                "type": "pendulum_batch",
+                "data": {
+                    "time": _array_to_json(np.arange(n, dtype=dtype) * dtype(dt)),
+                    "angle": _array_to_json(angles),
+                    "angular_velocity": _array_to_json(omega),
+                    "x": _array_to_json(L * np.sin(theta)),
+                    "y": _array_to_json(-L * np.cos(theta)),
+                },
                 "parameters": {
-                    "length": length,
-                    "initial_angle": angle0_degrees,
+                    "length": length.tolist(),
+                    "initial_angle": angle0_degrees.tolist(),
                     "mass": mass,
-                    "damping": damping,
+                    "damping": damping.tolist(),
                     "gravity": g,
+                    "integrator": "rk4",
+                    "dt": dt,
                 },
                 "analysis": {
-                    "theoretical_period": theoretical_period,
-                    "max_angle": max(angles),
-                    "min_angle": min(angles),
+                    "max_angle": np.max(angles, axis=1).tolist(),
+                    "min_angle": np.min(angles, axis=1).tolist(),
                 },
             }
 
         except Exception as e:
-            logger.error(f"Error in pendulum simulation: {e}")
+            logger.error(f"Error in pendulum batch simulation: {e}")
+            return {"success": False, "error": str(e)}
+
+    def run_batch(self, sim_type: str, param_list: List[Dict[str, Any]],
+                  n_workers: int = None) -> Dict[str, Any]:
+        """
+        Lance un balayage de paramètres en parallèle (un processus par worker)
+
+        Chaque worker crée son propre PhysicsSandbox: seuls le type et les
+        paramètres sont transmis entre processus. Les workers sont lancés en
+        "spawn": un fork après le démarrage des threads numba (prange) peut
+        bloquer le processus.
+
+        Args:
+            sim_type: "projectile", "pendulum", "collision" ou "wave"
+            param_list: Un dict de paramètres par simulation
+            n_workers: Nombre de processus (par défaut: nombre de cœurs)
+        """
+        if sim_type not in _SIMULATIONS:
+            return {"success": False, "error": f"Unknown simulation type: {sim_type}"}
+
+        try:
+            if len(param_list) <= 1 or n_workers == 1:
+                results = [_run_simulation(sim_type, params) for params in param_list]
+            else:
+                context = multiprocessing.get_context("spawn")
+                with ProcessPoolExecutor(max_workers=n_workers, mp_context=context) as pool:
+                    results = list(pool.map(_run_simulation,
+                                            [sim_type] * len(param_list), param_list))
+
+            return {
+                "success": all(r.get("success") for r in results),
+                "type": "batch",
+                "simulation_type": sim_type,
+                "results": results,
+            }
+
+        except Exception as e:
+            logger.error(f"Error in batch simulation: {e}")
             return {"success": False, "error": str(e)}
 
     def create_collision_simulation(self,
@@ -256,6 +620,11 @@ class PhysicsSandbox:
         Args:
             objects: Liste d'objets avec propriétés (position, vitesse, masse)
             duration: Durée de simulation (s)
+
+        Returns:
+            Dict en colonnes: data.time (n_frames), data.ids et data.radius
+            (n_objects), data.x, data.y, data.vx, data.vy de forme
+            (n_frames, n_objects)
         """
         try:
             dt = 0.016  # 60 FPS
@@ -278,58 +647,37 @@ class PhysicsSandbox:
                 )
                 physics_objects.append(obj)
 
+            dtype = self._dtype(kwargs)
+            bodies = BodyArrays.from_objects(physics_objects, dtype)
+            ids = [obj.id for obj in physics_objects]
+
+            # État de chaque pas, une ligne par frame
+            n_steps = int(duration / dt) + 1
+            shape = (n_steps, len(physics_objects))
+            frames_x, frames_y = np.empty(shape, dtype), np.empty(shape, dtype)
+            frames_vx, frames_vy = np.empty(shape, dtype), np.empty(shape, dtype)
+
             # Simuler
-            frames = []
-            t = 0
-
-            while t <= duration:
-                frame_objects = []
-
-                for obj in physics_objects:
-                    if not obj.is_static:
-                        # Appliquer la gravité
-                        obj.vy -= g * dt
-
-                        # Mettre à jour la position
-                        obj.x += obj.vx * dt
-                        obj.y += obj.vy * dt
-
-                        # Collision avec le sol
-                        if obj.y - obj.radius <= 0:
-                            obj.y = obj.radius
-                            obj.vy = -obj.vy * obj.restitution
-
-                        # Collision avec les murs
-                        if obj.x - obj.radius <= 0 or obj.x + obj.radius >= 10:
-                            obj.vx = -obj.vx * obj.restitution
-
-                    frame_objects.append({
-                        "id": obj.id,
-                        "x": obj.x,
-                        "y": obj.y,
-                        "vx": obj.vx,
-                        "vy": obj.vy,
-                        "radius": obj.radius,
-                    })
-
-                # Détecter collisions entre objets
-                for i, obj1 in enumerate(physics_objects):
-                    for j, obj2 in enumerate(physics_objects[i+1:], i+1):
-                        if self._detect_collision(obj1, obj2):
-                            self._resolve_collision(obj1, obj2)
-
-                frames.append({
-                    "time": t,
-                    "objects": frame_objects,
-                })
-
-                t += dt
+            if self.use_jit:
+                simulate_collisions(bodies.x, bodies.y, bodies.vx, bodies.vy, bodies.mass,
+                                    bodies.radius, bodies.restitution, bodies.is_static,
+                                    bodies.is_circle, g, dt, n_steps, 10.0,
+                                    frames_x, frames_y, frames_vx, frames_vy)
+            else:
+                self._simulate_collisions(bodies, g, dt, n_steps,
+                                          frames_x, frames_y, frames_vx, frames_vy)
 
             return {
                 "success": True,
                 "type": "collision",
                 "data": {
-                    "frames": frames,
+                    "time": _array_to_json(np.arange(n_steps) * dt),
+                    "ids": ids,
+                    "radius": _array_to_json(bodies.radius),
+                    "x": _array_to_json(frames_x),
+                    "y": _array_to_json(frames_y),
+                    "vx": _array_to_json(frames_vx),
+                    "vy": _array_to_json(frames_vy),
                     "num_objects": len(objects),
                 },
                 "parameters": {
@@ -359,38 +707,34 @@ class PhysicsSandbox:
             amplitude: Amplitude
             wavelength: Longueur d'onde
             duration: Durée de simulation (s)
+
+        Returns:
+            Dict en colonnes: data.time (n_frames), data.x (n_points) et
+            data.y de forme (n_frames, n_points)
         """
         try:
+            wave_fn = _WAVE_FUNCTIONS.get(wave_type)
+            if wave_fn is None:
+                return {"success": False, "error": f"Unknown wave type: {wave_type}"}
+
             dt = 0.05
-            x_points = np.linspace(0, 10, 100)
-
-            frames = []
-            t = 0
-
-            while t <= duration:
-                if wave_type == "sine":
-                    y_values = amplitude * np.sin(2 * np.pi * (x_points / wavelength - frequency * t))
-                elif wave_type == "square":
-                    y_values = amplitude * np.sign(np.sin(2 * np.pi * (x_points / wavelength - frequency * t)))
-                elif wave_type == "sawtooth":
-                    phase = 2 * np.pi * (x_points / wavelength - frequency * t)
-                    y_values = amplitude * (2 * (phase / (2 * np.pi) - np.floor(phase / (2 * np.pi) + 0.5)))
-                else:
-                    y_values = np.zeros_like(x_points)
+            dtype = self._dtype(kwargs)
+            x_points = np.linspace(0, 10, 100, dtype=dtype)
+            t_arr = np.arange(int(duration / dt) + 1, dtype=dtype) * dtype(dt)
 
-                frames.append({
-                    "time": t,
-                    "x": x_points.tolist(),
-                    "y": y_values.tolist(),
-                })
+            # Toutes les frames d'un coup: matrice de phase (n_frames, n_points)
+            phase = 2 * np.pi * (x_points[np.newaxis, :] / wavelength
+                                 - frequency * t_arr[:, np.newaxis])
 
-                t += dt
+            Y = amplitude * wave_fn(phase)
 
             return {
                 "success": True,
                 "type": "wave",
                 "data": {
-                    "frames": frames,
+                    "time": _array_to_json(t_arr),
+                    "x": _array_to_json(x_points),
+                    "y": _array_to_json(Y),
                 },
                 "parameters": {
                     "wave_type": wave_type,
@@ -405,24 +749,112 @@ class PhysicsSandbox:
             logger.error(f"Error in wave simulation: {e}")
             return {"success": False, "error": str(e)}
 
-    def _detect_collision(self, obj1: PhysicsObject, obj2: PhysicsObject) -> bool:
+    def _simulate_collisions(self, bodies: BodyArrays, g: float, dt: float, n_steps: int,
+                             frames_x: np.ndarray, frames_y: np.ndarray,
+                             frames_vx: np.ndarray, frames_vy: np.ndarray):
+        """Boucle de collisions NumPy (repli sans numba), mêmes sorties que simulate_collisions"""
+        moving = ~bodies.is_static
+
+        for step in range(n_steps):
+            # Intégration vectorisée des objets mobiles
+            vy = bodies.vy[moving] - g * dt
+            x = bodies.x[moving] + bodies.vx[moving] * dt
+            y = bodies.y[moving] + vy * dt
+            vx = bodies.vx[moving]
+            radius = bodies.radius[moving]
+            restitution = bodies.restitution[moving]
+
+            # Collision avec le sol
+            floor = y - radius <= 0
+            y = np.where(floor, radius, y)
+            vy = np.where(floor, -vy * restitution, vy)
+
+            # Collision avec les murs
+            wall = (x - radius <= 0) | (x + radius >= 10)
+            vx = np.where(wall, -vx * restitution, vx)
+
+            bodies.x[moving], bodies.y[moving] = x, y
+            bodies.vx[moving], bodies.vy[moving] = vx, vy
+
+            frames_x[step], frames_y[step] = bodies.x, bodies.y
+            frames_vx[step], frames_vy[step] = bodies.vx, bodies.vy
+
+            # Détecter collisions entre objets (candidats du hachage spatial)
+            for i, j in self._broad_phase_pairs(bodies):
+                if self._detect_collision(bodies, i, j):
+                    self._resolve_collision(bodies, i, j)
+
+    def _broad_phase_pairs(self, bodies: BodyArrays) -> List[Tuple[int, int]]:
+        """
+        Paires candidates à la collision
+
+        Peu de cercles: matrice des distances vectorisée, qui ne renvoie que
+        les contacts. Sinon hachage spatial uniforme: avec des cellules de
+        2 * rayon max, deux cercles en contact sont dans la même cellule ou
+        dans des cellules voisines, seules ces paires sont testées (~O(N) au
+        lieu de O(N²)). Dans les deux cas les paires sont triées pour
+        conserver l'ordre de résolution de la double boucle.
+        """
+        circles = np.flatnonzero(bodies.is_circle)
+        if len(circles) < 2:
+            return []
+
+        if len(circles) < _DENSE_BROAD_PHASE_MAX:
+            # Matrice dense: seules les paires déjà en contact sont renvoyées
+            x, y, r = bodies.x[circles], bodies.y[circles], bodies.radius[circles]
+            dx = x[:, np.newaxis] - x[np.newaxis, :]
+            dy = y[:, np.newaxis] - y[np.newaxis, :]
+            rsum = r[:, np.newaxis] + r[np.newaxis, :]
+            contacts = np.argwhere(np.triu(dx * dx + dy * dy < rsum * rsum, k=1))
+            return [tuple(pair) for pair in circles[contacts].tolist()]
+
+        cell = 2 * float(bodies.radius[circles].max()) or 1.0
+        cx = np.floor(bodies.x[circles] / cell).astype(np.int64).tolist()
+        cy = np.floor(bodies.y[circles] / cell).astype(np.int64).tolist()
+
+        buckets = defaultdict(list)
+        for index, key in zip(circles.tolist(), zip(cx, cy)):
+            buckets[key].append(index)
+
+        pairs = []
+        for (bx, by), members in buckets.items():
+            for k, i in enumerate(members):
+                pairs.extend((i, j) for j in members[k + 1:])
+            # Demi-voisinage: chaque couple de cellules n'est visité qu'une fois
+            for ox, oy in ((1, 0), (0, 1), (1, 1), (1, -1)):
+                neighbours = buckets.get((bx + ox, by + oy))
+                if neighbours:
+                    pairs.extend((i, j) for i in members for j in neighbours)
+
+        return sorted((i, j) if i < j else (j, i) for i, j in pairs)
+
+    def _detect_collision(self, bodies: BodyArrays, i: int, j: int) -> bool:
         """Détecte une collision entre deux objets circulaires"""
-        if obj1.type == "circle" and obj2.type == "circle":
-            dx = obj2.x - obj1.x
-            dy = obj2.y - obj1.y
-            distance = np.sqrt(dx**2 + dy**2)
-            return distance < (obj1.radius + obj2.radius)
+        if bodies.is_circle[i] and bodies.is_circle[j]:
+            # item(): floats Python, sans le coût des scalaires numpy
+            dx = bodies.x.item(j) - bodies.x.item(i)
+            dy = bodies.y.item(j) - bodies.y.item(i)
+            r = bodies.radius.item(i) + bodies.radius.item(j)
+            return dx * dx + dy * dy < r * r
         return False
 
-    def _resolve_collision(self, obj1: PhysicsObject, obj2: PhysicsObject):
-        """Résout une collision élastique entre deux objets"""
-        if obj1.is_static and obj2.is_static:
+    def _resolve_collision(self, bodies: BodyArrays, i: int, j: int):
+        """
+        Résout une collision élastique entre deux objets
+
+        Les objets statiques ont une masse inverse nulle: une seule formule
+        d'impulsion et de séparation couvre tous les cas.
+        """
+        inv_m1 = 0.0 if bodies.is_static[i] else 1.0 / bodies.mass.item(i)
+        inv_m2 = 0.0 if bodies.is_static[j] else 1.0 / bodies.mass.item(j)
+        inv_sum = inv_m1 + inv_m2
+        if inv_sum == 0.0:
             return
 
         # Vecteur de collision
-        dx = obj2.x - obj1.x
-        dy = obj2.y - obj1.y
-        distance = np.sqrt(dx**2 + dy**2)
+        dx = bodies.x.item(j) - bodies.x.item(i)
+        dy = bodies.y.item(j) - bodies.y.item(i)
+        distance = math.hypot(dx, dy)
 
         if distance == 0:
             return
@@ -431,49 +863,33 @@ class PhysicsSandbox:
         nx = dx / distance
         ny = dy / distance
 
-        # Vitesse relative
-        dvx = obj2.vx - obj1.vx
-        dvy = obj2.vy - obj1.vy
-
         # Vitesse relative selon la normale
-        dvn = dvx * nx + dvy * ny
+        dvn = ((bodies.vx.item(j) - bodies.vx.item(i)) * nx
+               + (bodies.vy.item(j) - bodies.vy.item(i)) * ny)
 
         # Ne rien faire si les objets s'éloignent
         if dvn >= 0:
             return
 
         # Coefficient de restitution moyen
-        e = (obj1.restitution + obj2.restitution) / 2
+        e = (bodies.restitution.item(i) + bodies.restitution.item(j)) / 2
 
         # Impulsion
-        if obj1.is_static:
-            obj2.vx -= (1 + e) * dvn * nx
-            obj2.vy -= (1 + e) * dvn * ny
-        elif obj2.is_static:
-            obj1.vx += (1 + e) * dvn * nx
-            obj1.vy += (1 + e) * dvn * ny
-        else:
-            j = -(1 + e) * dvn / (1/obj1.mass + 1/obj2.mass)
-
-            obj1.vx -= j * nx / obj1.mass
-            obj1.vy -= j * ny / obj1.mass
-            obj2.vx += j * nx / obj2.mass
-            obj2.vy += j * ny / obj2.mass
-
-        # Séparer les objets
-        overlap = (obj1.radius + obj2.radius) - distance
+        impulse = -(1 + e) * dvn / inv_sum
+        bodies.vx[i] -= impulse * nx * inv_m1
+        bodies.vy[i] -= impulse * ny * inv_m1
+        bodies.vx[j] += impulse * nx * inv_m2
+        bodies.vy[j] += impulse * ny * inv_m2
+
+        # Séparer les objets, au prorata des masses inverses
+        overlap = (bodies.radius.item(i) + bodies.radius.item(j)) - distance
         if overlap > 0:
-            if obj1.is_static:
-                obj2.x += nx * overlap
-                obj2.y += ny * overlap
-            elif obj2.is_static:
-                obj1.x -= nx * overlap
-                obj1.y -= ny * overlap
-            else:
-                obj1.x -= nx * overlap / 2
-                obj1.y -= ny * overlap / 2
-                obj2.x += nx * overlap / 2
-                obj2.y += ny * overlap / 2
+            share1 = overlap * inv_m1 / inv_sum
+            share2 = overlap * inv_m2 / inv_sum
+            bodies.x[i] -= nx * share1
+            bodies.y[i] -= ny * share1
+            bodies.x[j] += nx * share2
+            bodies.y[j] += ny * share2
 
     def execute(self, query: str, parameters: Dict[str, Any] = None) -> Dict[str, Any]:
         """
@@ -4,10 +4,14 @@ Circuits, composants, analyse de signaux, filtres, etc.
 """
 
 import numpy as np
-import sympy as sp
-from sympy import symbols, sqrt, pi, I, exp, sin, cos, atan, log
-from typing import Dict, Any, Optional, List, Union
+from functools import lru_cache
+from typing import Dict, Any, Mapping, NamedTuple, Optional, List, Union
 import logging
+import math
+import operator
+import re
+import sys
+from types import MappingProxyType
 
 from modules.base_module import BaseModule
 
@@ -15,21 +19,312 @@ from modules.base_module import BaseModule
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_TWO_PI = 2.0 * math.pi
+
+# Types traités par les chemins scalaires (math); le reste est vectorisé
+_SCALARS = (int, float, np.number)
+
+# Tables de formules et d'unités partagées par tous les résultats (jamais
+# reconstruites à l'appel). En lecture seule: les réponses en reçoivent une
+# copie (_table), qu'un appelant peut modifier sans altérer les suivantes
+_OHM_UNITS = MappingProxyType({"V": "Volts", "I": "Amperes", "R": "Ohms"})
+_POWER_FORMULAS = ("P = V × I", "P = I² × R", "P = V²/R")
+_SERIES_RLC_UNITS = MappingProxyType({"magnitude": "Ohms", "magnitude_db": "dBΩ", "phase": "rad"})
+_OP_AMP_TYPES = ("inverting", "non-inverting", "summing", "integrator")
+_TRANSISTOR_TYPES = ("BJT", "FET", "MOSFET")
+_TRANSISTOR_PARAMETERS = ("beta", "V_BE", "I_C", "V_CE")
+_RC_FORMULAS = MappingProxyType({"tau": "τ = R × C", "f_c": "f_c = 1/(2π × τ)"})
+_RC_UNITS = MappingProxyType({"tau": "seconds", "f_c": "Hertz", "omega_c": "rad/s"})
+_RL_FORMULAS = MappingProxyType({"tau": "τ = L/R", "f_c": "f_c = R/(2πL)"})
+_RL_UNITS = MappingProxyType({"tau": "seconds", "f_c": "Hertz"})
+_RLC_FORMULAS = MappingProxyType({
+    "f_0": "f₀ = 1/(2π√(LC))",
+    "Q": "Q = ω₀L/R",
+    "ζ": "ζ = R/(2√(L/C))"
+})
+
+
+def _table(value):
+    """Copie modifiable (dict, list) d'une table partagée; autres valeurs inchangées"""
+    if isinstance(value, MappingProxyType):
+        return dict(value)
+    if isinstance(value, tuple):
+        return list(value)
+    return value
+
+# Grandeurs dont la présence rend un résultat plausible (validate_result)
+_NUMERIC_KEYS = frozenset({"voltage", "current", "power", "impedance", "frequency"})
+
+# Régimes d'amortissement indexés par (ζ >= 1) + (ζ > 1)
+_DAMPING_TYPES = ("sous-amorti (oscillant)", "critique", "sur-amorti")
+
+
+def _impedance_parts(real, imag: np.ndarray) -> Dict[str, Any]:
+    """
+    Impédance complexe en parties réelle et imaginaire (JSON-sérialisables)
+
+    Construite sans passer par le type complexe: j·∞ donnerait une partie
+    réelle NaN pour un condensateur en continu.
+    """
+    return {"real": np.broadcast_to(real, np.shape(imag)).tolist(), "imag": imag.tolist()}
+
+
+def _parameters(*keys):
+    """Clés requises d'un calcul (frozenset) et leur extracteur (itemgetter)"""
+    return frozenset(keys), operator.itemgetter(*keys)
+
+
+_RC_REQ, _RC_GET = _parameters("resistance", "capacitance")
+_RL_REQ, _RL_GET = _parameters("resistance", "inductance")
+_RLC_REQ, _RLC_GET = _parameters("resistance", "inductance", "capacitance")
+_LC_REQ, _LC_GET = _parameters("inductance", "capacitance")
+_DIVIDER_REQ, _DIVIDER_GET = _parameters("R1", "R2", "V_in")
+_OP_AMP_REQ, _OP_AMP_GET = _parameters("R1", "R2")
+
+
+# Noyaux arithmétiques purs des méthodes scalaires. Pas de numba ici: sur
+# des scalaires Python, l'appel d'une fonction compilée coûte autant que le
+# calcul lui-même, et l'import de numba pèserait sur le démarrage
+def _rc_core(R: float, C: float):
+    """Constante de temps, pulsation et fréquence de coupure d'un circuit RC"""
+    tau = R * C
+    omega_c = 1 / tau
+    return tau, omega_c, omega_c / _TWO_PI
+
+
+# Mémorisé: un même (R, L, C) revient souvent d'un appel à l'autre quand
+# l'utilisateur ne fait varier qu'un paramètre (clé exacte, sans arrondi)
+@lru_cache(maxsize=64)
+def _rlc_core(R: float, L: float, C: float):
+    """Pulsation et fréquence de résonance, facteur de qualité, amortissement"""
+    # Une seule racine: √(L/C) = L/√(LC)
+    sqrt_LC = math.sqrt(L * C)
+    omega_0 = 1 / sqrt_LC
+    # Circuit LC idéal (R = 0): aucune perte, facteur de qualité infini
+    Q = omega_0 * L / R if R else math.inf
+    return omega_0, omega_0 / _TWO_PI, Q, R * sqrt_LC / (2 * L)
+
+
+def _divider_core(R1: float, R2: float, V_in: float):
+    """Tension de sortie et rapport d'un diviseur de tension"""
+    ratio = R2 / (R1 + R2)
+    return V_in * ratio, ratio
+
+
+# Suppression des accents (requêtes et tables de mots-clés): une seule forme
+# par mot, "Résistance" et "resistance" se confondent
+_ACCENTS = str.maketrans(
+    "àâäçéèêëîïôöûùüÿñÀÂÄÇÉÈÊËÎÏÔÖÛÙÜŸÑ",
+    "aaaceeeeiioouuuynAAACEEEEIIOOUUUYN",
+)
+
+# Mots-clés français et anglais pour l'électronique (sans accents)
+_KEYWORD_WEIGHTS = {
+    # Termes généraux
+    'electronique': 0.95, 'electronic': 0.95, 'electrique': 0.9, 'electric': 0.9,
+
+    # Circuits - IMPORTANT pour "Circuit RC"
+    'circuit': 0.95, 'schema': 0.85,
+    'analyser': 0.7, 'analyze': 0.7, 'simuler': 0.8, 'simulate': 0.8,
+
+    # Composants passifs
+    'resistance': 0.9, 'resistor': 0.9,
+    'condensateur': 0.9, 'capacitor': 0.9, 'capacitance': 0.9, 'capacite': 0.85,
+    'inducteur': 0.9, 'inductor': 0.9, 'inductance': 0.9, 'bobine': 0.85,
+
+    # Grandeurs électriques
+    'voltage': 0.9, 'tension': 0.9, 'volt': 0.9, 'v': 0.5,
+    'courant': 0.9, 'current': 0.9, 'ampere': 0.9, 'a': 0.5,
+    'ohm': 0.9, 'ω': 0.85, 'ohms': 0.9,
+    'puissance': 0.8, 'power': 0.8, 'watt': 0.85, 'w': 0.5,
+
+    # Composants actifs
+    'transistor': 0.95, 'bjt': 0.95, 'fet': 0.95, 'mosfet': 0.95,
+    'diode': 0.95, 'led': 0.9,
+    'amplificateur': 0.9, 'amplifier': 0.9, 'op-amp': 0.95, 'aop': 0.95,
+
+    # Filtres et fréquences
+    'filtre': 0.9, 'filter': 0.9,
+    'frequence': 0.8, 'frequency': 0.8, 'hz': 0.7, 'hertz': 0.8,
+    'bode': 0.95, 'nyquist': 0.95,
+
+    # Impédance et résonance
+    'impedance': 0.9,
+    'resonance': 0.9, 'resonant': 0.85,
+
+    # Analyse AC/DC
+    'alternatif': 0.8, 'ac': 0.7, 'continu': 0.7, 'dc': 0.7,
+    'sinusoidal': 0.8,
+
+    # Logique digitale
+    'logique': 0.8, 'logic': 0.8, 'digital': 0.8, 'numerique': 0.8,
+}
+
+_KEYWORD_SET = frozenset(_KEYWORD_WEIGHTS)
+_TOP_WEIGHT = max(_KEYWORD_WEIGHTS.values())
+_TOP_KEYWORDS = frozenset(k for k, w in _KEYWORD_WEIGHTS.items() if w == _TOP_WEIGHT)
+
+# Mots de la requête: lettres (et tirets, pour "op-amp"), sans les chiffres,
+# de sorte que "12V" ou "100Ω" donnent les unités "v" et "ω"
+_TOKEN_RE = re.compile(r"(?:[^\W\d_]|-)+")
+
+# Composants électroniques en notation abrégée
+_COMPONENT_RE = re.compile(r"\b(?:rc|rl|rlc|bjt|fet|mosfet|cmos)\b", re.IGNORECASE)
+
+# Règles de détection du type de calcul, par ordre de priorité: chaque règle
+# est une conjonction de groupes de mots (un mot quelconque du groupe suffit),
+# écrits sans accents comme la requête normalisée
+_OHM_WORDS = ("ohm", "resistance", "voltage", "current")
+_CALCULATION_RULES = (
+    ("divider", (_OHM_WORDS, ("divider", "diviseur"))),
+    ("ohms_law", (_OHM_WORDS,)),
+    ("power", (("power", "puissance", "watt"),)),
+    ("rc_circuit", (("rc",), ("circuit",))),
+    ("rl_circuit", (("rl",), ("circuit",))),
+    ("rlc_circuit", (("rlc", "resonance"),)),
+    ("filter", (("filter", "filtre", "low pass", "high pass", "band pass"),)),
+    ("impedance", (("impedance", "reactance"),)),
+    ("op_amp", (("op-amp", "op amp", "operational amplifier", "amplificateur"),)),
+    ("resonance", (("resonance",),)),
+    ("transistor", (("transistor", "bjt", "fet", "mosfet"),)),
+)
+
+
+def _alternation(words) -> str:
+    """Alternative regex, les mots les plus longs d'abord"""
+    return "|".join(re.escape(w) for w in sorted(words, key=len, reverse=True))
+
+
+def _rule_classifier(rules):
+    """
+    Compile des règles ordonnées en un classifieur à une seule regex ancrée
+
+    Chaque règle devient un groupe fait de lookaheads: la première règle
+    satisfaite gagne et lastindex donne son rang. Les noms renvoyés sont
+    internés, comme les clés des tables de dispatch qui les reçoivent.
+    """
+    pattern = re.compile(
+        r"\A(?:" + "|".join(
+            "(" + "".join(f"(?=.*?(?:{_alternation(words)}))" for words in clauses) + ")"
+            for _, clauses in rules
+        ) + ")",
+        re.IGNORECASE | re.DOTALL,
+    )
+    names = tuple(sys.intern(name) for name, _ in rules)
+
+    def classify(query: str, default: Optional[str] = None) -> Optional[str]:
+        match = pattern.match(query)
+        return names[match.lastindex - 1] if match else default
+
+    return classify
+
+
+_classify_calculation = _rule_classifier(_CALCULATION_RULES)
+
+_classify_filter = _rule_classifier((
+    ("low_pass", (("low pass", "passe-bas"),)),
+    ("high_pass", (("high pass", "passe-haut"),)),
+    ("band_pass", (("band pass", "passe-bande"),)),
+))
+
+# "non-inverting" contient "inverting": tester la forme longue d'abord
+_classify_op_amp = _rule_classifier((
+    ("non_inverting", (("non-inverting", "non inverseur"),)),
+    ("inverting", (("inverting", "inverseur"),)),
+))
+
+_GENERAL = sys.intern("general")
+
+
+class RCAnalysis(NamedTuple):
+    """Analyse d'un circuit RC"""
+    time_constant: float
+    cutoff_frequency: float
+    angular_frequency: float
+    resistance: float
+    capacitance: float
+    formulas: Mapping[str, str] = _RC_FORMULAS
+    units: Mapping[str, str] = _RC_UNITS
+
+
+class RLAnalysis(NamedTuple):
+    """Analyse d'un circuit RL"""
+    time_constant: float
+    cutoff_frequency: float
+    resistance: float
+    inductance: float
+    formulas: Mapping[str, str] = _RL_FORMULAS
+    units: Mapping[str, str] = _RL_UNITS
+
+
+class RLCAnalysis(NamedTuple):
+    """Analyse d'un circuit RLC"""
+    resonance_frequency: float
+    angular_frequency: float
+    quality_factor: float
+    damping_ratio: float
+    damping_type: str
+    resistance: float
+    inductance: float
+    capacitance: float
+    formulas: Mapping[str, str] = _RLC_FORMULAS
+
+
+class ResonanceAnalysis(NamedTuple):
+    """Résonance d'un circuit LC"""
+    resonance_frequency: float
+    angular_frequency: float
+    inductance: float
+    capacitance: float
+    formula: str = "f₀ = 1/(2π√(LC))"
+
+
+class DividerAnalysis(NamedTuple):
+    """Diviseur de tension"""
+    V_out: float
+    V_in: float
+    R1: float
+    R2: float
+    formula: str = "V_out = V_in × R2/(R1 + R2)"
+    ratio: float = 0.0
+
+
+# Résultats typés, convertis en dict seulement à la sortie de execute
+_ANALYSES = (RCAnalysis, RLAnalysis, RLCAnalysis, ResonanceAnalysis, DividerAnalysis)
+
 
 class ElectronicsModule(BaseModule):
     """Module d'électronique avancée"""
 
+    # Partagés par toutes les instances (tuples et vue en lecture seule)
+    CAPABILITIES = (
+        "ohms_law", "circuit_analysis", "filters", "amplifiers",
+        "transistors", "operational_amplifiers", "digital_logic",
+        "signal_processing", "impedance", "resonance", "power_electronics",
+        "ac_dc_analysis", "frequency_response", "bode_plots"
+    )
+    SUPPORTED_COMPONENTS = ("resistor", "capacitor", "inductor", "diode", "transistor", "op-amp")
+    METADATA = MappingProxyType({
+        "description": "Module d'électronique avec analyse de circuits et composants",
+        "supported_components": SUPPORTED_COMPONENTS
+    })
+
     def __init__(self):
         super().__init__("Electronics", "1.0.0")
-        self.capabilities = [
-            "ohms_law", "circuit_analysis", "filters", "amplifiers",
-            "transistors", "operational_amplifiers", "digital_logic",
-            "signal_processing", "impedance", "resonance", "power_electronics",
-            "ac_dc_analysis", "frequency_response", "bode_plots"
-        ]
-        self.metadata = {
-            "description": "Module d'électronique avec analyse de circuits et composants",
-            "supported_components": ["resistor", "capacitor", "inductor", "diode", "transistor", "op-amp"]
+        self.capabilities = self.CAPABILITIES
+        self.metadata = dict(self.METADATA)
+        self._handlers = {
+            "ohms_law": self._ohms_law,
+            "power": self._power_calculation,
+            "rc_circuit": self._rc_circuit,
+            "rl_circuit": self._rl_circuit,
+            "rlc_circuit": self._rlc_circuit,
+            "filter": self._filter_design,
+            "impedance": self._impedance_calculation,
+            "op_amp": self._op_amp_circuit,
+            "divider": self._voltage_divider,
+            "resonance": self._resonance_calculation,
+            "transistor": self._transistor_analysis,
         }
 
     def initialize(self) -> bool:
@@ -44,64 +339,20 @@ class ElectronicsModule(BaseModule):
 
     def can_handle(self, query: str) -> float:
         """Détermine si ce module peut gérer une requête électronique"""
-        query_lower = query.lower()
-        score = 0.0
-
-        # Mots-clés français et anglais pour l'électronique
-        electronics_keywords = {
-            # Termes généraux
-            'électronique': 0.95, 'electronic': 0.95, 'électrique': 0.9, 'electric': 0.9,
-
-            # Circuits - IMPORTANT pour "Circuit RC"
-            'circuit': 0.95, 'schéma': 0.85, 'schema': 0.85,
-            'analyser': 0.7, 'analyze': 0.7, 'simuler': 0.8, 'simulate': 0.8,
-
-            # Composants passifs
-            'résistance': 0.9, 'resistance': 0.9, 'resistor': 0.9, 'résistor': 0.9,
-            'condensateur': 0.9, 'capacitor': 0.9, 'capacitance': 0.9, 'capacité': 0.85,
-            'inducteur': 0.9, 'inductor': 0.9, 'inductance': 0.9, 'bobine': 0.85,
-
-            # Grandeurs électriques
-            'voltage': 0.9, 'tension': 0.9, 'volt': 0.9, 'v': 0.5,
-            'courant': 0.9, 'current': 0.9, 'ampere': 0.9, 'ampère': 0.9, 'a': 0.5,
-            'ohm': 0.9, 'ω': 0.85, 'ohms': 0.9,
-            'puissance': 0.8, 'power': 0.8, 'watt': 0.85, 'w': 0.5,
-
-            # Composants actifs
-            'transistor': 0.95, 'bjt': 0.95, 'fet': 0.95, 'mosfet': 0.95,
-            'diode': 0.95, 'led': 0.9,
-            'amplificateur': 0.9, 'amplifier': 0.9, 'op-amp': 0.95, 'aop': 0.95,
-
-            # Filtres et fréquences
-            'filtre': 0.9, 'filter': 0.9,
-            'fréquence': 0.8, 'frequency': 0.8, 'hz': 0.7, 'hertz': 0.8,
-            'bode': 0.95, 'nyquist': 0.95,
-
-            # Impédance et résonance
-            'impédance': 0.9, 'impedance': 0.9,
-            'résonance': 0.9, 'resonance': 0.9, 'résonant': 0.85,
-
-            # Analyse AC/DC
-            'alternatif': 0.8, 'ac': 0.7, 'continu': 0.7, 'dc': 0.7,
-            'sinusoïdal': 0.8, 'sinusoidal': 0.8,
-
-            # Logique digitale
-            'logique': 0.8, 'logic': 0.8, 'digital': 0.8, 'numérique': 0.8,
-        }
+        tokens = set(_TOKEN_RE.findall(query.lower().translate(_ACCENTS)))
+        # Pluriels: "circuits" -> "circuit"
+        tokens.update([t[:-1] for t in tokens if t.endswith("s")])
 
-        # Vérifier les mots-clés
-        for keyword, weight in electronics_keywords.items():
-            if keyword in query_lower:
-                score = max(score, weight)
+        # Poids maximal atteint: inutile de chercher plus loin
+        if not _TOP_KEYWORDS.isdisjoint(tokens):
+            return _TOP_WEIGHT
 
-        # Composants électroniques spécifiques (notation abrégée)
-        components = ['rc', 'rl', 'rlc', 'bjt', 'fet', 'mosfet', 'cmos']
-        for comp in components:
-            # Chercher le composant en tant que mot complet ou avec espace
-            if f' {comp} ' in f' {query_lower} ' or f'{comp},' in query_lower:
-                score = max(score, 0.95)
+        # Composants électroniques spécifiques (notation abrégée, mot complet)
+        if _COMPONENT_RE.search(query):
+            return _TOP_WEIGHT
 
-        return min(score, 1.0)
+        hits = _KEYWORD_SET.intersection(tokens)
+        return max((_KEYWORD_WEIGHTS[k] for k in hits), default=0.0)
 
     def execute(self, query: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -122,30 +373,10 @@ class ElectronicsModule(BaseModule):
             logger.info(f"Type de calcul détecté: {calc_type}")
 
             # Router vers la bonne méthode
-            if calc_type == "ohms_law":
-                result = self._ohms_law(query, context)
-            elif calc_type == "power":
-                result = self._power_calculation(query, context)
-            elif calc_type == "rc_circuit":
-                result = self._rc_circuit(query, context)
-            elif calc_type == "rl_circuit":
-                result = self._rl_circuit(query, context)
-            elif calc_type == "rlc_circuit":
-                result = self._rlc_circuit(query, context)
-            elif calc_type == "filter":
-                result = self._filter_design(query, context)
-            elif calc_type == "impedance":
-                result = self._impedance_calculation(query, context)
-            elif calc_type == "op_amp":
-                result = self._op_amp_circuit(query, context)
-            elif calc_type == "divider":
-                result = self._voltage_divider(query, context)
-            elif calc_type == "resonance":
-                result = self._resonance_calculation(query, context)
-            elif calc_type == "transistor":
-                result = self._transistor_analysis(query, context)
-            else:
-                result = self._general_electronics(query, context)
+            handler = self._handlers.get(calc_type, self._general_electronics)
+            result = handler(query, context)
+            if isinstance(result, _ANALYSES):
+                result = {key: _table(value) for key, value in result._asdict().items()}
 
             return {
                 "success": True,
@@ -164,32 +395,7 @@ class ElectronicsModule(BaseModule):
 
     def _detect_calculation_type(self, query: str) -> str:
         """Détecte le type de calcul électronique"""
-        query_lower = query.lower()
-
-        if any(word in query_lower for word in ["ohm", "resistance", "résistance", "voltage", "current"]):
-            if "divider" in query_lower or "diviseur" in query_lower:
-                return "divider"
-            return "ohms_law"
-        elif any(word in query_lower for word in ["power", "puissance", "watt"]):
-            return "power"
-        elif "rc" in query_lower and "circuit" in query_lower:
-            return "rc_circuit"
-        elif "rl" in query_lower and "circuit" in query_lower:
-            return "rl_circuit"
-        elif "rlc" in query_lower or "resonance" in query_lower or "résonance" in query_lower:
-            return "rlc_circuit"
-        elif any(word in query_lower for word in ["filter", "filtre", "low pass", "high pass", "band pass"]):
-            return "filter"
-        elif any(word in query_lower for word in ["impedance", "impédance", "reactance"]):
-            return "impedance"
-        elif any(word in query_lower for word in ["op-amp", "op amp", "operational amplifier", "amplificateur"]):
-            return "op_amp"
-        elif "resonance" in query_lower or "résonance" in query_lower:
-            return "resonance"
-        elif any(word in query_lower for word in ["transistor", "bjt", "fet", "mosfet"]):
-            return "transistor"
-        else:
-            return "general"
+        return _classify_calculation(query.translate(_ACCENTS), _GENERAL)
 
     def _ohms_law(self, query: str, context: Optional[Dict] = None) -> Dict[str, Any]:
         """Calculs de la loi d'Ohm: V = IR"""
@@ -207,7 +413,7 @@ class ElectronicsModule(BaseModule):
                 "voltage": V,
                 "current": I,
                 "formula": "R = V/I",
-                "units": {"R": "Ohms", "V": "Volts", "I": "Amperes"}
+                "units": _table(_OHM_UNITS)
             }
         elif "voltage" in context and "resistance" in context:
             V = context["voltage"]
@@ -219,7 +425,7 @@ class ElectronicsModule(BaseModule):
                 "voltage": V,
                 "resistance": R,
                 "formula": "I = V/R",
-                "units": {"I": "Amperes", "V": "Volts", "R": "Ohms"}
+                "units": _table(_OHM_UNITS)
             }
         elif "current" in context and "resistance" in context:
             I = context["current"]
@@ -231,7 +437,7 @@ class ElectronicsModule(BaseModule):
                 "current": I,
                 "resistance": R,
                 "formula": "V = I × R",
-                "units": {"V": "Volts", "I": "Amperes", "R": "Ohms"}
+                "units": _table(_OHM_UNITS)
             }
 
         return {"error": "Insufficient parameters for Ohm's law"}
@@ -240,7 +446,7 @@ class ElectronicsModule(BaseModule):
         """Calculs de puissance électrique"""
         if not context:
             return {
-                "formulas": ["P = V × I", "P = I² × R", "P = V²/R"],
+                "formulas": _table(_POWER_FORMULAS),
                 "description": "Calculs de puissance électrique"
             }
 
@@ -284,124 +490,103 @@ class ElectronicsModule(BaseModule):
 
         return {"error": "Insufficient parameters for power calculation"}
 
-    def _rc_circuit(self, query: str, context: Optional[Dict] = None) -> Dict[str, Any]:
+    def _rc_circuit(self, query: str, context: Optional[Dict] = None) -> Union[RCAnalysis, Dict[str, Any]]:
         """Analyse de circuits RC"""
-        if not context or not all(k in context for k in ['resistance', 'capacitance']):
+        if not context or not _RC_REQ.issubset(context):
             return {"error": "Need resistance and capacitance values"}
 
-        R = context['resistance']
-        C = context['capacitance']
+        R, C = _RC_GET(context)
 
-        # Constante de temps
-        tau = R * C
+        # Constante de temps, pulsation et fréquence de coupure
+        tau, omega_c, f_c = _rc_core(R, C)
 
-        # Fréquence de coupure
-        f_c = 1 / (2 * np.pi * tau)
-
-        # Pulsation de coupure
-        omega_c = 1 / tau
-
-        return {
-            "time_constant": tau,
-            "cutoff_frequency": f_c,
-            "angular_frequency": omega_c,
-            "resistance": R,
-            "capacitance": C,
-            "formulas": {
-                "tau": "τ = R × C",
-                "f_c": "f_c = 1/(2π × τ)"
-            },
-            "units": {
-                "tau": "seconds",
-                "f_c": "Hertz",
-                "omega_c": "rad/s"
-            }
-        }
+        return RCAnalysis(tau, f_c, omega_c, R, C)
 
-    def _rl_circuit(self, query: str, context: Optional[Dict] = None) -> Dict[str, Any]:
+    def _rl_circuit(self, query: str, context: Optional[Dict] = None) -> Union[RLAnalysis, Dict[str, Any]]:
         """Analyse de circuits RL"""
-        if not context or not all(k in context for k in ['resistance', 'inductance']):
+        if not context or not _RL_REQ.issubset(context):
             return {"error": "Need resistance and inductance values"}
 
-        R = context['resistance']
-        L = context['inductance']
+        R, L = _RL_GET(context)
 
         # Constante de temps
         tau = L / R
 
         # Fréquence de coupure
-        f_c = R / (2 * np.pi * L)
+        f_c = R / (_TWO_PI * L)
 
-        return {
-            "time_constant": tau,
-            "cutoff_frequency": f_c,
-            "resistance": R,
-            "inductance": L,
-            "formulas": {
-                "tau": "τ = L/R",
-                "f_c": "f_c = R/(2πL)"
-            },
-            "units": {
-                "tau": "seconds",
-                "f_c": "Hertz"
-            }
-        }
+        return RLAnalysis(tau, f_c, R, L)
 
-    def _rlc_circuit(self, query: str, context: Optional[Dict] = None) -> Dict[str, Any]:
+    def _rlc_circuit(self, query: str, context: Optional[Dict] = None) -> Union[RLCAnalysis, Dict[str, Any]]:
         """Analyse de circuits RLC"""
-        if not context or not all(k in context for k in ['resistance', 'inductance', 'capacitance']):
+        if not context or not _RLC_REQ.issubset(context):
             return {"error": "Need R, L, and C values"}
 
-        R = context['resistance']
-        L = context['inductance']
-        C = context['capacitance']
+        R, L, C = _RLC_GET(context)
+
+        # Balayage de paramètres: calcul vectorisé
+        if not (isinstance(R, _SCALARS) and isinstance(L, _SCALARS) and isinstance(C, _SCALARS)):
+            batch = self._rlc_circuit_batch(R, L, C)
+            if not batch.get("success", True):
+                return {"error": batch["error"]}
+            return {
+                "resonance_frequency": batch["resonance_frequency"].tolist(),
+                "angular_frequency": batch["angular_frequency"].tolist(),
+                "quality_factor": batch["quality_factor"].tolist(),
+                "damping_ratio": batch["damping_ratio"].tolist(),
+                "damping_type": [_DAMPING_TYPES[i] for i in batch["damping_index"].tolist()],
+                "resistance": batch["resistance"].tolist(),
+                "inductance": batch["inductance"].tolist(),
+                "capacitance": batch["capacitance"].tolist(),
+                "formulas": _table(_RLC_FORMULAS)
+            }
+
+        if L <= 0 or C <= 0:
+            return {"error": "Inductance and capacitance must be positive"}
+
+        # Résonance, facteur de qualité et coefficient d'amortissement
+        omega_0, f_0, Q, zeta = _rlc_core(R, L, C)
+
+        # Type d'amortissement: 0 sous-amorti, 1 critique, 2 sur-amorti
+        damping_type = _DAMPING_TYPES[(zeta >= 1) + (zeta > 1)]
+
+        return RLCAnalysis(f_0, omega_0, Q, zeta, damping_type, R, L, C)
 
-        # Fréquence de résonance
-        f_0 = 1 / (2 * np.pi * np.sqrt(L * C))
-        omega_0 = 1 / np.sqrt(L * C)
+    def _rlc_circuit_batch(self, R, L, C) -> Dict[str, np.ndarray]:
+        """
+        Analyse RLC vectorisée sur des tableaux de R, L, C (diffusés)
 
-        # Facteur de qualité
-        Q = omega_0 * L / R
+        Returns:
+            Dictionnaire de tableaux (une colonne par grandeur); damping_index
+            indexe _DAMPING_TYPES. {"success": False, "error": ...} si un
+            composant n'est pas physique.
+        """
+        R, L, C = np.broadcast_arrays(*(np.asarray(v, dtype=np.float64) for v in (R, L, C)))
+        if np.any(L <= 0) or np.any(C <= 0) or np.any(R < 0):
+            return {"success": False, "error": "Inductance and capacitance must be positive, resistance non-negative"}
 
-        # Coefficient d'amortissement
-        zeta = R / (2 * np.sqrt(L / C))
+        sqrt_LC = np.sqrt(L * C)
+        omega_0 = 1 / sqrt_LC
+        zeta = R * sqrt_LC / (2 * L)
 
-        # Type d'amortissement
-        if zeta < 1:
-            damping_type = "sous-amorti (oscillant)"
-        elif zeta == 1:
-            damping_type = "critique"
-        else:
-            damping_type = "sur-amorti"
+        # Circuits LC idéaux (R = 0): Q infini, comme le chemin scalaire
+        with np.errstate(divide='ignore'):
+            Q = omega_0 * L / R
 
         return {
-            "resonance_frequency": f_0,
+            "resonance_frequency": omega_0 / _TWO_PI,
             "angular_frequency": omega_0,
             "quality_factor": Q,
             "damping_ratio": zeta,
-            "damping_type": damping_type,
+            "damping_index": (zeta >= 1).astype(np.int8) + (zeta > 1),
             "resistance": R,
             "inductance": L,
             "capacitance": C,
-            "formulas": {
-                "f_0": "f₀ = 1/(2π√(LC))",
-                "Q": "Q = ω₀L/R",
-                "ζ": "ζ = R/(2√(L/C))"
-            }
         }
 
     def _filter_design(self, query: str, context: Optional[Dict] = None) -> Dict[str, Any]:
         """Design de filtres"""
-        query_lower = query.lower()
-
-        if "low pass" in query_lower or "passe-bas" in query_lower:
-            filter_type = "low_pass"
-        elif "high pass" in query_lower or "passe-haut" in query_lower:
-            filter_type = "high_pass"
-        elif "band pass" in query_lower or "passe-bande" in query_lower:
-            filter_type = "band_pass"
-        else:
-            filter_type = "unknown"
+        filter_type = _classify_filter(query, "unknown")
 
         if not context or "cutoff_frequency" not in context:
             return {
@@ -415,7 +600,7 @@ class ElectronicsModule(BaseModule):
             # Filtre RC passe-bas simple
             if "resistance" in context:
                 R = context["resistance"]
-                C = 1 / (2 * np.pi * f_c * R)
+                C = 1 / (_TWO_PI * f_c * R)
 
                 return {
                     "filter_type": "RC Low-Pass",
@@ -430,7 +615,7 @@ class ElectronicsModule(BaseModule):
             # Filtre RC passe-haut simple
             if "resistance" in context:
                 R = context["resistance"]
-                C = 1 / (2 * np.pi * f_c * R)
+                C = 1 / (_TWO_PI * f_c * R)
 
                 return {
                     "filter_type": "RC High-Pass",
@@ -444,16 +629,21 @@ class ElectronicsModule(BaseModule):
         return {"filter_type": filter_type, "cutoff_frequency": f_c}
 
     def _impedance_calculation(self, query: str, context: Optional[Dict] = None) -> Dict[str, Any]:
-        """Calculs d'impédance"""
+        """
+        Calculs d'impédance
+
+        La fréquence peut être un scalaire ou un balayage (array-like): les
+        réactances sont alors calculées en une passe vectorisée.
+        """
         if not context or "frequency" not in context:
             return {"error": "Need frequency for impedance calculation"}
 
-        f = context["frequency"]
-        omega = 2 * np.pi * f
+        f = np.asarray(context["frequency"], dtype=np.float64)
+        omega = _TWO_PI * f
 
         results = {
-            "frequency": f,
-            "angular_frequency": omega,
+            "frequency": f.tolist(),
+            "angular_frequency": omega.tolist(),
             "impedances": {}
         }
 
@@ -462,18 +652,19 @@ class ElectronicsModule(BaseModule):
             R = context["resistance"]
             results["impedances"]["resistor"] = {
                 "value": R,
-                "impedance": R,
+                "impedance": _impedance_parts(R, np.zeros_like(omega)),
                 "formula": "Z_R = R"
             }
 
-        # Capacitance
+        # Capacitance (réactance infinie en continu)
         if "capacitance" in context:
             C = context["capacitance"]
-            X_C = 1 / (omega * C)
+            with np.errstate(divide="ignore"):
+                X_C = 1 / (omega * C)
             results["impedances"]["capacitor"] = {
                 "value": C,
-                "reactance": X_C,
-                "impedance": f"-j{X_C}",
+                "reactance": X_C.tolist(),
+                "impedance": _impedance_parts(0.0, -X_C),
                 "formula": "Z_C = -j/(ωC)"
             }
 
@@ -483,21 +674,34 @@ class ElectronicsModule(BaseModule):
             X_L = omega * L
             results["impedances"]["inductor"] = {
                 "value": L,
-                "reactance": X_L,
-                "impedance": f"j{X_L}",
+                "reactance": X_L.tolist(),
+                "impedance": _impedance_parts(0.0, X_L),
                 "formula": "Z_L = jωL"
             }
 
+        # RLC série: module et phase (diagramme de Bode)
+        if _RLC_REQ.issubset(context):
+            # Z = R + jX, module et argument sans passer par le complexe
+            X = X_L - X_C
+            magnitude = np.hypot(R, X)
+            results["series_rlc"] = {
+                "impedance": _impedance_parts(R, X),
+                "magnitude": magnitude.tolist(),
+                "magnitude_db": (20 * np.log10(magnitude)).tolist(),
+                "phase": np.arctan2(X, R).tolist(),
+                "formula": "Z = R + j(ωL - 1/(ωC))",
+                "units": _table(_SERIES_RLC_UNITS)
+            }
+
         return results
 
     def _op_amp_circuit(self, query: str, context: Optional[Dict] = None) -> Dict[str, Any]:
         """Analyse de circuits à amplificateur opérationnel"""
-        query_lower = query.lower()
+        amp_type = _classify_op_amp(query)
 
-        if "inverting" in query_lower or "inverseur" in query_lower:
-            if context and all(k in context for k in ['R1', 'R2']):
-                R1 = context['R1']
-                R2 = context['R2']
+        if amp_type == "inverting":
+            if context and _OP_AMP_REQ.issubset(context):
+                R1, R2 = _OP_AMP_GET(context)
                 gain = -R2 / R1
 
                 return {
@@ -509,10 +713,9 @@ class ElectronicsModule(BaseModule):
                     "output": "V_out = -V_in × (R2/R1)"
                 }
 
-        elif "non-inverting" in query_lower or "non inverseur" in query_lower:
-            if context and all(k in context for k in ['R1', 'R2']):
-                R1 = context['R1']
-                R2 = context['R2']
+        elif amp_type == "non_inverting":
+            if context and _OP_AMP_REQ.issubset(context):
+                R1, R2 = _OP_AMP_GET(context)
                 gain = 1 + (R2 / R1)
 
                 return {
@@ -524,53 +727,39 @@ class ElectronicsModule(BaseModule):
                     "output": "V_out = V_in × (1 + R2/R1)"
                 }
 
-        return {"description": "Op-amp circuit", "types": ["inverting", "non-inverting", "summing", "integrator"]}
+        return {"description": "Op-amp circuit", "types": _table(_OP_AMP_TYPES)}
 
-    def _voltage_divider(self, query: str, context: Optional[Dict] = None) -> Dict[str, Any]:
+    def _voltage_divider(self, query: str, context: Optional[Dict] = None) -> Union[DividerAnalysis, Dict[str, Any]]:
         """Calcul du diviseur de tension"""
-        if not context or not all(k in context for k in ['R1', 'R2', 'V_in']):
+        if not context or not _DIVIDER_REQ.issubset(context):
             return {"error": "Need R1, R2, and V_in"}
 
-        R1 = context['R1']
-        R2 = context['R2']
-        V_in = context['V_in']
+        R1, R2, V_in = _DIVIDER_GET(context)
 
-        V_out = V_in * R2 / (R1 + R2)
+        V_out, ratio = _divider_core(R1, R2, V_in)
 
-        return {
-            "V_out": V_out,
-            "V_in": V_in,
-            "R1": R1,
-            "R2": R2,
-            "formula": "V_out = V_in × R2/(R1 + R2)",
-            "ratio": R2 / (R1 + R2)
-        }
+        return DividerAnalysis(V_out, V_in, R1, R2, ratio=ratio)
 
-    def _resonance_calculation(self, query: str, context: Optional[Dict] = None) -> Dict[str, Any]:
+    def _resonance_calculation(self, query: str, context: Optional[Dict] = None) -> Union[ResonanceAnalysis, Dict[str, Any]]:
         """Calculs de résonance"""
-        if not context or not all(k in context for k in ['inductance', 'capacitance']):
+        if not context or not _LC_REQ.issubset(context):
             return {"error": "Need L and C values"}
 
-        L = context['inductance']
-        C = context['capacitance']
+        L, C = _LC_GET(context)
+        if L <= 0 or C <= 0:
+            return {"error": "Inductance and capacitance must be positive"}
 
-        f_0 = 1 / (2 * np.pi * np.sqrt(L * C))
-        omega_0 = 1 / np.sqrt(L * C)
+        omega_0 = 1 / math.sqrt(L * C)
+        f_0 = omega_0 / _TWO_PI
 
-        return {
-            "resonance_frequency": f_0,
-            "angular_frequency": omega_0,
-            "inductance": L,
-            "capacitance": C,
-            "formula": "f₀ = 1/(2π√(LC))"
-        }
+        return ResonanceAnalysis(f_0, omega_0, L, C)
 
     def _transistor_analysis(self, query: str, context: Optional[Dict] = None) -> Dict[str, Any]:
         """Analyse de transistors"""
         return {
             "description": "Transistor analysis",
-            "types": ["BJT", "FET", "MOSFET"],
-            "parameters": ["beta", "V_BE", "I_C", "V_CE"]
+            "types": _table(_TRANSISTOR_TYPES),
+            "parameters": _table(_TRANSISTOR_PARAMETERS)
         }
 
     def _general_electronics(self, query: str, context: Optional[Dict] = None) -> Dict[str, Any]:
@@ -582,30 +771,21 @@ class ElectronicsModule(BaseModule):
 
     def validate_result(self, result: Any, original_query: str) -> Dict[str, Any]:
         """Valide un résultat électronique"""
-        try:
-            is_valid = True
-            errors = []
-            confidence = 0.9
-
-            if isinstance(result, dict):
-                if "error" in result:
-                    is_valid = False
-                    errors.append(result["error"])
-                    confidence = 0.0
-                elif any(k in result for k in ['voltage', 'current', 'power', 'impedance', 'frequency']):
-                    is_valid = True
-                    confidence = 0.95
+        is_valid = True
+        errors = []
+        confidence = 0.9
+
+        if isinstance(result, dict):
+            if "error" in result:
+                is_valid = False
+                errors.append(result["error"])
+                confidence = 0.0
+            elif not _NUMERIC_KEYS.isdisjoint(result):
+                confidence = 0.95
 
-            return {
-                "is_valid": is_valid,
-                "confidence": confidence,
-                "errors": errors,
-                "validation_method": "electronics_structural"
-            }
-
-        except Exception as e:
-            return {
-                "is_valid": False,
-                "confidence": 0.0,
-                "errors": [str(e)]
-            }
+        return {
+            "is_valid": is_valid,
+            "confidence": confidence,
+            "errors": errors,
+            "validation_method": "electronics_structural"
+        }
@@ -7,46 +7,670 @@ import numpy as np
 import sympy as sp
 from sympy import symbols, solve, diff, integrate, limit, series, Matrix, simplify
 from sympy import cos, sin, tan, exp, log, sqrt, pi, E, I, oo
+from sympy.parsing.sympy_parser import (
+    parse_expr, standard_transformations, implicit_multiplication_application, convert_xor
+)
 from scipy import optimize, integrate as scipy_integrate, linalg
 from typing import Dict, Any, Optional, List, Union
+from functools import lru_cache
+from pathlib import Path
+import builtins
+import hashlib
+import inspect
 import logging
+import os
 import re
+import sys
+import types
 
 from modules.base_module import BaseModule
 
+try:
+    import numba
+except ImportError:  # Accélération JIT optionnelle
+    numba = None
+
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Extraction des arguments dans les requêtes (compilées une fois)
+_RE_DERIVATIVE_FUNC = re.compile(r'(?:of|de)\s+(.+)', re.IGNORECASE)
+# Fonction et bornes éventuelles d'une intégrale en une seule passe
+_RE_INTEGRAL = re.compile(
+    r'(?:of|de)\s+(?P<func>.+?)'
+    r'(?:\s+(?:from|de)\s+(?P<lower>\S+)\s+(?:to|à)\s+(?P<upper>\S+)|\s+from|\s+de\s+|$)',
+    re.IGNORECASE,
+)
+_RE_BOUNDS = re.compile(r'(?:from|de)\s+(\S+)\s+(?:to|à)\s+(\S+)', re.IGNORECASE)
+_RE_BOUNDS_TAIL = re.compile(r'\s+(?:from|de)\s+.+', re.IGNORECASE)
+_RE_LIMIT_FUNC = re.compile(r'of\s+(.+?)\s+as|de\s+(.+?)\s+quand', re.IGNORECASE)
+_RE_LIMIT_POINT = re.compile(r'x\s*→\s*(\S+)|x\s+tends?\s+to\s+(\S+)')
+_RE_ORDER = re.compile(r'order\s+(\d+)|ordre\s+(\d+)')
+_RE_SERIES_FUNC = re.compile(r'of\s+(.+?)(?:\s+order|$)', re.IGNORECASE)
+_RE_OPT_FUNC = re.compile(r'function\s+(.+)|fonction\s+(.+)', re.IGNORECASE)
+_RE_NUM_EXPR = re.compile(r'compute\s+(.+)|calculate\s+(.+)|calculer\s+(.+)', re.IGNORECASE)
+
+# Mots-clés retirés des équations, en une passe. Les formes longues d'abord:
+# "l'équation " et "the equation " disparaissent en entier.
+_RE_SOLVE_KEYWORDS = re.compile(
+    r"l'équation\s+|the\s+equation\s+|résoudre\s+|solve\s+|résous\s+"
+    r"|équation\s*:?\s*|equation\s*:?\s*|calculer\s+|calculate\s+|compute\s+",
+    re.IGNORECASE,
+)
+
+# Mots-clés retirés des dérivées et intégrales, en une passe (formes longues d'abord)
+_RE_DERIVATIVE_KEYWORDS = re.compile(
+    r"calculer\s+(?:la\s+)?dérivée\s+|calculate\s+(?:the\s+)?derivative\s+"
+    r"|dérivée\s+|derivative\s+|dériver\s+|differentiate\s+|d/dx\s+|d'?\s*",
+    re.IGNORECASE,
+)
+_RE_INTEGRAL_KEYWORDS = re.compile(
+    r"calculer\s+(?:l')?intégrale\s+|calculate\s+(?:the\s+)?integral\s+"
+    r"|intégrale\s+|integral\s+|intégrer\s+|integrate\s+|∫\s*",
+    re.IGNORECASE,
+)
+
+# Exposants unicode → notation Python
+_SUPERSCRIPTS = str.maketrans({
+    '²': '**2', '³': '**3', '⁴': '**4', '⁵': '**5',
+    '⁶': '**6', '⁷': '**7', '⁸': '**8', '⁹': '**9'
+})
+
+# Au-delà de ce degré, racines polynomiales numériques (pas de formule close)
+_SYMBOLIC_ROOTS_MAX_DEGREE = 4
+
+# Au-delà de cette taille, valeurs propres numériques (pas de formule close)
+_SYMBOLIC_EIGEN_MAX = 4
+
+# Clés signalant un résultat exploitable (validate_result)
+_RESULT_KEYS = frozenset({"result", "solutions"})
+
+# Variable et fonction inconnue partagées par toutes les opérations
+_X = symbols('x')
+_Y_FUNC = sp.Function('y')
+
+# Noyaux numériques compilés persistants (modules lambdify + cache numba)
+_KERNEL_CACHE_DIR = Path(os.environ.get("NYX_CACHE_DIR", Path.home() / ".cache" / "nyx")) / "kernels"
+
+# Taille de tableau à partir de laquelle le noyau numba parallèle est utilisé
+_JIT_MIN_SIZE = 100_000
+
+# Entiers littéraux convertis en float avant compilation numba
+_JIT_INT_MAX = 2**31
+
+# Au-delà de ce nombre d'opérations, pas de simplify() complet par défaut
+_SIMPLIFY_MAX_OPS = 40
+
+
+# Multiplication implicite (2x, 3xy, 2(x+1), x(x+1)) et ^ pour la puissance
+_TRANSFORMS = standard_transformations + (implicit_multiplication_application, convert_xor)
+
+# Sans multiplication implicite: du texte libre ("hello world") reste une
+# erreur de syntaxe au lieu d'un produit de lettres
+_STRICT_TRANSFORMS = standard_transformations + (convert_xor,)
+
+
+def _parser_namespace() -> Dict[str, Any]:
+    """
+    Espace de noms global de parse_expr
+
+    Sans global_dict, parse_expr le reconstruit à chaque appel
+    (from sympy import *, fonctions builtins, Max/Min); construit une fois,
+    il divise par deux le coût d'un parse.
+    """
+    namespace = {name: getattr(sp, name) for name in sp.__all__}
+    namespace.update((name, obj) for name, obj in vars(builtins).items()
+                     if isinstance(obj, types.BuiltinFunctionType))
+    namespace['max'], namespace['min'] = sp.Max, sp.Min
+    return namespace
+
+
+_PARSE_GLOBALS = _parser_namespace()
+
+
+# Fonctions usuelles reconnues même collées à leur argument ("sinx", "2xsin(x)"):
+# sans cela, la multiplication implicite découpe "sinx" en s*i*n*x
+_RE_FUNCTION_NAME = re.compile("(" + "|".join(sorted({
+    'sin', 'cos', 'tan', 'cot', 'sec', 'csc', 'asin', 'acos', 'atan', 'acot',
+    'sinh', 'cosh', 'tanh', 'asinh', 'acosh', 'atanh', 'exp', 'log', 'ln', 'sqrt',
+}, key=len, reverse=True)) + ")")
+_RE_NAME = re.compile(r'[A-Za-z_][A-Za-z0-9_]*')
+
+
+def _separate_function_names(match) -> str:
+    """
+    Isole les fonctions usuelles d'un nom: "xsinx" → "x*sin(x)", "sin2x" → "sin(2x)"
+
+    Les noms connus de SymPy (sinh, atan2, theta...) sont laissés tels quels.
+    """
+    name = match.group()
+    if name in _PARSE_GLOBALS:
+        return name
+    prefix, *parts = _RE_FUNCTION_NAME.split(name)
+    if not parts:
+        return name
+    # parts alterne fonction et argument collé (vide si suivi de "(" ou d'un espace)
+    terms = [prefix] if prefix else []
+    terms += [f"{func}({arg})" if arg else func for func, arg in zip(parts[::2], parts[1::2])]
+    return "*".join(terms)
+
+
+@lru_cache(maxsize=4096)
+def _cached_parse(expr_str: str, implicit: bool = True):
+    """
+    Parse une expression en notation usuelle, avec mise en cache
+
+    implicit=False désactive la multiplication implicite, pour les requêtes
+    brutes qui peuvent n'être que du texte.
+    """
+    expr_str = _RE_NAME.sub(_separate_function_names, expr_str)
+    transformations = _TRANSFORMS if implicit else _STRICT_TRANSFORMS
+    return parse_expr(expr_str, global_dict=_PARSE_GLOBALS, transformations=transformations)
+
+
+# Opérations symboliques coûteuses, mémorisées par expression (hash structurel).
+# Dérivée, intégrale, série et limite d'une même fonction sont souvent demandées à la
+# suite: les caches sont dimensionnés pour une session entière.
+_SYMBOLIC_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=_SYMBOLIC_CACHE_SIZE)
+def _cached_diff(function, var):
+    """diff() mémorisé"""
+    return diff(function, var)
+
+
+@lru_cache(maxsize=_SYMBOLIC_CACHE_SIZE)
+def _cached_integrate(function, *args):
+    """integrate() mémorisé"""
+    return integrate(function, *args)
+
 
-def _clean_sympy_objects(obj):
-    """Convertit récursivement les objets SymPy en strings pour la sérialisation JSON"""
-    if isinstance(obj, dict):
-        return {k: _clean_sympy_objects(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [_clean_sympy_objects(item) for item in obj]
-    elif hasattr(obj, '__module__') and 'sympy' in obj.__module__:
-        return str(obj)
-    else:
-        return obj
+@lru_cache(maxsize=_SYMBOLIC_CACHE_SIZE)
+def _cached_series(function, var, x0, order):
+    """series() mémorisé"""
+    return series(function, var, x0, order)
 
 
-def _add_implicit_multiplication(expr_str: str) -> str:
-    """Ajoute la multiplication implicite (ex: 2x → 2*x, 3xy → 3*x*y)"""
-    # Pattern pour nombre suivi d'une lettre sans opérateur entre eux
-    expr_str = re.sub(r'(\d)([a-zA-Z])', r'\1*\2', expr_str)
-    # Pattern pour lettre suivie d'une autre lettre (xy → x*y)
-    # ATTENTION: Ne pas casser les fonctions comme sin, cos, exp, log
-    expr_str = re.sub(r'([a-zA-Z])([a-zA-Z])', lambda m: f"{m.group(1)}*{m.group(2)}"
-                      if m.group(0) not in ['sin', 'cos', 'tan', 'exp', 'log', 'ln'] else m.group(0), expr_str)
-    return expr_str
+@lru_cache(maxsize=_SYMBOLIC_CACHE_SIZE)
+def _cached_limit(function, var, point):
+    """limit() mémorisé"""
+    return limit(function, var, point)
+
+
+@lru_cache(maxsize=1)
+def _dsolve_example():
+    """Équation différentielle d'exemple y' = y et sa solution (dsolve est coûteux)"""
+    eq = sp.Eq(_Y_FUNC(_X).diff(_X), _Y_FUNC(_X))
+    return eq, sp.dsolve(eq, _Y_FUNC(_X))
+
+
+@lru_cache(maxsize=1024)
+def _equation_text(query: str) -> str:
+    """Équation nettoyée: mots-clés FR/EN retirés, exposants unicode convertis"""
+    return _RE_SOLVE_KEYWORDS.sub('', query).strip().translate(_SUPERSCRIPTS)
+
+
+def _alternation(words) -> str:
+    """Alternative regex, les mots les plus longs d'abord"""
+    return "|".join(re.escape(w) for w in sorted(words, key=len, reverse=True))
+
+
+# Mots-clés par groupe (recherchés comme sous-chaînes, "=" compris)
+_SOLVE_KW = frozenset({"solve", "résoudre", "equation", "équation", "="})
+_DIFF_EQ_KW = frozenset({"diff", "dérivée", "d/dx"})
+_DERIVATIVE_KW = frozenset({"derivative", "dérivée", "dériver", "d/dx", "diff"})
+_INTEGRAL_KW = frozenset({"integral", "intégrale", "intégrer", "∫"})
+_MATRIX_KW = frozenset({"matrix", "matrice", "eigen", "determinant"})
+_LIMIT_KW = frozenset({"limit", "limite", "lim"})
+_SERIES_KW = frozenset({"series", "série", "taylor", "maclaurin"})
+_OPTIMIZATION_KW = frozenset({"optimize", "optimiser", "minimize", "maximize", "min", "max"})
+_NUMERICAL_KW = frozenset({"numerical", "numérique", "approximate"})
+
+# Règles par ordre de priorité: (type, groupes requis)
+_OPERATION_RULES = (
+    ("differential_equation", (_SOLVE_KW, _DIFF_EQ_KW)),
+    ("solve_equation", (_SOLVE_KW,)),
+    ("derivative", (_DERIVATIVE_KW,)),
+    ("integral", (_INTEGRAL_KW,)),
+    ("matrix", (_MATRIX_KW,)),
+    ("limit", (_LIMIT_KW,)),
+    ("series", (_SERIES_KW,)),
+    ("optimization", (_OPTIMIZATION_KW,)),
+    ("numerical", (_NUMERICAL_KW,)),
+)
+
+# Une seule passe relève tous les mots-clés présents, chevauchements compris
+# (lookahead à chaque position). Un mot-clé n'en masque un autre que s'il
+# en est le préfixe ("lim"/"limit", "min"/"minimize"), toujours du même groupe.
+_RE_OPERATION_KEYWORDS = re.compile(
+    "(?=(" + _alternation(frozenset().union(*(kw for _, clauses in _OPERATION_RULES for kw in clauses))) + "))"
+)
+
+
+def _operation_masks(rules):
+    """
+    Encode les groupes de mots-clés en bits
+
+    Returns:
+        Tuple (masque des groupes de chaque mot-clé, règles (type, masque requis))
+    """
+    groups = list(dict.fromkeys(kw for _, clauses in rules for kw in clauses))
+    keyword_masks: Dict[str, int] = {}
+    for bit, words in enumerate(groups):
+        for word in words:
+            keyword_masks[word] = keyword_masks.get(word, 0) | (1 << bit)
+    required = tuple(
+        (sys.intern(name), sum(1 << groups.index(kw) for kw in clauses)) for name, clauses in rules
+    )
+    return keyword_masks, required
+
+
+_KEYWORD_MASKS, _OPERATION_MASKS = _operation_masks(_OPERATION_RULES)
+
+
+@lru_cache(maxsize=1024)
+def _operation_type(query_lower: str) -> str:
+    """Type d'opération d'une requête (en minuscules), mémorisé"""
+    mask = 0
+    for keyword in _RE_OPERATION_KEYWORDS.findall(query_lower):
+        mask |= _KEYWORD_MASKS[keyword]
+    if mask:
+        for name, required in _OPERATION_MASKS:
+            if mask & required == required:
+                return name
+    return "symbolic"
+
+
+def _file_backed_lambdify(free, expr):
+    """
+    lambdify() écrit dans un vrai module sur disque
+
+    numba ne met en cache sur disque (cache=True) que les fonctions dont le
+    source est dans un fichier importable, ce qui n'est pas le cas du code
+    généré par lambdify. Le module est nommé par le hash de srepr(expr):
+    une même expression retrouve son noyau compilé d'une session à l'autre.
+
+    Le fichier existant n'est jamais exécuté tel quel: le source attendu est
+    régénéré, comparé au contenu du fichier (réécrit s'il diffère) et c'est
+    lui qui est exécuté. Le module est enregistré dans sys.modules, que
+    l'appelant doit nettoyer une fois le noyau compilé (_release_kernel_module).
+
+    Returns:
+        La fonction scalaire, ou None si le répertoire de cache est inaccessible
+    """
+    name = "nyx_kernel_" + hashlib.sha1(sp.srepr(expr).encode()).hexdigest()
+    path = _KERNEL_CACHE_DIR / f"{name}.py"
+    source = "from math import *\n\n\n" + inspect.getsource(
+        sp.lambdify(free, expr, modules=['math'], cse=True)
+    )
+    try:
+        if not path.exists() or path.read_text(encoding="utf-8") != source:
+            _KERNEL_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            # Écriture atomique: un autre processus peut charger le même noyau
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            try:
+                tmp.write_text(source, encoding="utf-8")
+                os.replace(tmp, path)
+            except OSError:
+                tmp.unlink(missing_ok=True)
+                raise
+    except (OSError, UnicodeDecodeError) as e:
+        logger.debug(f"Kernel cache unavailable for {expr}: {e}")
+        return None
+
+    module = types.ModuleType(name)
+    module.__file__ = str(path)
+    # numba recharge son cache en réimportant le module par son nom
+    sys.modules[name] = module
+    exec(compile(source, str(path), "exec"), module.__dict__)
+    return module._lambdifygenerated
+
+
+def _release_kernel_module(kernel) -> None:
+    """Retire de sys.modules le module d'un noyau compilé (inutile après compilation)"""
+    sys.modules.pop(kernel.__module__, None)
+
+
+# Mots-clés français et anglais (poids de confiance de can_handle)
+_MATH_KEYWORDS = {
+    # Termes généraux
+    'mathématique': 0.95, 'mathematics': 0.95, 'math': 0.9,
+
+    # Visualisation - IMPORTANT pour "Tracer x² - 4"
+    'tracer': 0.9, 'plot': 0.9, 'dessiner': 0.85, 'draw': 0.85,
+    'graphe': 0.9, 'graph': 0.9, 'courbe': 0.9, 'curve': 0.9,
+    'visualiser': 0.85, 'visualize': 0.85, 'afficher': 0.8, 'display': 0.8,
+    'fonction': 0.85, 'function': 0.85,
+
+    # Résolution
+    'résoudre': 0.9, 'solve': 0.9, 'équation': 0.9, 'equation': 0.9,
+    'solution': 0.85, 'trouver': 0.7, 'find': 0.7,
+
+    # Calcul différentiel/intégral
+    'dérivée': 0.9, 'derivative': 0.9, 'dériver': 0.9, 'differentiate': 0.9,
+    'intégrale': 0.9, 'integral': 0.9, 'intégrer': 0.9, 'integrate': 0.9,
+    'd/dx': 0.95, '∫': 0.95,
+
+    # Limites et séries
+    'limite': 0.9, 'limit': 0.9, 'lim': 0.9,
+    'série': 0.8, 'series': 0.8, 'taylor': 0.9, 'fourier': 0.9,
+
+    # Algèbre linéaire
+    'matrice': 0.9, 'matrix': 0.9, 'déterminant': 0.8, 'determinant': 0.8,
+    'vecteur': 0.85, 'vector': 0.85, 'eigenvalue': 0.9, 'valeur propre': 0.9,
+
+    # Optimisation
+    'optimiser': 0.8, 'optimize': 0.8, 'minimum': 0.7, 'maximum': 0.7,
+    'minimiser': 0.8, 'minimize': 0.8, 'maximiser': 0.8, 'maximize': 0.8,
+
+    # Calcul de base
+    'calculer': 0.6, 'calculate': 0.6, 'compute': 0.6,
+    'simplifier': 0.7, 'simplify': 0.7, 'développer': 0.7, 'expand': 0.7,
+
+    # Algèbre
+    'polynôme': 0.85, 'polynomial': 0.85, 'factoriser': 0.8, 'factor': 0.8,
+}
+
+# Un mot-clé préfixe d'un autre ("math"/"mathematics") est masqué par la
+# forme longue à la même position: chaque mot-clé porte le meilleur poids
+# de ses préfixes
+_MATH_KEYWORD_WEIGHTS = {
+    k: max(w for p, w in _MATH_KEYWORDS.items() if k.startswith(p)) for k in _MATH_KEYWORDS
+}
+
+# Tous les mots-clés présents en une passe (lookahead: chevauchements compris)
+_RE_MATH_KEYWORDS = re.compile("(?=(" + _alternation(_MATH_KEYWORDS) + "))")
+
+_MATH_SYMBOLS = ('=', '²', '³', '^', 'x', 'sin', 'cos', 'exp', 'log')
+
+
+@lru_cache(maxsize=1024)
+def _math_score(query_lower: str) -> float:
+    """Score de can_handle pour une requête (en minuscules), mémorisé"""
+    score = max(map(_MATH_KEYWORD_WEIGHTS.__getitem__, _RE_MATH_KEYWORDS.findall(query_lower)),
+                default=0.0)
+
+    # Symboles mathématiques
+    if sum(symbol in query_lower for symbol in _MATH_SYMBOLS) >= 2:
+        score = max(score, 0.7)
+
+    return min(score, 1.0)
+
+
+@lru_cache(maxsize=128)
+def _numeric_kernel(expr, jit: bool = True):
+    """
+    Compile une expression en fonction numérique vectorisée, avec mise en cache
+
+    lambdify(cse=True) évite mpmath (evalf); avec numba (jit=True), le noyau
+    est compilé en ufunc parallèle. La compilation coûte cher: le cache
+    l'amortit entre les appels, et le cache disque de numba entre les
+    sessions. Repli sur la fonction numpy si numba échoue.
+
+    Returns:
+        Tuple (noms des variables triés, fonction numérique)
+    """
+    free = tuple(sorted(expr.free_symbols, key=str))
+    func = sp.lambdify(free, expr, modules='numpy', cse=True)
+    if jit and numba is not None and free:
+        try:
+            # Les grands entiers déborderaient en int64 dans le noyau compilé
+            jit_expr = expr.xreplace({
+                n: sp.Float(n) for n in expr.atoms(sp.Integer) if abs(n) > _JIT_INT_MAX
+            })
+            signature = f"float64({', '.join(['float64'] * len(free))})"
+            kernel = _file_backed_lambdify(free, jit_expr)
+            cache = kernel is not None
+            if not cache:
+                kernel = sp.lambdify(free, jit_expr, modules=['math'], cse=True)
+            try:
+                # Signature explicite: compilation (ou chargement du cache) immédiate
+                func = numba.vectorize([signature], target='parallel', cache=cache)(kernel)
+            finally:
+                if cache:
+                    _release_kernel_module(kernel)
+        except Exception as e:
+            logger.debug(f"JIT compilation failed for {expr}: {e}")
+    return tuple(str(s) for s in free), func
+
+
+@lru_cache(maxsize=512)
+def _scalar_function(expr):
+    """
+    Fonction float d'une expression (module math, CSE), mémorisée
+
+    Pour des arguments scalaires, le module math évite le coût d'appel des
+    ufuncs numpy. Pas de compilation JIT ici: quelques appels par requête
+    n'amortissent pas sa compilation, réservée aux tableaux (_numeric_kernel).
+    Les variables sont triées par nom.
+
+    Returns:
+        Tuple (noms des variables, fonction)
+    """
+    free = tuple(sorted(expr.free_symbols, key=str))
+    return tuple(str(s) for s in free), sp.lambdify(free, expr, modules=['math'], cse=True)
+
+
+def _has_finite_float(expr) -> bool:
+    """Expression constante sans infini complexe ni nan (±oo acceptés)"""
+    if expr.free_symbols or expr.has(sp.zoo, sp.nan):
+        return False
+    return expr.is_finite is not False or expr in (oo, -oo)
+
+
+def _to_float(expr) -> float:
+    """
+    Valeur float d'une expression, sans passer par mpmath si possible
+
+    Les nombres exacts sont convertis directement, les expressions constantes
+    évaluées en float natif. evalf() reste le repli pour les expressions à
+    variables libres et les cas hors du domaine réel ou non couverts par math.
+    L'infini complexe (1/0, log(0)) et nan ne passent pas par math, qui les
+    rendrait en nan: float() lève comme sur evalf().
+    """
+    if isinstance(expr, (sp.Rational, sp.Float)):
+        return float(expr)
+    if _has_finite_float(expr):
+        try:
+            return float(_scalar_function(expr)[1]())
+        except Exception:
+            pass
+    return float(expr.evalf())
+
+
+def _x_function(expr):
+    """Fonction float de x seul (lambdify mémorisé), ou None si expr dépend d'autres symboles"""
+    names, func = _scalar_function(expr)
+    if names == ('x',):
+        return func
+    if not names:
+        return lambda _: func()
+    return None
+
+
+def _float_at(func, point) -> Optional[float]:
+    """Valeur float de func en un point réel, None si inapplicable (point complexe ou paramétré, hors domaine)"""
+    if func is None or not (point.is_number and point.is_real):
+        return None
+    try:
+        value = func(float(point))
+    except (TypeError, ValueError, OverflowError, ZeroDivisionError):
+        return None
+    return value if np.isfinite(value) else None
+
+
+# Chiffres significatifs des racines numériques (le bruit LAPACK est au-delà)
+_ROOT_DIGITS = 12
+
+
+def _rounded_root(root: complex) -> complex:
+    """Racine arrondie à _ROOT_DIGITS chiffres, parties sous le bruit ramenées à 0"""
+    noise = 10.0 ** -_ROOT_DIGITS * max(1.0, abs(root))
+    real, imag = (float(f"{v:.{_ROOT_DIGITS}g}") if abs(v) > noise else 0.0
+                  for v in (root.real, root.imag))
+    return complex(real, imag)
+
+
+def _format_root(root: complex) -> str:
+    """Racine numérique au format SymPy (a + b*I), comme les solutions symboliques"""
+    return sp.sstr(sp.Float(root.real) + sp.Float(root.imag) * I, full_prec=False)
+
+
+def _numeric_polynomial_roots(equation, numeric: bool = False) -> Optional[List[str]]:
+    """
+    Racines d'un polynôme en x à coefficients numériques par np.roots
+
+    np.roots diagonalise la matrice compagnon (LAPACK), là où solve()
+    renverrait des CRootOf. Les degrés ≤ 4, et les polynômes exacts dont
+    tous les facteurs sont de degré ≤ 4 (x**6 - 1), gardent leur forme
+    exacte par solve(), sauf si numeric est demandé. Racines réelles
+    d'abord, puis complexes, triées par parties réelle et imaginaire.
+
+    Returns:
+        Les racines formatées, ou None si le chemin symbolique s'applique
+    """
+    try:
+        poly = sp.Poly(equation, _X)
+    except sp.PolynomialError:
+        return None
+    if not poly.domain.is_Numerical or poly.degree() < 1:
+        return None
+    if not numeric:
+        if poly.degree() <= _SYMBOLIC_ROOTS_MAX_DEGREE:
+            return None
+        if poly.domain.is_Exact and all(
+            factor.degree() <= _SYMBOLIC_ROOTS_MAX_DEGREE for factor, _ in poly.factor_list()[1]
+        ):
+            return None
+    coeffs = np.array([complex(c) for c in poly.all_coeffs()])
+    roots = sorted(map(_rounded_root, np.roots(coeffs)), key=lambda r: (r.imag != 0, r.real, r.imag))
+    return [_format_root(root) for root in roots]
+
+
+def _numeric_matrix(mat_data, numeric: bool = False) -> Optional[np.ndarray]:
+    """
+    Matrice carrée réelle à traiter par LAPACK, ou None pour le chemin symbolique
+
+    Les entrées sont inspectées directement (dtype numpy), sans construire de
+    Matrix SymPy. Les petites matrices entières gardent leurs valeurs propres
+    exactes, sauf si numeric est demandé.
+    """
+    try:
+        array = np.asarray(mat_data)
+    except ValueError:  # Lignes de longueurs différentes
+        return None
+    if array.dtype.kind not in 'iuf' or array.ndim != 2 or array.shape[0] != array.shape[1]:
+        return None
+    if array.dtype.kind == 'f' or array.shape[0] > _SYMBOLIC_EIGEN_MAX or numeric:
+        return array.astype(np.float64, copy=False)
+    return None
+
+
+def _numeric_matrix_report(array: np.ndarray) -> Dict[str, Any]:
+    """Déterminant, trace et valeurs propres (avec multiplicité) par scipy.linalg"""
+    # Arrondi pour regrouper les valeurs multiples (+0 ramène -0.0 à 0.0)
+    eigenvalues = np.round(linalg.eig(array, right=False), 12) + 0j
+    counts: Dict[str, int] = {}
+    for value in eigenvalues:
+        key = str(value.real) if value.imag == 0 else str(complex(value))
+        counts[key] = counts.get(key, 0) + 1
+
+    return {
+        "matrix": f"Matrix({array.tolist()})",
+        "determinant": str(float(linalg.det(array))),
+        "trace": str(float(np.trace(array))),
+        "eigenvalues": counts,
+    }
+
+
+# Indexé par le signe de la dérivée seconde (-1 → dernier élément)
+_POINT_TYPES = ("inflection", "minimum", "maximum")
+
+# Tolérance relative du test de signe en flottant: en deçà, la valeur n'est
+# que du bruit d'arrondi autour d'un zéro exact
+_SIGN_RTOL = 1e-9
+
+
+def _numeric_sign(value: complex, scale: float) -> Optional[int]:
+    """Signe d'une valeur réelle, 0 sous la tolérance relative; None si complexe ou infinie"""
+    if not np.isfinite(value) or abs(value.imag) > _SIGN_RTOL * scale:
+        return None
+    if abs(value.real) <= _SIGN_RTOL * scale:
+        return 0
+    return 1 if value.real > 0 else -1
+
+
+def _critical_point_type(expr, point, approx: Optional[float] = None, scale: float = 1.0) -> str:
+    """
+    Nature d'un point critique d'après le signe de la dérivée seconde expr
+
+    La valeur float approx (fonction compilée) ne décide que si elle est
+    nettement non nulle devant scale, l'amplitude de f'' sur l'ensemble
+    des points critiques. Sinon test exact (is_zero, is_positive, is_negative): une racine
+    irrationnelle annulant exactement f'' n'est pas classée sur du bruit
+    flottant. Si SymPy ne tranche pas, evalf avec une tolérance relative à
+    l'amplitude des termes de f''. Une valeur complexe ou encore symbolique
+    donne "unknown".
+    """
+    if approx is not None and abs(approx) > _SIGN_RTOL * scale:
+        return _POINT_TYPES[1 if approx > 0 else -1]
+
+    value = expr.xreplace({_X: point})
+    if value.is_zero:
+        return _POINT_TYPES[0]
+    if value.is_positive:
+        return _POINT_TYPES[1]
+    if value.is_negative:
+        return _POINT_TYPES[-1]
+
+    try:
+        approx = complex(value.evalf())
+        scale = sum(abs(complex(term.xreplace({_X: point}).evalf())) for term in sp.Add.make_args(expr))
+    except TypeError:
+        return "unknown"
+    sign = _numeric_sign(approx, max(1.0, scale))
+    return "unknown" if sign is None else _POINT_TYPES[sign]
+
+
+def _canonicalize(expr, full: bool = False):
+    """
+    Normalisation bon marché d'un résultat symbolique
+
+    simplify() essaie de nombreuses heuristiques et coûte souvent bien plus
+    que le calcul lui-même: on ne l'applique que sur demande (full=True).
+    Sinon trigsimp pour les expressions trigonométriques, cancel pour les
+    fractions rationnelles.
+    """
+    if full:
+        return simplify(expr)
+    expr = expr.doit()
+    if expr.has(sp.sin, sp.cos, sp.tan):
+        return sp.trigsimp(expr)
+    if expr.is_rational_function():
+        return sp.cancel(expr)
+    return expr
+
+
+@lru_cache(maxsize=_SYMBOLIC_CACHE_SIZE)
+def _cached_canonicalize(expr, full: bool = False):
+    """_canonicalize() mémorisé"""
+    return _canonicalize(expr, full)
+
+
+def _wants_full_simplify(context: Optional[Dict]) -> bool:
+    """context["simplify"] == "full" rétablit simplify()"""
+    return bool(context) and context.get("simplify") == "full"
 
 
 class MathematicsModule(BaseModule):
     """Module de mathématiques avancées"""
 
-    def __init__(self):
+    def __init__(self, use_jit: bool = True):
         super().__init__("Mathematics", "1.0.0")
+        # Noyaux numériques compilés par numba si disponible
+        self.use_jit = use_jit and numba is not None
         self.capabilities = [
             "algebra", "calculus", "differential_equations",
             "linear_algebra", "complex_analysis", "numerical_analysis",
@@ -65,6 +689,8 @@ class MathematicsModule(BaseModule):
             # Test des imports
             _ = sp.Symbol('x')
             _ = np.array([1, 2, 3])
+            # Résoudre l'équation différentielle d'exemple une fois pour toutes
+            _dsolve_example()
             logger.info("✓ Module Mathematics initialisé")
             return True
         except Exception as e:
@@ -73,61 +699,7 @@ class MathematicsModule(BaseModule):
 
     def can_handle(self, query: str) -> float:
         """Détermine si ce module peut gérer une requête mathématique"""
-        query_lower = query.lower()
-        score = 0.0
-
-        # Mots-clés français et anglais
-        math_keywords = {
-            # Termes généraux
-            'mathématique': 0.95, 'mathematics': 0.95, 'math': 0.9,
-
-            # Visualisation - IMPORTANT pour "Tracer x² - 4"
-            'tracer': 0.9, 'plot': 0.9, 'dessiner': 0.85, 'draw': 0.85,
-            'graphe': 0.9, 'graph': 0.9, 'courbe': 0.9, 'curve': 0.9,
-            'visualiser': 0.85, 'visualize': 0.85, 'afficher': 0.8, 'display': 0.8,
-            'fonction': 0.85, 'function': 0.85,
-
-            # Résolution
-            'résoudre': 0.9, 'solve': 0.9, 'équation': 0.9, 'equation': 0.9,
-            'solution': 0.85, 'trouver': 0.7, 'find': 0.7,
-
-            # Calcul différentiel/intégral
-            'dérivée': 0.9, 'derivative': 0.9, 'dériver': 0.9, 'differentiate': 0.9,
-            'intégrale': 0.9, 'integral': 0.9, 'intégrer': 0.9, 'integrate': 0.9,
-            'd/dx': 0.95, '∫': 0.95,
-
-            # Limites et séries
-            'limite': 0.9, 'limit': 0.9, 'lim': 0.9,
-            'série': 0.8, 'series': 0.8, 'taylor': 0.9, 'fourier': 0.9,
-
-            # Algèbre linéaire
-            'matrice': 0.9, 'matrix': 0.9, 'déterminant': 0.8, 'determinant': 0.8,
-            'vecteur': 0.85, 'vector': 0.85, 'eigenvalue': 0.9, 'valeur propre': 0.9,
-
-            # Optimisation
-            'optimiser': 0.8, 'optimize': 0.8, 'minimum': 0.7, 'maximum': 0.7,
-            'minimiser': 0.8, 'minimize': 0.8, 'maximiser': 0.8, 'maximize': 0.8,
-
-            # Calcul de base
-            'calculer': 0.6, 'calculate': 0.6, 'compute': 0.6,
-            'simplifier': 0.7, 'simplify': 0.7, 'développer': 0.7, 'expand': 0.7,
-
-            # Algèbre
-            'polynôme': 0.85, 'polynomial': 0.85, 'factoriser': 0.8, 'factor': 0.8,
-        }
-
-        # Vérifier les mots-clés
-        for keyword, weight in math_keywords.items():
-            if keyword in query_lower:
-                score = max(score, weight)
-
-        # Symboles mathématiques
-        math_symbols = ['=', '²', '³', '^', 'x', 'sin', 'cos', 'exp', 'log']
-        symbol_count = sum(1 for s in math_symbols if s in query_lower)
-        if symbol_count >= 2:
-            score = max(score, 0.7)
-
-        return min(score, 1.0)
+        return _math_score(query.lower())
 
     def execute(self, query: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -169,9 +741,8 @@ class MathematicsModule(BaseModule):
             else:
                 result = self._symbolic_computation(query, context)
 
-            # Nettoyer les objets SymPy pour la sérialisation JSON
-            result = _clean_sympy_objects(result)
-
+            # Chaque méthode produit déjà des feuilles sérialisables en JSON
+            # (str, nombres, listes et dicts de ceux-ci)
             return {
                 "success": True,
                 "result": result,
@@ -189,72 +760,33 @@ class MathematicsModule(BaseModule):
 
     def _detect_operation_type(self, query: str) -> str:
         """Détecte le type d'opération mathématique"""
-        query_lower = query.lower()
-
-        if any(word in query_lower for word in ["solve", "résoudre", "equation", "équation", "="]):
-            if "diff" in query_lower or "dérivée" in query_lower or "d/dx" in query_lower:
-                return "differential_equation"
-            return "solve_equation"
-        elif any(word in query_lower for word in ["derivative", "dérivée", "dériver", "d/dx", "diff"]):
-            return "derivative"
-        elif any(word in query_lower for word in ["integral", "intégrale", "intégrer", "∫"]):
-            return "integral"
-        elif any(word in query_lower for word in ["matrix", "matrice", "eigen", "determinant"]):
-            return "matrix"
-        elif any(word in query_lower for word in ["limit", "limite", "lim"]):
-            return "limit"
-        elif any(word in query_lower for word in ["series", "série", "taylor", "maclaurin"]):
-            return "series"
-        elif any(word in query_lower for word in ["optimize", "optimiser", "minimize", "maximize", "min", "max"]):
-            return "optimization"
-        elif any(word in query_lower for word in ["numerical", "numérique", "approximate"]):
-            return "numerical"
-        else:
-            return "symbolic"
+        return _operation_type(query.lower())
 
     def _solve_equation(self, query: str, context: Optional[Dict] = None) -> Dict[str, Any]:
         """Résout des équations algébriques"""
         # Extraire l'équation en retirant les mots-clés courants
-        equation_str = query
-
-        # Retirer les mots-clés français et anglais
-        keywords_to_remove = [
-            r'résoudre\s+', r'solve\s+', r'résous\s+',
-            r'équation\s*:?\s*', r'equation\s*:?\s*',
-            r'calculer\s+', r'calculate\s+', r'compute\s+',
-            r"l'équation\s+", r'the\s+equation\s+'
-        ]
-
-        for keyword in keywords_to_remove:
-            equation_str = re.sub(keyword, '', equation_str, flags=re.IGNORECASE)
-
-        equation_str = equation_str.strip()
-
-        # Convertir les exposants unicode en notation Python
-        unicode_superscripts = {
-            '²': '**2', '³': '**3', '⁴': '**4', '⁵': '**5',
-            '⁶': '**6', '⁷': '**7', '⁸': '**8', '⁹': '**9'
-        }
-        for unicode_exp, python_exp in unicode_superscripts.items():
-            equation_str = equation_str.replace(unicode_exp, python_exp)
-
-        # Ajouter la multiplication implicite (2x → 2*x)
-        equation_str = _add_implicit_multiplication(equation_str)
-
-        # Définir les symboles
-        x, y, z, t = symbols('x y z t')
-        a, b, c, n = symbols('a b c n')
+        equation_str = _equation_text(query)
 
         try:
             # Parser l'équation
             if '=' in equation_str:
+                # Un seul parse (et une seule entrée de cache) pour lhs - rhs
                 lhs, rhs = equation_str.split('=', 1)
-                equation = sp.sympify(lhs.strip()) - sp.sympify(rhs.strip())
+                equation = _cached_parse(f"({lhs.strip()})-({rhs.strip()})")
             else:
-                equation = sp.sympify(equation_str)
+                equation = _cached_parse(equation_str)
+
+            # Polynôme sans formule close (ou demande numérique): racines LAPACK
+            roots = _numeric_polynomial_roots(equation, bool(context) and context.get("numeric", False))
+            if roots is not None:
+                return {
+                    "equation": str(equation),
+                    "solutions": roots,
+                    "method": "numerical"
+                }
 
             # Résoudre
-            solutions = solve(equation, x)
+            solutions = solve(equation, _X)
 
             return {
                 "equation": str(equation),
@@ -266,37 +798,25 @@ class MathematicsModule(BaseModule):
 
     def _compute_derivative(self, query: str, context: Optional[Dict] = None) -> Dict[str, Any]:
         """Calcule des dérivées"""
-        x = symbols('x')
-
         # Extraire la fonction - chercher après "of" ou "de"
-        func_match = re.search(r'(?:of|de)\s+(.+)', query, re.IGNORECASE)
+        func_match = _RE_DERIVATIVE_FUNC.search(query)
         if func_match:
             func_str = func_match.group(1).strip()
         else:
             # Retirer les mots-clés courants
-            func_str = query
-            keywords = [
-                r'calculer\s+(?:la\s+)?dérivée\s+', r'calculate\s+(?:the\s+)?derivative\s+',
-                r'dérivée\s+', r'derivative\s+', r'dériver\s+', r'differentiate\s+',
-                r'd/dx\s+', r"d'?\s*"
-            ]
-            for kw in keywords:
-                func_str = re.sub(kw, '', func_str, flags=re.IGNORECASE)
-            func_str = func_str.strip()
+            func_str = _RE_DERIVATIVE_KEYWORDS.sub('', query).strip()
 
         # Convertir les exposants unicode en notation Python
-        unicode_superscripts = {
-            '²': '**2', '³': '**3', '⁴': '**4', '⁵': '**5',
-            '⁶': '**6', '⁷': '**7', '⁸': '**8', '⁹': '**9'
-        }
-        for unicode_exp, python_exp in unicode_superscripts.items():
-            func_str = func_str.replace(unicode_exp, python_exp)
+        func_str = func_str.translate(_SUPERSCRIPTS)
 
         try:
-            function = sp.sympify(func_str)
-            derivative = diff(function, x)
+            function = _cached_parse(func_str)
+            derivative = _cached_diff(function, _X)
             # Ne pas simplifier automatiquement - garder la forme développée
-            derivative_expanded = sp.expand(derivative)
+            if _wants_full_simplify(context):
+                derivative_expanded = simplify(derivative)
+            else:
+                derivative_expanded = sp.expand(derivative)
 
             return {
                 "function": str(function),
@@ -307,72 +827,62 @@ class MathematicsModule(BaseModule):
 
     def _compute_integral(self, query: str, context: Optional[Dict] = None) -> Dict[str, Any]:
         """Calcule des intégrales"""
-        x = symbols('x')
-
-        # Extraire la fonction - chercher après "of" ou "de"
-        func_match = re.search(r'(?:of|de)\s+(.+?)(?:\s+from|\s+de\s+|$)', query, re.IGNORECASE)
+        # Extraire la fonction (et les bornes qui la suivent) après "of" ou "de"
+        func_match = _RE_INTEGRAL.search(query)
         if func_match:
-            func_str = func_match.group(1).strip()
+            func_str = func_match.group('func').strip()
         else:
             # Retirer les mots-clés courants
-            func_str = query
-            keywords = [
-                r'calculer\s+(?:l\')?intégrale\s+', r'calculate\s+(?:the\s+)?integral\s+',
-                r'intégrale\s+', r'integral\s+', r'intégrer\s+', r'integrate\s+',
-                r'∫\s*'
-            ]
-            for kw in keywords:
-                func_str = re.sub(kw, '', func_str, flags=re.IGNORECASE)
+            func_str = _RE_INTEGRAL_KEYWORDS.sub('', query)
 
             # Retirer les bornes si présentes
-            func_str = re.sub(r'\s+(?:from|de)\s+.+', '', func_str, flags=re.IGNORECASE)
+            func_str = _RE_BOUNDS_TAIL.sub('', func_str)
             func_str = func_str.strip()
 
         # Convertir les exposants unicode en notation Python
-        unicode_superscripts = {
-            '²': '**2', '³': '**3', '⁴': '**4', '⁵': '**5',
-            '⁶': '**6', '⁷': '**7', '⁸': '**8', '⁹': '**9'
-        }
-        for unicode_exp, python_exp in unicode_superscripts.items():
-            func_str = func_str.replace(unicode_exp, python_exp)
+        func_str = func_str.translate(_SUPERSCRIPTS)
 
-        # Chercher des bornes (from X to Y, de X à Y)
-        bounds_match = re.search(r'(?:from|de)\s+(\S+)\s+(?:to|à)\s+(\S+)', query, re.IGNORECASE)
+        # Bornes (from X to Y, de X à Y): déjà capturées si elles suivent la fonction
+        if func_match and func_match.group('lower'):
+            bounds = func_match.group('lower', 'upper')
+        else:
+            bounds_match = _RE_BOUNDS.search(query)
+            bounds = bounds_match.groups() if bounds_match else None
 
         try:
-            function = sp.sympify(func_str)
+            function = _cached_parse(func_str)
 
-            if bounds_match:
+            if bounds:
                 # Parser les bornes en reconnaissant 'e' comme la constante E
-                lower_str = bounds_match.group(1)
-                upper_str = bounds_match.group(2)
+                lower_str, upper_str = bounds
 
                 # Remplacer 'e' par la constante E de SymPy
-                lower = E if lower_str.lower() == 'e' else sp.sympify(lower_str)
-                upper = E if upper_str.lower() == 'e' else sp.sympify(upper_str)
+                lower = E if lower_str.lower() == 'e' else _cached_parse(lower_str)
+                upper = E if upper_str.lower() == 'e' else _cached_parse(upper_str)
 
-                integral_result = integrate(function, (x, lower, upper))
+                integral_result = _cached_integrate(function, (_X, lower, upper))
                 integral_type = "definite"
 
                 # Pour les intégrales définies, essayer d'évaluer numériquement
                 try:
-                    # Simplifier d'abord
-                    integral_result = sp.simplify(integral_result)
-                    # Essayer d'évaluer numériquement si possible
                     if integral_result.is_number:
-                        numerical_value = float(integral_result.evalf())
-                        integral_str = str(integral_result)
+                        # Valeur numérique sur l'intégrale brute: la normalisation
+                        # ne sert qu'à l'affichage de la forme exacte
+                        numerical_value = _to_float(integral_result)
                         # Si c'est un entier simple, afficher aussi la valeur
                         if abs(numerical_value - round(numerical_value)) < 1e-10:
                             integral_str = f"{int(round(numerical_value))}"
                         else:
-                            integral_str = f"{integral_result} ≈ {numerical_value:.6f}"
+                            # Normaliser (simplify() complet seulement sur demande)
+                            exact = _canonicalize(integral_result, _wants_full_simplify(context))
+                            integral_str = f"{exact} ≈ {numerical_value:.6f}"
                     else:
+                        integral_result = _canonicalize(integral_result, _wants_full_simplify(context))
                         integral_str = str(integral_result)
                 except:
                     integral_str = str(integral_result)
             else:
-                integral_result = integrate(function, x)
+                integral_result = _cached_integrate(function, _X)
                 integral_type = "indefinite"
                 integral_str = str(integral_result)
 
@@ -386,19 +896,16 @@ class MathematicsModule(BaseModule):
 
     def _solve_differential_equation(self, query: str, context: Optional[Dict] = None) -> Dict[str, Any]:
         """Résout des équations différentielles"""
-        x = symbols('x')
-        y = sp.Function('y')
-
         try:
             # Pour l'instant, un exemple simple
             # Dans une vraie implémentation, parser l'équation différentielle
-            eq = sp.Eq(y(x).diff(x), y(x))
-            solution = sp.dsolve(eq, y(x))
+            eq, solution = _dsolve_example()
 
+            solution_str = str(solution)
             return {
                 "equation": str(eq),
-                "solution": str(solution),
-                "symbolic": solution
+                "solution": solution_str,
+                "symbolic": solution_str
             }
         except Exception as e:
             return {"error": str(e)}
@@ -409,6 +916,13 @@ class MathematicsModule(BaseModule):
             # Si contexte contient une matrice
             if context and "matrix" in context:
                 mat_data = context["matrix"]
+
+                # Matrices numériques décimales ou grandes: LAPACK plutôt que
+                # le polynôme caractéristique symbolique
+                array = _numeric_matrix(mat_data, context.get("numeric", False))
+                if array is not None:
+                    return _numeric_matrix_report(array)
+
                 matrix = Matrix(mat_data)
 
                 results = {
@@ -431,102 +945,93 @@ class MathematicsModule(BaseModule):
 
     def _compute_limit(self, query: str, context: Optional[Dict] = None) -> Dict[str, Any]:
         """Calcule des limites"""
-        x = symbols('x')
-
         try:
             # Parser la fonction et le point
-            func_match = re.search(r'of\s+(.+?)\s+as|de\s+(.+?)\s+quand', query, re.IGNORECASE)
+            func_match = _RE_LIMIT_FUNC.search(query)
             if func_match:
                 func_str = func_match.group(1) or func_match.group(2)
             else:
                 func_str = "x"
 
-            function = sp.sympify(func_str)
+            function = _cached_parse(func_str)
 
             # Extraire le point limite
-            point_match = re.search(r'x\s*→\s*(\S+)|x\s+tends?\s+to\s+(\S+)', query)
+            point_match = _RE_LIMIT_POINT.search(query)
             if point_match:
                 point_str = point_match.group(1) or point_match.group(2)
-                point = sp.sympify(point_str) if point_str != "inf" else oo
+                point = _cached_parse(point_str) if point_str != "inf" else oo
             else:
                 point = 0
 
-            limit_result = limit(function, x, point)
+            limit_result = _cached_limit(function, _X, point)
 
+            limit_str = str(limit_result)
             return {
                 "function": str(function),
                 "point": str(point),
-                "limit": str(limit_result),
-                "symbolic": limit_result
+                "limit": limit_str,
+                "symbolic": limit_str
             }
         except Exception as e:
             return {"error": str(e)}
 
     def _compute_series(self, query: str, context: Optional[Dict] = None) -> Dict[str, Any]:
         """Calcule des développements en série"""
-        x = symbols('x')
-
         try:
             # Extraire fonction et ordre
             order = 6  # Par défaut
-            order_match = re.search(r'order\s+(\d+)|ordre\s+(\d+)', query)
+            order_match = _RE_ORDER.search(query)
             if order_match:
                 order = int(order_match.group(1) or order_match.group(2))
 
-            func_match = re.search(r'of\s+(.+?)(?:\s+order|$)', query, re.IGNORECASE)
+            func_match = _RE_SERIES_FUNC.search(query)
             if func_match:
                 func_str = func_match.group(1).strip()
             else:
                 func_str = "exp(x)"
 
-            function = sp.sympify(func_str)
-            series_expansion = series(function, x, 0, order)
+            function = _cached_parse(func_str)
+            series_expansion = _cached_series(function, _X, 0, order)
 
+            series_str = str(series_expansion)
             return {
                 "function": str(function),
-                "series": str(series_expansion),
+                "series": series_str,
                 "order": order,
-                "symbolic": series_expansion
+                "symbolic": series_str
             }
         except Exception as e:
             return {"error": str(e)}
 
     def _optimize_function(self, query: str, context: Optional[Dict] = None) -> Dict[str, Any]:
         """Optimise une fonction"""
-        x = symbols('x')
-
         try:
             # Extraire la fonction
-            func_match = re.search(r'function\s+(.+)|fonction\s+(.+)', query, re.IGNORECASE)
+            func_match = _RE_OPT_FUNC.search(query)
             if func_match:
                 func_str = func_match.group(1) or func_match.group(2)
             else:
                 return {"error": "No function specified"}
 
-            function = sp.sympify(func_str)
+            function = _cached_parse(func_str)
 
             # Trouver les points critiques
-            derivative = diff(function, x)
-            critical_points = solve(derivative, x)
-
-            # Évaluer aux points critiques
+            derivative = _cached_diff(function, _X)
+            critical_points = solve(derivative, _X)
+
+            # Évaluer aux points critiques (dérivée seconde calculée une fois)
+            second_deriv_expr = _cached_diff(derivative, _X)
+            second_deriv_func = _x_function(second_deriv_expr)
+            approx = [_float_at(second_deriv_func, point) for point in critical_points]
+            scale = max((abs(v) for v in approx if v is not None), default=0.0)
             results = []
-            for point in critical_points:
-                value = function.subs(x, point)
-                second_deriv = diff(derivative, x).subs(x, point)
-
-                point_type = "unknown"
-                if second_deriv > 0:
-                    point_type = "minimum"
-                elif second_deriv < 0:
-                    point_type = "maximum"
-                else:
-                    point_type = "inflection"
+            for point, second_deriv in zip(critical_points, approx):
+                value = function.xreplace({_X: point})
 
                 results.append({
                     "point": str(point),
                     "value": str(value),
-                    "type": point_type
+                    "type": _critical_point_type(second_deriv_expr, point, second_deriv, max(1.0, scale))
                 })
 
             return {
@@ -541,14 +1046,43 @@ class MathematicsModule(BaseModule):
         """Calculs numériques"""
         try:
             # Évaluer numériquement une expression
-            expr_match = re.search(r'compute\s+(.+)|calculate\s+(.+)|calculer\s+(.+)', query, re.IGNORECASE)
+            expr_match = _RE_NUM_EXPR.search(query)
             if expr_match:
                 expr_str = expr_match.group(1) or expr_match.group(2) or expr_match.group(3)
             else:
                 expr_str = query
 
-            expr = sp.sympify(expr_str)
-            numerical_result = float(expr.evalf())
+            expr = _cached_parse(expr_str)
+
+            # Points d'évaluation fournis: évaluation vectorisée compilée
+            values = (context or {}).get("values")
+            if values and expr.free_symbols:
+                names, func = _scalar_function(expr)
+                missing = [name for name in names if name not in values]
+                if missing:
+                    return {"error": f"Valeurs manquantes pour: {', '.join(missing)}"}
+                args = [np.asarray(values[name], dtype=np.float64) for name in names]
+                result = None
+                if not any(arg.ndim for arg in args):
+                    # Un seul point: appel direct de la fonction math
+                    try:
+                        result = float(func(*(float(arg) for arg in args)))
+                    except (TypeError, ValueError, OverflowError, ZeroDivisionError):
+                        pass
+                if result is None:
+                    # Ufuncs numpy sur les petits tableaux: la compilation JIT
+                    # et le lancement des threads ne paient qu'à grande taille
+                    jit = self.use_jit and max(arg.size for arg in args) >= _JIT_MIN_SIZE
+                    _, kernel = _numeric_kernel(expr, jit)
+                    result = np.asarray(kernel(*args)).tolist()
+                return {
+                    "expression": str(expr),
+                    "result": result,
+                    "variables": list(names),
+                    "method": "numerical"
+                }
+
+            numerical_result = _to_float(expr)
 
             return {
                 "expression": str(expr),
@@ -561,46 +1095,35 @@ class MathematicsModule(BaseModule):
     def _symbolic_computation(self, query: str, context: Optional[Dict] = None) -> Dict[str, Any]:
         """Calculs symboliques généraux"""
         try:
-            # Simplifier ou manipuler une expression
-            expr = sp.sympify(query)
-            simplified = simplify(expr)
+            # Simplifier ou manipuler une expression (requête brute: pas de
+            # multiplication implicite, "hello world" n'est pas h*e*l**3*...)
+            expr = _cached_parse(query, implicit=False)
+            if expr.is_Atom:
+                # Symbole ou nombre: déjà sous forme simplifiée
+                simplified = expr
+            else:
+                # simplify() complet sur les petites expressions seulement
+                full = _wants_full_simplify(context) or expr.count_ops() <= _SIMPLIFY_MAX_OPS
+                simplified = _cached_canonicalize(expr, full)
 
+            simplified_str = str(simplified)
             return {
                 "expression": str(expr),
-                "simplified": str(simplified),
-                "symbolic": simplified
+                "simplified": simplified_str,
+                "symbolic": simplified_str
             }
         except Exception as e:
             return {"error": str(e)}
 
     def validate_result(self, result: Any, original_query: str) -> Dict[str, Any]:
         """Valide un résultat mathématique"""
-        try:
-            # Vérifications basiques
-            is_valid = True
-            errors = []
-            confidence = 0.9
-
-            if isinstance(result, dict):
-                if "error" in result:
-                    is_valid = False
-                    errors.append(result["error"])
-                    confidence = 0.0
-                elif "result" in result or "solutions" in result:
-                    # Résultat semble valide
-                    is_valid = True
-                    confidence = 0.95
-
-            return {
-                "is_valid": is_valid,
-                "confidence": confidence,
-                "errors": errors,
-                "validation_method": "structural"
-            }
-
-        except Exception as e:
-            return {
-                "is_valid": False,
-                "confidence": 0.0,
-                "errors": [str(e)]
-            }
+        is_dict = isinstance(result, dict)
+        has_error = is_dict and "error" in result
+        has_result = is_dict and not _RESULT_KEYS.isdisjoint(result)
+
+        return {
+            "is_valid": not has_error,
+            "confidence": 0.0 if has_error else (0.95 if has_result else 0.9),
+            "errors": [result["error"]] if has_error else [],
+            "validation_method": "structural"
+        }
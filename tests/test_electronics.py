@@ -0,0 +1,78 @@
+"""
+Tests pour le module électronique de Nyx
+"""
+
+import json
+import math
+import sys
+from pathlib import Path
+
+# Ajouter le répertoire parent au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from modules.scientific import ElectronicsModule
+
+
+def test_ideal_lc_circuit_has_infinite_quality_factor():
+    """Un circuit LC idéal (R = 0) n'est pas une erreur: Q infini, ζ nul"""
+    response = ElectronicsModule().execute(
+        "RLC", {"resistance": 0, "inductance": 0.01, "capacitance": 1e-6}
+    )
+    assert response["success"]
+    result = response["result"]
+    assert result["quality_factor"] == math.inf
+    assert result["damping_ratio"] == 0
+    assert result["resonance_frequency"] > 0
+
+
+def test_non_positive_reactive_components_are_rejected():
+    """L ou C non positifs donnent un message d'erreur explicite"""
+    module = ElectronicsModule()
+    for L, C in ((-0.01, 1e-6), (0.01, 0)):
+        response = module.execute("RLC", {"resistance": 10, "inductance": L, "capacitance": C})
+        assert "positive" in response["result"]["error"]
+
+
+def test_invalid_batch_components_are_rejected():
+    """Le balayage RLC rejette L, C non positifs et R négatif au lieu de colonnes NaN"""
+    module = ElectronicsModule()
+    for R, L, C in (([10, 100], 0.01, [1e-6, -1]), (10, [0.01, 0], 1e-6), ([-1, 10], 0.01, 1e-6)):
+        batch = module._rlc_circuit_batch(R, L, C)
+        assert not batch["success"]
+        response = module.execute("RLC", {"resistance": R, "inductance": L, "capacitance": C})
+        assert "positive" in response["result"]["error"]
+
+    ideal = module._rlc_circuit_batch([0.0, 10.0], 0.01, 1e-6)
+    assert ideal["quality_factor"][0] == math.inf
+
+
+def test_results_are_not_shared_between_calls():
+    """Modifier un résultat renvoyé n'altère pas les appels suivants; 1 et 1.0 restent distincts"""
+    module = ElectronicsModule()
+    first = module.execute("RC circuit", {"resistance": 1.0, "capacitance": 1e-6})
+    first["result"]["x"] = 1
+
+    second = module.execute("RC circuit", {"resistance": 1, "capacitance": 1e-6})
+    assert "x" not in second["result"]
+    assert type(second["result"]["resistance"]) is int
+
+
+def test_formula_tables_are_copied_into_results():
+    """Les tables de formules partagées ne sont jamais livrées par référence"""
+    module = ElectronicsModule()
+    scalar = module.execute("RLC", {"resistance": 10, "inductance": 0.01, "capacitance": 1e-6})
+    batch = module.execute("RLC", {"resistance": [10, 20], "inductance": 0.01, "capacitance": 1e-6})
+    for response in (scalar, batch):
+        response["result"]["formulas"]["Q"] = "?"
+
+    again = module.execute("RLC", {"resistance": [10, 20], "inductance": 0.01, "capacitance": 1e-6})
+    assert again["result"]["formulas"]["Q"] == "Q = ω₀L/R"
+    json.dumps(again["result"], ensure_ascii=False)
+
+
+def test_metadata_is_per_instance():
+    """Les métadonnées d'une instance ne fuient pas vers les autres"""
+    first, second = ElectronicsModule(), ElectronicsModule()
+    first.metadata["x"] = 1
+    assert "x" not in second.metadata
+    assert "x" not in ElectronicsModule.METADATA
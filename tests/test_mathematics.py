@@ -0,0 +1,136 @@
+"""
+Tests pour le module mathématiques de Nyx
+"""
+
+import sys
+from pathlib import Path
+
+# Ajouter le répertoire parent au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+import sympy as sp
+
+from modules.scientific import MathematicsModule
+from modules.scientific import mathematics
+
+
+def _point_types(function: str) -> dict:
+    """Nature de chaque point critique, indexée par le point"""
+    response = MathematicsModule().execute(f"optimize function {function}")
+    assert response["success"]
+    return {p["point"]: p["type"] for p in response["result"]["critical_points"]}
+
+
+def test_exact_zero_second_derivative_is_inflection():
+    """f'' nulle en un point irrationnel: pas de min/max sur du bruit flottant"""
+    assert _point_types("(x - pi/3)**3") == {"pi/3": "inflection"}
+    assert _point_types("(x**2-2)**3") == {
+        "0": "minimum", "-sqrt(2)": "inflection", "sqrt(2)": "inflection"
+    }
+
+
+def test_critical_points_keep_their_nature():
+    """Minimums et maximums usuels"""
+    assert _point_types("x**3 - 3*x") == {"-1": "maximum", "1": "minimum"}
+    assert _point_types("sin(x)") == {"pi/2": "maximum", "3*pi/2": "minimum"}
+
+
+def test_complex_infinity_is_an_error():
+    """1/0, log(0), tan(pi/2): infini complexe, pas de succès avec nan"""
+    module = MathematicsModule()
+    for expr in ("1/0", "log(0)", "tan(pi/2)"):
+        result = module.execute(f"numerical compute {expr}")["result"]
+        assert "error" in result, expr
+
+    assert module.execute("numerical compute sqrt(2)")["result"]["result"] == 2 ** 0.5
+
+
+def test_kernel_file_is_verified_before_execution(tmp_path, monkeypatch):
+    """Un fichier de noyau altéré est réécrit, jamais exécuté; sys.modules est nettoyé"""
+    monkeypatch.setattr(mathematics, "_KERNEL_CACHE_DIR", tmp_path)
+    x, y = sp.symbols("x y")
+    expr = sp.sin(x) * y
+
+    kernel = mathematics._file_backed_lambdify((x, y), expr)
+    mathematics._release_kernel_module(kernel)
+    (path,) = tmp_path.glob("nyx_kernel_*.py")
+    path.write_text("raise RuntimeError('tampered')\n", encoding="utf-8")
+
+    kernel = mathematics._file_backed_lambdify((x, y), expr)
+    assert kernel(1.0, 2.0) == np.sin(1.0) * 2.0
+    assert "tampered" not in path.read_text(encoding="utf-8")
+    mathematics._release_kernel_module(kernel)
+    assert kernel.__module__ not in sys.modules
+
+
+def test_glued_function_names_are_not_split():
+    """"sinx" est sin(x), pas s*i*n*x; la multiplication implicite reste active"""
+    module = MathematicsModule()
+    cases = {
+        "sinx": ("sin(x)", "cos(x)"),
+        "2xsin(x)": ("2*x*sin(x)", "2*x*cos(x) + 2*sin(x)"),
+        "3x^2+2x": ("3*x**2 + 2*x", "6*x + 2"),
+    }
+    for expr, (function, derivative) in cases.items():
+        result = module.execute(f"derivative of {expr}")["result"]
+        assert result == {"function": function, "derivative": derivative}, expr
+
+
+def test_numeric_roots_are_rounded_sorted_and_sympy_formatted():
+    """Racines LAPACK au format a + b*I, arrondies, réelles d'abord puis triées"""
+    result = MathematicsModule().execute("solve x**5 - x - 1 = 0")["result"]
+    assert result["method"] == "numerical"
+    assert result["solutions"] == [
+        "1.16730397826",
+        "-0.764884433601 - 0.352471546032*I", "-0.764884433601 + 0.352471546032*I",
+        "0.18123244447 - 1.08395410132*I", "0.18123244447 + 1.08395410132*I",
+    ]
+
+
+def test_factorable_high_degree_keeps_exact_roots():
+    """x**6 - 1 se factorise en degrés ≤ 2: racines exactes par solve()"""
+    result = MathematicsModule().execute("solve x**6 - 1 = 0")["result"]
+    assert result["method"] == "symbolic"
+    assert "-1/2 + sqrt(3)*I/2" in result["solutions"]
+
+
+def test_numeric_context_forces_lapack():
+    """context["numeric"]: racines et valeurs propres numériques"""
+    module = MathematicsModule()
+    roots = module.execute("solve x**2 - 2 = 0", {"numeric": True})["result"]
+    assert roots["solutions"] == ["-1.41421356237", "1.41421356237"]
+
+    matrix = module.execute("matrix", {"matrix": [[2, 1], [1, 2]], "numeric": True})["result"]
+    assert matrix["eigenvalues"] == {"3.0": 1, "1.0": 1}
+    assert float(matrix["determinant"]) == 3.0
+
+
+def test_values_context_evaluates_points_and_arrays():
+    """context["values"]: un point (float) ou un tableau (liste)"""
+    module = MathematicsModule()
+    point = module.execute("numerical compute x*y + 1", {"values": {"x": 1.5, "y": 2}})["result"]
+    array = module.execute("numerical compute x*y + 1", {"values": {"x": [1, 2, 3], "y": 2}})["result"]
+    missing = module.execute("numerical compute x*y + 1", {"values": {"x": 1.5}})["result"]
+
+    assert point["result"] == 4.0
+    np.testing.assert_allclose(array["result"], [3.0, 5.0, 7.0])
+    assert "y" in missing["error"]
+
+
+def test_full_simplify_context():
+    """context["simplify"] == "full" applique simplify() à la dérivée"""
+    module = MathematicsModule()
+    query = "derivative of (x**2-1)/(x-1)"
+    assert module.execute(query, {"simplify": "full"})["result"]["derivative"] == "1"
+    assert module.execute(query)["result"]["derivative"] != "1"
+
+
+def test_free_text_is_not_parsed_as_a_product():
+    """Le repli symbolique ne transforme pas du texte en produit de lettres"""
+    module = MathematicsModule()
+    result = module.execute("hello world")["result"]
+    assert "error" in result
+    assert not module.validate_result(result, "hello world")["is_valid"]
+
+    assert module.execute("sin(x)**2 + cos(x)**2")["result"]["simplified"] == "1"
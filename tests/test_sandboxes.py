@@ -0,0 +1,170 @@
+"""
+Tests pour les sandboxes interactifs de Nyx
+"""
+
+import base64
+import sys
+from pathlib import Path
+
+# Ajouter le répertoire parent au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+
+from modules.sandboxes import ElectronicsSandbox, MathSandbox, PhysicsSandbox
+from modules.sandboxes.math_sandbox import _compile
+from modules.sandboxes.physics_sandbox import _pendulum_rk4, _pendulum_rk4_into
+
+
+def test_rc_batch_matches_scalar():
+    """Le lot RC doit reproduire chaque simulation scalaire"""
+    sandbox = ElectronicsSandbox()
+    R = np.array([100.0, 1000.0, 4700.0])
+    C = np.array([1e-6, 1e-6, 2.2e-7])
+
+    batch = sandbox.simulate_rc_circuit_batch(R, C, voltage=5.0)
+    assert batch["success"]
+
+    for i in range(len(R)):
+        single = sandbox.simulate_rc_circuit(float(R[i]), float(C[i]), 5.0)
+        for key in ("time", "voltage_capacitor", "current", "energy", "power"):
+            np.testing.assert_allclose(batch["data"][key][i], single["data"][key], rtol=1e-12)
+
+
+def test_rlc_batch_matches_scalar():
+    """Le lot RLC doit couvrir les trois régimes d'amortissement"""
+    sandbox = ElectronicsSandbox()
+    # sous-amorti, critique, sur-amorti
+    R = np.array([10.0, 200.0, 2000.0])
+    L, C = 0.01, 1e-6
+
+    batch = sandbox.simulate_rlc_circuit_batch(R, L, C, voltage=10.0)
+    assert batch["success"]
+    assert batch["analysis"]["regime"] == ["sous-amorti", "critique", "sur-amorti"]
+
+    for i in range(len(R)):
+        single = sandbox.simulate_rlc_circuit(float(R[i]), L, C, 10.0)
+        for key in ("time", "charge", "current", "voltage_capacitor", "energy_total"):
+            np.testing.assert_allclose(batch["data"][key][i], single["data"][key],
+                                       rtol=1e-6, atol=1e-9)
+
+
+def test_invalid_components_are_rejected():
+    """Les valeurs non physiques sont rejetées sans lever d'exception"""
+    sandbox = ElectronicsSandbox()
+    assert not sandbox.simulate_rc_circuit(0, 1e-6)["success"]
+    assert not sandbox.simulate_rl_circuit(100, 0)["success"]
+    assert not sandbox.simulate_rlc_circuit(10, 0.01, 0)["success"]
+    assert not sandbox.simulate_rc_circuit_batch([100, -1], 1e-6)["success"]
+    assert not sandbox.analyze_voltage_divider(1000, 1000, 0)["success"]
+
+
+def test_math_compile_cache_shared_across_plots():
+    """Re-tracer la même fonction réutilise l'expression compilée"""
+    sandbox = MathSandbox()
+    _compile.cache_clear()
+
+    first = sandbox.plot_function_2d("sin(x)")
+    second = sandbox.plot_function_2d("sin(x)", x_min=-1, x_max=1)
+    assert first["success"] and second["success"]
+    assert _compile.cache_info().hits >= 1
+
+
+def test_polynomial_plot_uses_horner_evaluation():
+    """Les polynômes (constantes comprises) sont évalués par polyval"""
+    sandbox = MathSandbox()
+    result = sandbox.plot_function_2d("x**3 - 3*x", x_min=-2, x_max=2, num_points=5)
+    assert result["success"]
+    np.testing.assert_allclose(result["data"]["y"], [-2.0, 2.0, 0.0, -2.0, 2.0])
+
+    constant = sandbox.plot_function_2d("5", num_points=3)
+    assert constant["success"]
+    np.testing.assert_allclose(constant["data"]["y"], [5.0, 5.0, 5.0])
+
+
+def test_surface_is_emitted_as_float32_buffer():
+    """La surface 3D est transmise en buffer float32 base64"""
+    result = MathSandbox().plot_function_3d("x*y", num_points=4)
+    assert result["success"]
+
+    data = result["data"]
+    z = np.frombuffer(base64.b64decode(data["z_buf"]), dtype="<f4").reshape(data["shape"])
+    expected = np.outer(data["y"], data["x"])
+    np.testing.assert_allclose(z, expected, rtol=1e-6)
+
+
+def test_streamed_animation_matches_batch():
+    """Le flux de frames reproduit l'animation matérialisée"""
+    sandbox = MathSandbox()
+    batch = sandbox.animate_function("a*sin(x)", param_values=[0.5, 1.0, 2.0])
+    header, *frames = sandbox.stream_animation("a*sin(x)", param_values=[0.5, 1.0, 2.0])
+
+    assert header["metadata"]["num_frames"] == 3
+    np.testing.assert_allclose(header["data"]["x"], batch["data"]["x"])
+    for streamed, frame in zip(frames, batch["data"]["frames"]):
+        assert streamed["parameter_value"] == frame["parameter_value"]
+        np.testing.assert_allclose(streamed["y"], frame["y"])
+
+
+def test_projectile_matches_closed_form():
+    """La trajectoire du projectile suit les formules analytiques"""
+    result = PhysicsSandbox().create_projectile_simulation(20.0, 45.0)
+    assert result["success"]
+
+    g = 9.81
+    analysis = result["analysis"]
+    assert abs(analysis["max_height"] - 20.0**2 / (4 * g)) < 1e-3
+    assert abs(analysis["range"] - 20.0**2 / g) < 0.2
+    assert abs(analysis["flight_time"] - 2 * 20.0 * np.sin(np.pi / 4) / g) < 0.02
+    assert min(result["data"]["y"]) >= 0
+
+
+def test_pendulum_rk4_conserves_energy():
+    """Sans amortissement, RK4 conserve l'énergie avec un pas plus grand qu'Euler"""
+    sandbox = PhysicsSandbox()
+    rk4 = sandbox.create_pendulum_simulation(1.0, 45.0)
+    euler = sandbox.create_pendulum_simulation(1.0, 45.0, integrator="euler")
+    assert rk4["success"] and euler["success"]
+    assert len(rk4["data"]["time"]) < len(euler["data"]["time"])
+
+    drift = lambda r: np.ptp(r["data"]["energy"]["total"])
+    assert drift(rk4) < drift(euler) / 10
+
+
+def test_collision_kernel_matches_numpy_loop():
+    """La boucle compilée et le repli NumPy donnent les mêmes frames"""
+    objects = [
+        {"x": 2, "y": 5, "vx": 2, "vy": 0, "mass": 1.0, "radius": 0.5},
+        {"x": 8, "y": 5, "vx": -2, "vy": 0, "mass": 2.0, "radius": 0.5},
+        {"x": 5, "y": 1, "radius": 0.8, "is_static": True},
+    ]
+    jit = PhysicsSandbox().create_collision_simulation(objects, precision="fp64")
+    ref = PhysicsSandbox(use_jit=False).create_collision_simulation(objects, precision="fp64")
+    assert jit["success"] and ref["success"]
+
+    assert np.shape(jit["data"]["x"]) == (len(jit["data"]["time"]), len(objects))
+    for key in ("x", "y", "vx", "vy"):
+        np.testing.assert_allclose(jit["data"][key], ref["data"][key], atol=1e-6)
+
+
+def test_pendulum_batch_matches_scalar():
+    """Le lot de pendules reproduit chaque simulation scalaire"""
+    sandbox = PhysicsSandbox()
+    lengths, angles = [0.5, 1.0, 2.0], [10.0, 45.0, 90.0]
+
+    batch = sandbox.create_pendulum_simulation_batch(lengths, angles, damping=0.1)
+    assert batch["success"]
+
+    for i in range(len(lengths)):
+        single = sandbox.create_pendulum_simulation(lengths[i], angles[i], damping=0.1)
+        np.testing.assert_allclose(batch["data"]["angle"][i], single["data"]["angle"], rtol=1e-6)
+
+
+def test_pendulum_kernel_writes_into_buffers():
+    """Le noyau RK4 remplit les tableaux fournis comme la version qui alloue"""
+    theta, omega = np.full(50, np.nan), np.full(50, np.nan)
+    _pendulum_rk4_into(0.5, 0.0, 9.81, 1.0, 0.1, 0.05, theta, omega)
+
+    ref_theta, ref_omega = _pendulum_rk4(0.5, 0.0, 9.81, 1.0, 0.1, 0.05, 50)
+    np.testing.assert_array_equal(theta, ref_theta)
+    np.testing.assert_array_equal(omega, ref_omega)